@@ -9,9 +9,9 @@ The Bass section provides statistical rigor: descriptive stats, hypothesis tests
 calibration, and drift checks. It underpins decisions with measurement.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 import math
-from orchestrAIframework.common.logging import log_message
+from orchestrAIframework.common.logging import log_enabled, log_message
 
 
 class Bass:
@@ -19,31 +19,48 @@ class Bass:
     Base class for statistics & measurement.
 
     Capabilities (extensible):
-      - describe: quick EDA stats
-      - ttest: simple two-sample (unequal var) t-test (placeholder)
-      - calibrate: stub for probability calibration hooks
-      - drift_score: simple PSI-like score (stub)
+      - describe: quick EDA stats (streaming & mergeable, see bass/stats.py)
+      - ttest / ttest_batch: two-sample (unequal var) Welch t-tests with p-values
+      - calibrate: fitted isotonic / Platt probability calibration
+      - drift_score: Population Stability Index with cached reference bins
     """
 
     def __init__(self, name: str = "Bass"):
         self.name = name
+        self.calibrator: Optional[Any] = None
+        self._references: Optional[Any] = None  # ReferenceCache, built on first drift check
         log_message("info", f"[Bass] Initialized section: {self.name}")
 
-    # --- Descriptive statistics (placeholder but useful) ---
-    def describe(self, values: List[float]) -> Dict[str, float]:
-        if not values:
+    # --- Descriptive statistics (single-pass, mergeable) ---
+    def describe(self, values: Iterable[float]) -> Dict[str, float]:
+        """
+        Count/mean/std/min/max of a list, NumPy array or any iterable, in one pass.
+        Use ``describe_stream`` for data that arrives in chunks.
+        """
+        from orchestrAIframework.bass.stats import RunningStats
+
+        stats = RunningStats.from_values(values).to_dict()
+        if stats["count"] == 0:
             log_message("warning", "[Bass] describe() received empty values.")
-            return {"count": 0, "mean": math.nan, "std": math.nan, "min": math.nan, "max": math.nan}
-
-        n = len(values)
-        mean = sum(values) / n
-        var = sum((v - mean) ** 2 for v in values) / (n - 1) if n > 1 else 0.0
-        std = math.sqrt(var)
-        stats = {"count": n, "mean": mean, "std": std, "min": min(values), "max": max(values)}
-        log_message("info", f"[Bass] describe() -> {stats}")
+            return stats
+        if log_enabled("info"):
+            log_message("info", f"[Bass] describe() -> {stats}")
+        return stats
+
+    def describe_stream(self, chunks: Iterable[Iterable[float]], stats: Optional[Any] = None) -> Any:
+        """
+        Fold a stream of chunks into a RunningStats accumulator (pass ``stats`` to
+        continue an earlier one). Accumulators from different shards combine with
+        ``merge``; ``to_dict()`` gives the same dict as ``describe``.
+        """
+        from orchestrAIframework.bass.stats import describe_stream
+
+        stats = describe_stream(chunks, stats)
+        if log_enabled("info"):
+            log_message("info", f"[Bass] describe_stream() -> {stats.to_dict()}")
         return stats
 
-    # --- Simple Welch's t-test (placeholder) ---
+    # --- Welch's t-test ---
     def ttest(self, a: List[float], b: List[float]) -> Dict[str, Any]:
         if len(a) < 2 or len(b) < 2:
             log_message("warning", "[Bass] ttest() needs at least 2 samples per group.")
@@ -62,27 +79,130 @@ class Bass:
         den = (var_a ** 2) / ((len(a) ** 2) * (len(a) - 1)) + (var_b ** 2) / ((len(b) ** 2) * (len(b) - 1))
         df = num / den if den != 0 else math.nan
 
-        # p-value placeholder (two-tailed); real impl would use scipy.stats
-        p_value = math.nan
+        # Two-tailed p-value from the in-project Student-t CDF (bass/hypothesis.py)
+        from orchestrAIframework.bass.hypothesis import t_two_sided_pvalue
+
+        p_value = float(t_two_sided_pvalue(t, df))
         result = {"t": t, "df": df, "p_value": p_value}
-        log_message("info", f"[Bass] ttest() -> {result}")
+        if log_enabled("info"):
+            log_message("info", f"[Bass] ttest() -> {result}")
         return result
 
-    # --- Calibration stub ---
-    def calibrate(self, probs: List[float]) -> List[float]:
-        log_message("info", "[Bass] calibrate() stub pass-through.")
-        return probs
+    def ttest_batch(
+        self,
+        a: Optional[Any] = None,
+        b: Optional[Any] = None,
+        stats: Optional[Dict[str, Any]] = None,
+        correction: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Welch t-tests for many metrics at once. Pass sample matrices ``a``/``b`` (one
+        metric per row, NaN-padded if ragged) or ``stats`` with per-metric arrays
+        n_a, mean_a, var_a, n_b, mean_b, var_b. Returns arrays t, df, p_value, plus
+        p_adjusted when ``correction`` is "bonferroni", "holm" or "bh".
+        """
+        from orchestrAIframework.bass.hypothesis import ttest_batch
+
+        result = ttest_batch(a, b, stats=stats, correction=correction)
+        if log_enabled("info"):
+            log_message("info", f"[Bass] ttest_batch() tested {result['t'].size} metric(s).")
+        return result
 
-    # --- Drift score stub (Population Stability Index-like) ---
-    def drift_score(self, ref: List[float], cur: List[float], bins: int = 10) -> float:
-        if not ref or not cur:
+    # --- Probability calibration ---
+    def fit_calibrator(self, probs: Any, labels: Any, method: str = "isotonic", name: Optional[str] = None) -> Any:
+        """
+        Fit an "isotonic" or "platt" calibrator (see bass/calibration.py) and use it
+        for subsequent ``calibrate`` calls. With ``name``, it is also saved under
+        ORCH_PATHS["models"]/calibrators.
+        """
+        from orchestrAIframework.bass.calibration import fit_calibrator
+
+        self.calibrator = fit_calibrator(probs, labels, method)
+        log_message("info", f"[Bass] Fitted '{method}' calibrator.")
+        if name is not None:
+            self.save_calibrator(name)
+        return self.calibrator
+
+    def save_calibrator(self, name: str) -> Any:
+        from orchestrAIframework.bass.calibration import save_calibrator
+
+        if self.calibrator is None:
+            raise RuntimeError("No calibrator fitted. Use fit_calibrator() first.")
+        path = save_calibrator(self.calibrator, name)
+        log_message("info", f"[Bass] Saved calibrator to {path}.")
+        return path
+
+    def load_calibrator(self, name: str) -> Any:
+        from orchestrAIframework.bass.calibration import load_calibrator
+
+        self.calibrator = load_calibrator(name)
+        log_message("info", f"[Bass] Loaded '{self.calibrator.method}' calibrator '{name}'.")
+        return self.calibrator
+
+    def calibrate(self, probs: Any) -> Any:
+        """
+        Apply the fitted calibrator to a batch of probabilities in one vectorized
+        lookup. Lists come back as lists, arrays as arrays; without a calibrator
+        the input is passed through unchanged.
+        """
+        if self.calibrator is None:
+            log_message("debug", "[Bass] calibrate() has no calibrator; pass-through.")
+            return probs
+        out = self.calibrator.apply(probs)
+        return out.tolist() if isinstance(probs, (list, tuple)) else out
+
+    # --- Drift score (Population Stability Index) ---
+    def drift_score(self, ref: Iterable[float], cur: Iterable[float], bins: int = 10) -> float:
+        """
+        PSI of ``cur`` against ``ref`` using ``bins`` quantile bins of the reference.
+        The reference profile is cached by identity, so scoring many windows against
+        the same ``ref`` object only bins the current data. One-shot iterables such
+        as generators are materialized first and cannot hit the cache.
+
+        NaNs are ignored. Empty inputs, or a ``cur`` that is all NaN, score NaN; a
+        ``ref`` that is all NaN raises ValueError.
+        """
+        if not hasattr(ref, "__len__") or not hasattr(cur, "__len__"):
+            import numpy as np
+
+            ref = ref if hasattr(ref, "__len__") else np.asarray(list(ref), dtype=np.float64)
+            cur = cur if hasattr(cur, "__len__") else np.asarray(list(cur), dtype=np.float64)
+        if len(ref) == 0 or len(cur) == 0:
             log_message("warning", "[Bass] drift_score() received empty lists.")
             return math.nan
-        # Simplified: returns absolute mean difference as a lightweight proxy
-        drift = abs((sum(ref) / len(ref)) - (sum(cur) / len(cur)))
-        log_message("info", f"[Bass] drift_score() -> {drift:.6f}")
+        drift = self.reference_profile(ref, bins).score(cur)
+        if log_enabled("info"):
+            log_message("info", f"[Bass] drift_score() -> {drift:.6f}")
         return drift
 
+    def drift_scores(self, ref: Any, cur: Any, bins: int = 10) -> Any:
+        """
+        Batch PSI.
+
+        - ``drift_scores({"f1": ref1, ...}, {"f1": cur1, ...})`` scores each feature
+          and returns ``{"f1": psi, ...}``.
+        - ``drift_scores(ref, windows)`` scores many windows (a 2-D array with one
+          window per row, or a list of sequences) and returns a NumPy array.
+        """
+        if isinstance(ref, Mapping):
+            missing = set(cur) - set(ref)
+            if missing:
+                raise KeyError(f"No reference for features: {sorted(missing)}")
+            scores = {feature: self.reference_profile(ref[feature], bins).score(values) for feature, values in cur.items()}
+        else:
+            scores = self.reference_profile(ref, bins).score_windows(cur)
+        if log_enabled("info"):
+            log_message("info", f"[Bass] drift_scores() scored {len(scores)} window(s)/feature(s).")
+        return scores
+
+    def reference_profile(self, ref: Any, bins: int = 10) -> Any:
+        """Cached quantile edges and bin proportions of ``ref`` (see bass/drift.py)."""
+        if self._references is None:
+            from orchestrAIframework.bass.drift import ReferenceCache
+
+            self._references = ReferenceCache()
+        return self._references.get(ref, bins)
+
     # --- Orchestral entrypoint ---
     def perform(self, score: Optional[Dict[str, Any]] = None) -> None:
         log_message("info", "[Bass] Performing statistical checks...")
@@ -0,0 +1,180 @@
+# orchestrAIframework/bass/calibration.py
+"""
+OrchestrAIFramework - Bass Probability Calibration
+--------------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Fit/apply probability calibrators for the scoring hot path.
+
+- IsotonicCalibrator: pool-adjacent-violators on sorted scores (O(n log n) for
+  the sort, O(n) for the pooling). The fit is stored as two compact sorted
+  arrays (thresholds, values), so calibrating a batch is one ``np.interp``.
+- PlattCalibrator: logistic fit p = 1 / (1 + exp(A * logit(s) + B)) by Newton's
+  method with Platt's smoothed targets.
+
+Calibrators are saved as ``.npz`` files under ``ORCH_PATHS["models"]/calibrators``
+and reload without refitting.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+from orchestrAIframework.common.paths import get_path
+
+# Scores are clipped away from 0/1 before taking logits.
+PROB_EPS = 1e-12
+
+
+def _as_float_array(values: Any) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64).ravel()
+
+
+class IsotonicCalibrator:
+    """Monotone (non-decreasing) piecewise-linear map from scores to probabilities."""
+
+    method = "isotonic"
+
+    def __init__(self, thresholds: Optional[np.ndarray] = None, values: Optional[np.ndarray] = None):
+        self.thresholds = thresholds
+        self.values = values
+
+    def fit(self, probs: Any, labels: Any, sample_weight: Optional[Any] = None) -> "IsotonicCalibrator":
+        x = _as_float_array(probs)
+        y = _as_float_array(labels)
+        w = np.ones_like(x) if sample_weight is None else _as_float_array(sample_weight)
+        if x.size == 0 or x.size != y.size or x.size != w.size:
+            raise ValueError("probs, labels (and sample_weight) must be non-empty and the same length.")
+
+        # Collapse tied scores into weighted means, already sorted by score.
+        xs, inverse = np.unique(x, return_inverse=True)
+        ws = np.bincount(inverse, weights=w)
+        ys = np.bincount(inverse, weights=w * y) / ws
+
+        # Pool adjacent violators with a stack of blocks (value, weight, first index).
+        values, weights, starts = [], [], []
+        for i in range(xs.size):
+            v, wt, start = ys[i], ws[i], i
+            while values and values[-1] >= v:
+                pw = weights.pop()
+                v = (values.pop() * pw + v * wt) / (pw + wt)
+                wt += pw
+                start = starts.pop()
+            values.append(v)
+            weights.append(wt)
+            starts.append(start)
+
+        block_start = np.asarray(starts)
+        block_end = np.append(block_start[1:], xs.size) - 1
+        block_value = np.asarray(values)
+
+        # Each block contributes its two end points; drop the duplicate when it has one score.
+        thresholds = np.column_stack([xs[block_start], xs[block_end]]).ravel()
+        levels = np.repeat(block_value, 2)
+        keep = np.ones(thresholds.size, dtype=bool)
+        keep[1:] = thresholds[1:] != thresholds[:-1]
+        self.thresholds = thresholds[keep]
+        self.values = levels[keep]
+        return self
+
+    def apply(self, probs: Any) -> np.ndarray:
+        if self.thresholds is None:
+            raise RuntimeError("IsotonicCalibrator is not fitted.")
+        return np.interp(np.asarray(probs, dtype=np.float64), self.thresholds, self.values)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {"thresholds": self.thresholds, "values": self.values}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "IsotonicCalibrator":
+        return cls(np.asarray(arrays["thresholds"]), np.asarray(arrays["values"]))
+
+
+class PlattCalibrator:
+    """Platt scaling on the logit of the raw score."""
+
+    method = "platt"
+
+    def __init__(self, a: float = -1.0, b: float = 0.0, fitted: bool = False):
+        self.a = a
+        self.b = b
+        self.fitted = fitted
+
+    @staticmethod
+    def _logit(probs: Any) -> np.ndarray:
+        p = np.clip(np.asarray(probs, dtype=np.float64), PROB_EPS, 1.0 - PROB_EPS)
+        return np.log(p) - np.log1p(-p)
+
+    def fit(self, probs: Any, labels: Any, max_iter: int = 100, tol: float = 1e-10) -> "PlattCalibrator":
+        f = self._logit(_as_float_array(probs))
+        y = _as_float_array(labels)
+        if f.size == 0 or f.size != y.size:
+            raise ValueError("probs and labels must be non-empty and the same length.")
+
+        # Platt's smoothed targets avoid overfitting on separable data.
+        n_pos = float(np.sum(y > 0.5))
+        n_neg = float(y.size - n_pos)
+        t = np.where(y > 0.5, (n_pos + 1.0) / (n_pos + 2.0), 1.0 / (n_neg + 2.0))
+
+        a, b = 0.0, float(np.log((n_neg + 1.0) / (n_pos + 1.0)))
+        for _ in range(max_iter):
+            z = a * f + b
+            p = 1.0 / (1.0 + np.exp(z))  # P(y=1) under the current (a, b)
+            grad_z = t - p  # d(neg log-likelihood)/dz
+            weight = p * (1.0 - p)
+            g = np.array([np.dot(grad_z, f), grad_z.sum()])
+            h = np.array([[np.dot(weight, f * f), np.dot(weight, f)], [np.dot(weight, f), weight.sum()]])
+            h[0, 0] += 1e-12
+            h[1, 1] += 1e-12
+            step = np.linalg.solve(h, g)
+            a, b = a - step[0], b - step[1]
+            if np.max(np.abs(step)) < tol:
+                break
+        self.a, self.b, self.fitted = float(a), float(b), True
+        return self
+
+    def apply(self, probs: Any) -> np.ndarray:
+        if not self.fitted:
+            raise RuntimeError("PlattCalibrator is not fitted.")
+        return 1.0 / (1.0 + np.exp(self.a * self._logit(probs) + self.b))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {"params": np.array([self.a, self.b])}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "PlattCalibrator":
+        a, b = np.asarray(arrays["params"], dtype=np.float64)
+        return cls(float(a), float(b), fitted=True)
+
+
+CALIBRATORS = {cls.method: cls for cls in (IsotonicCalibrator, PlattCalibrator)}
+
+
+def fit_calibrator(probs: Any, labels: Any, method: str = "isotonic") -> Any:
+    if method not in CALIBRATORS:
+        raise ValueError(f"Unknown calibration method '{method}'. Choose from {sorted(CALIBRATORS)}.")
+    return CALIBRATORS[method]().fit(probs, labels)
+
+
+def calibrator_path(name: str) -> Path:
+    return get_path("models") / "calibrators" / f"{name}.npz"
+
+
+def save_calibrator(calibrator: Any, name_or_path: Union[str, Path]) -> Path:
+    """Save under ORCH_PATHS['models']/calibrators/<name>.npz (or an explicit .npz path)."""
+    path = Path(name_or_path) if str(name_or_path).endswith(".npz") else calibrator_path(str(name_or_path))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, method=np.array(calibrator.method), **calibrator.to_arrays())
+    return path
+
+
+def load_calibrator(name_or_path: Union[str, Path]) -> Any:
+    path = Path(name_or_path) if str(name_or_path).endswith(".npz") else calibrator_path(str(name_or_path))
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files}
+    method = str(arrays.pop("method"))
+    if method not in CALIBRATORS:
+        raise ValueError(f"Unknown calibration method '{method}' in {path}.")
+    return CALIBRATORS[method].from_arrays(arrays)
@@ -0,0 +1,140 @@
+# orchestrAIframework/bass/drift.py
+"""
+OrchestrAIFramework - Bass Drift Scoring
+----------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Population Stability Index (PSI) with reference profiles computed once.
+
+A ReferenceProfile holds the quantile bin edges of a reference sample and the
+share of the reference that falls into each bin. Current windows are binned
+against those edges with a vectorized ``searchsorted`` + ``bincount``, so
+scoring many windows against the same reference never rescans it.
+ReferenceCache keeps profiles keyed by reference identity.
+
+    PSI = sum_i (cur_i - ref_i) * ln(cur_i / ref_i)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Tuple
+
+import numpy as np
+
+# Floor applied to empty bins so the log term stays finite.
+EPSILON = 1e-6
+
+
+def _as_array(values: Iterable[float]) -> np.ndarray:
+    arr = np.asarray(values, dtype=np.float64).ravel()
+    return arr[~np.isnan(arr)]
+
+
+def psi(expected: np.ndarray, actual: np.ndarray, eps: float = EPSILON) -> np.ndarray:
+    """PSI between bin proportions; the last axis holds the bins."""
+    expected = np.clip(expected, eps, None)
+    actual = np.clip(actual, eps, None)
+    return np.sum((actual - expected) * np.log(actual / expected), axis=-1)
+
+
+class ReferenceProfile:
+    """Quantile bin edges and bin proportions of a reference sample."""
+
+    __slots__ = ("edges", "proportions", "count")
+
+    def __init__(self, edges: np.ndarray, proportions: np.ndarray, count: int):
+        self.edges = edges
+        self.proportions = proportions
+        self.count = count
+
+    @classmethod
+    def fit(cls, ref: Iterable[float], bins: int = 10) -> "ReferenceProfile":
+        values = _as_array(ref)
+        if values.size == 0:
+            raise ValueError("Reference sample is empty or all NaN.")
+        if bins < 2:
+            raise ValueError("PSI needs at least 2 bins.")
+        # Interior quantile edges; ties collapse so every bin keeps a distinct range.
+        edges = np.unique(np.quantile(values, np.linspace(0.0, 1.0, bins + 1)[1:-1]))
+        counts = np.bincount(np.searchsorted(edges, values, side="right"), minlength=edges.size + 1)
+        return cls(edges, counts / values.size, int(values.size))
+
+    @property
+    def bins(self) -> int:
+        return self.edges.size + 1
+
+    def proportions_of(self, cur: Iterable[float]) -> np.ndarray:
+        """Share of ``cur`` in each reference bin."""
+        values = _as_array(cur)
+        if values.size == 0:
+            return np.full(self.bins, np.nan)
+        counts = np.bincount(np.searchsorted(self.edges, values, side="right"), minlength=self.bins)
+        return counts / values.size
+
+    def score(self, cur: Iterable[float]) -> float:
+        return float(psi(self.proportions, self.proportions_of(cur)))
+
+    def score_windows(self, windows: Any) -> np.ndarray:
+        """
+        PSI of many windows at once. A 2-D array (one window per row) is binned in a
+        single ``bincount``; ragged sequences of windows are scored one by one.
+        """
+        if isinstance(windows, np.ndarray) and windows.ndim == 2:
+            n_windows = windows.shape[0]
+            valid = ~np.isnan(windows)
+            idx = np.searchsorted(self.edges, windows, side="right")
+            idx += np.arange(n_windows)[:, None] * self.bins
+            counts = np.bincount(idx[valid], minlength=n_windows * self.bins).reshape(n_windows, self.bins)
+            sizes = valid.sum(axis=1, keepdims=True)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                scores = psi(self.proportions, counts / sizes)
+            return np.where(sizes[:, 0] > 0, scores, np.nan)
+        return np.array([self.score(window) for window in windows], dtype=np.float64)
+
+
+class ReferenceCache:
+    """
+    Bounded LRU of ReferenceProfiles keyed by ``(id(ref), bins)``.
+
+    The reference object itself is kept alive by its entry, so its id cannot be
+    reused while cached. References are assumed immutable once profiled; call
+    ``invalidate`` after mutating one in place.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[Any, ReferenceProfile]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, ref: Any, bins: int = 10) -> ReferenceProfile:
+        key = (id(ref), bins)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        profile = ReferenceProfile.fit(ref, bins)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (ref, profile)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return profile
+
+    def invalidate(self, ref: Any) -> None:
+        with self._lock:
+            for key in [k for k, (obj, _) in self._entries.items() if obj is ref]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
@@ -0,0 +1,221 @@
+# orchestrAIframework/bass/hypothesis.py
+"""
+OrchestrAIFramework - Bass Hypothesis Tests
+-------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Vectorized Welch t-tests for many metrics at once, with p-values from a
+Student-t distribution implemented here (no SciPy dependency):
+
+    two-sided p = I_{df / (df + t^2)}(df / 2, 1 / 2)
+
+where I is the regularized incomplete beta function, evaluated with a
+vectorized Lentz continued fraction. Multiple-comparison corrections
+(Bonferroni, Holm, Benjamini-Hochberg) work on the whole p-value vector.
+"""
+
+import math
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# Beyond this many degrees of freedom the t distribution is treated as normal.
+NORMAL_DF = 1e5
+
+CORRECTIONS = {"bonferroni", "holm", "bh"}
+
+
+def gammaln(x: Any) -> np.ndarray:
+    """
+    Vectorized log-gamma for x > 0: arguments are shifted above 10 with the
+    recurrence Γ(x + 1) = x Γ(x), then evaluated with the Stirling series.
+    """
+    y = np.array(x, dtype=np.float64, copy=True)
+    log_shift = np.zeros_like(y)
+    for _ in range(10):
+        low = y < 10.0
+        if not low.any():
+            break
+        log_shift[low] += np.log(y[low])
+        y[low] += 1.0
+    inv = 1.0 / y
+    inv2 = inv * inv
+    series = inv * (1.0 / 12 - inv2 * (1.0 / 360 - inv2 * (1.0 / 1260 - inv2 / 1680)))
+    return (y - 0.5) * np.log(y) - y + 0.5 * math.log(2 * math.pi) + series - log_shift
+
+
+def _betacf(a: np.ndarray, b: np.ndarray, x: np.ndarray, max_iter: int = 1000, eps: float = 1e-14) -> np.ndarray:
+    """Continued fraction for the incomplete beta (modified Lentz), all elements at once."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = np.ones_like(x)
+    d = 1.0 - qab * x / qap
+    d = np.where(np.abs(d) < tiny, tiny, d)
+    d = 1.0 / d
+    h = d.copy()
+    active = np.ones(x.shape, dtype=bool)
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = np.where(np.abs(d) < tiny, tiny, d)
+        c = 1.0 + aa / c
+        c = np.where(np.abs(c) < tiny, tiny, c)
+        d = 1.0 / d
+        h = np.where(active, h * d * c, h)
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = np.where(np.abs(d) < tiny, tiny, d)
+        c = 1.0 + aa / c
+        c = np.where(np.abs(c) < tiny, tiny, c)
+        d = 1.0 / d
+        delta = d * c
+        h = np.where(active, h * delta, h)
+        active &= np.abs(delta - 1.0) > eps
+        if not active.any():
+            break
+    return h
+
+
+def betainc(a: Any, b: Any, x: Any) -> np.ndarray:
+    """Regularized incomplete beta I_x(a, b), vectorized over all arguments."""
+    a, b, x = np.broadcast_arrays(
+        np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64), np.asarray(x, dtype=np.float64)
+    )
+    out = np.full(x.shape, np.nan)
+    out[x <= 0.0] = 0.0
+    out[x >= 1.0] = 1.0
+    inner = (x > 0.0) & (x < 1.0)
+    if not inner.any():
+        return out
+
+    a, b, x = a[inner], b[inner], x[inner]
+    log_front = gammaln(a + b) - gammaln(a) - gammaln(b) + a * np.log(x) + b * np.log1p(-x)
+    # Use the symmetry I_x(a, b) = 1 - I_{1-x}(b, a) where the fraction converges faster.
+    swap = x > (a + 1.0) / (a + b + 2.0)
+    aa, bb, xx = np.where(swap, b, a), np.where(swap, a, b), np.where(swap, 1.0 - x, x)
+    frac = np.exp(log_front) * _betacf(aa, bb, xx) / aa
+    out[inner] = np.where(swap, 1.0 - frac, frac)
+    return out
+
+
+def t_two_sided_pvalue(t: Any, df: Any) -> np.ndarray:
+    """Two-sided p-value P(|T| >= |t|) of a Student-t with ``df`` degrees of freedom."""
+    t, df = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(df, dtype=np.float64))
+    p = np.full(t.shape, np.nan)
+    ok = ~(np.isnan(t) | np.isnan(df)) & (df > 0)
+    p[ok & np.isinf(t)] = 0.0
+
+    finite = ok & np.isfinite(t)
+    normal = finite & (df > NORMAL_DF)
+    exact = finite & ~normal
+    if exact.any():
+        dfe, te = df[exact], t[exact]
+        p[exact] = betainc(dfe / 2.0, 0.5, dfe / (dfe + te * te))
+    if normal.any():
+        p[normal] = np.frompyfunc(math.erfc, 1, 1)(np.abs(t[normal]) / math.sqrt(2.0)).astype(np.float64)
+    return np.clip(p, 0.0, 1.0)
+
+
+def t_cdf(t: Any, df: Any) -> np.ndarray:
+    """Student-t cumulative distribution function."""
+    t = np.asarray(t, dtype=np.float64)
+    tail = 0.5 * t_two_sided_pvalue(t, df)
+    return np.where(t >= 0, 1.0 - tail, tail)
+
+
+def welch_from_stats(
+    n_a: Any, mean_a: Any, var_a: Any, n_b: Any, mean_b: Any, var_b: Any
+) -> Dict[str, np.ndarray]:
+    """
+    Welch t-test from per-metric sufficient statistics (sample variances, ddof=1).
+    Every argument may be a scalar or an array; results broadcast accordingly.
+    """
+    n_a, mean_a, var_a, n_b, mean_b, var_b = (
+        np.asarray(v, dtype=np.float64) for v in (n_a, mean_a, var_a, n_b, mean_b, var_b)
+    )
+    se_a, se_b = var_a / n_a, var_b / n_b
+    se2 = se_a + se_b
+    diff = mean_a - mean_b
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(se2 > 0, diff / np.sqrt(se2), np.where(diff == 0, np.nan, np.copysign(np.inf, diff)))
+        # Welch–Satterthwaite approximation for degrees of freedom
+        den = se_a * se_a / (n_a - 1) + se_b * se_b / (n_b - 1)
+        df = np.where(den > 0, se2 * se2 / den, np.nan)
+    too_small = (n_a < 2) | (n_b < 2)
+    t = np.where(too_small, np.nan, t)
+    df = np.where(too_small, np.nan, df)
+    return {"t": t, "df": df, "p_value": t_two_sided_pvalue(t, df)}
+
+
+def welch_ttest_batch(a: Any, b: Any, axis: int = -1) -> Dict[str, np.ndarray]:
+    """
+    Welch t-tests over matrices of samples, one metric per row (``axis`` holds the
+    samples). NaNs are treated as missing, so ragged groups can be NaN-padded.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+
+    def sufficient(x: np.ndarray):
+        n = np.sum(~np.isnan(x), axis=axis)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(x, axis=axis) / n
+            centered = x - np.expand_dims(mean, axis)
+            var = np.nansum(centered * centered, axis=axis) / (n - 1)
+        return n, mean, var
+
+    return welch_from_stats(*sufficient(a), *sufficient(b))
+
+
+def adjust_pvalues(p: Any, method: str = "holm") -> np.ndarray:
+    """
+    Multiple-comparison correction of a p-value vector (NaNs are left untouched and
+    do not count as tests). Methods: "bonferroni", "holm" (FWER), "bh" (FDR).
+    """
+    if method not in CORRECTIONS:
+        raise ValueError(f"Unknown correction '{method}'. Choose from {sorted(CORRECTIONS)}.")
+    p = np.asarray(p, dtype=np.float64)
+    out = np.full(p.shape, np.nan)
+    valid = ~np.isnan(p)
+    pv = p[valid]
+    m = pv.size
+    if m == 0:
+        return out
+
+    if method == "bonferroni":
+        adjusted = pv * m
+    else:
+        order = np.argsort(pv, kind="mergesort")
+        ranked = pv[order]
+        if method == "holm":
+            stepped = np.maximum.accumulate(ranked * (m - np.arange(m)))
+        else:  # Benjamini-Hochberg step-up
+            stepped = np.minimum.accumulate((ranked * m / np.arange(1, m + 1))[::-1])[::-1]
+        adjusted = np.empty(m)
+        adjusted[order] = stepped
+    out[valid] = np.minimum(adjusted, 1.0)
+    return out
+
+
+def ttest_batch(
+    a: Optional[Any] = None,
+    b: Optional[Any] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    correction: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Either sample matrices ``a``/``b`` or ``stats`` with keys n_a, mean_a, var_a,
+    n_b, mean_b, var_b. Adds ``p_adjusted`` when ``correction`` is given.
+    """
+    if stats is not None:
+        result = welch_from_stats(
+            stats["n_a"], stats["mean_a"], stats["var_a"], stats["n_b"], stats["mean_b"], stats["var_b"]
+        )
+    elif a is not None and b is not None:
+        result = welch_ttest_batch(a, b)
+    else:
+        raise ValueError("ttest_batch() needs either sample matrices (a, b) or sufficient statistics.")
+    if correction is not None:
+        result["p_adjusted"] = adjust_pvalues(result["p_value"], correction)
+    return result
@@ -0,0 +1,137 @@
+# orchestrAIframework/bass/stats.py
+"""
+OrchestrAIFramework - Bass Streaming Statistics
+-----------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Single-pass, mergeable descriptive statistics. A RunningStats accumulator keeps
+count, mean, the sum of squared deviations (Welford), min and max, so a metric
+stream can be described chunk by chunk without holding it in memory, and
+accumulators built on different shards can be merged exactly (Chan et al.).
+
+NumPy arrays (and large lists, when NumPy is installed) are reduced with
+vectorized kernels; any other iterable falls back to a pure-Python Welford loop.
+"""
+
+import math
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional here; the pure-Python path still works
+    np = None
+
+# Lists shorter than this are cheaper to fold in Python than to convert.
+VECTORIZE_MIN_LEN = 64
+
+
+class RunningStats:
+    """Streaming count/mean/variance/min/max accumulator."""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "RunningStats":
+        return cls().update(values)
+
+    # --- Updates ---
+    def push(self, value: float) -> None:
+        """Fold a single observation (Welford's update)."""
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def update(self, values: Iterable[float]) -> "RunningStats":
+        """Fold a chunk of observations; returns self so calls can be chained."""
+        if np is not None:
+            if isinstance(values, np.ndarray):
+                return self._update_array(values)
+            if isinstance(values, (list, tuple)) and len(values) >= VECTORIZE_MIN_LEN:
+                return self._update_array(np.asarray(values, dtype=np.float64))
+
+        for value in values:
+            self.push(value)
+        return self
+
+    def _update_array(self, values: Any) -> "RunningStats":
+        values = values.ravel()
+        n = values.size
+        if n == 0:
+            return self
+        chunk = RunningStats()
+        chunk.count = int(n)
+        chunk.mean = float(values.mean(dtype=np.float64))
+        centered = values - chunk.mean
+        chunk.m2 = float(np.dot(centered, centered))
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        return self.merge(chunk)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Combine another accumulator into this one (parallel variance formula)."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def __add__(self, other: "RunningStats") -> "RunningStats":
+        return self.copy().merge(other)
+
+    def copy(self) -> "RunningStats":
+        out = RunningStats()
+        out.count, out.mean, out.m2, out.min, out.max = self.count, self.mean, self.m2, self.min, self.max
+        return out
+
+    # --- Results ---
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator), 0.0 for a single observation."""
+        if self.count == 0:
+            return math.nan
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Same shape as ``Bass.describe``."""
+        if self.count == 0:
+            return {"count": 0, "mean": math.nan, "std": math.nan, "min": math.nan, "max": math.nan}
+        return {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min, "max": self.max}
+
+    def __repr__(self) -> str:
+        return f"RunningStats({self.to_dict()})"
+
+
+def describe_stream(chunks: Iterable[Iterable[float]], stats: Optional[RunningStats] = None) -> RunningStats:
+    """Fold an iterable of chunks (lists, arrays, generators) into one accumulator."""
+    stats = stats if stats is not None else RunningStats()
+    for chunk in chunks:
+        stats.update(chunk)
+    return stats
@@ -0,0 +1,77 @@
+# orchestrAIframework/benchmarks/bench_generation.py
+"""
+Benchmark - Streaming Generation Under Concurrency
+Author: Marcos Paulo Pazzinatto | License: MIT
+
+Fires N concurrent prompts at a GenerationScheduler backed by the stand-in
+EchoBackend with a simulated per-step cost. It reports time-to-first-token
+(p50/p95) and aggregate tokens/sec for one-at-a-time serving
+(max_batch_size=1) and for continuous batching.
+
+Usage:
+    python -m orchestrAIframework.benchmarks.bench_generation [--requests 64] [--tokens 32]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from orchestrAIframework.common.logging import configure_logging
+from orchestrAIframework.harp.generation import EchoBackend, GenerationScheduler
+
+
+async def _consume(scheduler: GenerationScheduler, prompt: str, max_tokens: int, ttfts: List[float]) -> int:
+    start = time.perf_counter()
+    count = 0
+    async for _ in scheduler.astream(prompt, max_tokens):
+        if count == 0:
+            ttfts.append(time.perf_counter() - start)
+        count += 1
+    return count
+
+
+async def _burst(scheduler: GenerationScheduler, requests: int, tokens: int) -> Dict[str, float]:
+    ttfts: List[float] = []
+    start = time.perf_counter()
+    counts = await asyncio.gather(*(_consume(scheduler, f"prompt {i}", tokens, ttfts) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    ttfts.sort()
+    return {
+        "ttft_p50_ms": 1e3 * statistics.median(ttfts),
+        "ttft_p95_ms": 1e3 * ttfts[int(0.95 * (len(ttfts) - 1))],
+        "tokens_per_s": sum(counts) / elapsed,
+        "mean_batch": scheduler.stats()["mean_batch"],
+    }
+
+
+def run(requests: int = 64, tokens: int = 32, step_ms: float = 2.0, per_seq_ms: float = 0.05) -> Dict[str, Dict[str, float]]:
+    """TTFT and throughput per max_batch_size."""
+    configure_logging(level="warning")
+    results = {}
+    for batch in (1, 8, requests):
+        backend = EchoBackend(length=tokens, step_s=step_ms / 1e3, per_seq_s=per_seq_ms / 1e3)
+        scheduler = GenerationScheduler(backend, max_batch_size=batch)
+        try:
+            results[f"max_batch_{batch}"] = asyncio.run(_burst(scheduler, requests, tokens))
+        finally:
+            scheduler.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--tokens", type=int, default=32)
+    parser.add_argument("--step-ms", type=float, default=2.0)
+    parser.add_argument("--per-seq-ms", type=float, default=0.05)
+    args = parser.parse_args()
+
+    print(f"{'config':<16} {'ttft p50 ms':>12} {'ttft p95 ms':>12} {'tokens/s':>10} {'batch':>6}")
+    for name, r in run(args.requests, args.tokens, args.step_ms, args.per_seq_ms).items():
+        print(f"{name:<16} {r['ttft_p50_ms']:>12.1f} {r['ttft_p95_ms']:>12.1f} {r['tokens_per_s']:>10.0f} {r['mean_batch']:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# orchestrAIframework/benchmarks/bench_startup.py
+"""
+Benchmark - Cold Import & Startup
+Author: Marcos Paulo Pazzinatto | License: MIT
+
+Spawns fresh interpreters and measures how long it takes to import the
+framework and bring up a Conductor, with every section built eagerly or
+registered lazily by name. Times are medians over several runs, with the bare
+interpreter start-up subtracted.
+
+Usage:
+    python -m orchestrAIframework.benchmarks.bench_startup [--runs 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict
+
+SECTIONS = ["Strings", "Brass", "Woodwinds", "Percussion", "Keyboards", "Bass", "Harp", "Choir"]
+
+SCENARIOS = {
+    "import paths+logging": "import orchestrAIframework.common.logging",
+    "import conductor": "import orchestrAIframework.conductor.conductor",
+    "conductor, eager sections": (
+        "from orchestrAIframework.conductor.conductor import Conductor, SECTION_REGISTRY, LazySection\n"
+        "c = Conductor()\n"
+        f"for name in {SECTIONS!r}:\n"
+        "    c.register_section(name, LazySection(SECTION_REGISTRY[name]).load())\n"
+    ),
+    "conductor, lazy sections": (
+        "from orchestrAIframework.conductor.conductor import Conductor\n"
+        "c = Conductor()\n"
+        f"for name in {SECTIONS!r}:\n"
+        "    c.register_lazy(name)\n"
+    ),
+}
+
+
+def _time_snippet(code: str, runs: int, env: Dict[str, str]) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=env, check=True, stdout=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000.0
+
+
+def run(runs: int = 15) -> Dict[str, float]:
+    """Return median milliseconds per scenario, net of bare interpreter start-up."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    bare = _time_snippet("pass", runs, env)
+    results = {"interpreter": bare}
+    for name, code in SCENARIOS.items():
+        results[name] = _time_snippet(code, runs, env) - bare
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    for name, ms in run(args.runs).items():
+        print(f"{name:<28} {ms:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
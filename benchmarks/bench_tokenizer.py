@@ -0,0 +1,71 @@
+# orchestrAIframework/benchmarks/bench_tokenizer.py
+"""
+Benchmark - Batch Tokenizer Throughput
+Author: Marcos Paulo Pazzinatto | License: MIT
+
+Trains a BPE tokenizer on a synthetic Zipf-distributed corpus and reports
+documents/second for the whitespace ``Woodwinds.tokenize`` loop and for the
+array-backed ``tokenize_batch`` on one and several worker processes.
+
+Usage:
+    python -m orchestrAIframework.benchmarks.bench_tokenizer [--docs 50000] [--workers 4]
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Dict, List
+
+from orchestrAIframework.common.logging import configure_logging
+from orchestrAIframework.woodwinds.woodwinds import Woodwinds
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def synthetic_corpus(docs: int, words_per_doc: int = 60, vocab: int = 20000, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    lexicon = ["".join(rng.choice(LETTERS) for _ in range(rng.randint(2, 10))) for _ in range(vocab)]
+    weights = [1.0 / (rank + 1) for rank in range(vocab)]
+    return [" ".join(rng.choices(lexicon, weights, k=words_per_doc)) + "." for _ in range(docs)]
+
+
+def run(docs: int = 50000, workers: int = 4, vocab_size: int = 4000) -> Dict[str, float]:
+    """Docs/sec per tokenization path."""
+    configure_logging(level="warning")
+    corpus = synthetic_corpus(docs)
+    woodwinds = Woodwinds()
+
+    start = time.perf_counter()
+    woodwinds.train_tokenizer(corpus[:5000], vocab_size=vocab_size)
+    results = {"train_s": time.perf_counter() - start}
+
+    start = time.perf_counter()
+    for text in corpus:
+        text.strip().split()
+    results["whitespace_split"] = docs / (time.perf_counter() - start)
+
+    woodwinds.tokenizer._cache.clear()
+    start = time.perf_counter()
+    woodwinds.tokenize_batch(corpus, workers=1)
+    results["bpe_batch_1_worker"] = docs / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    woodwinds.tokenize_batch(corpus, workers=workers)
+    results[f"bpe_batch_{workers}_workers"] = docs / (time.perf_counter() - start)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=50000)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    for name, value in run(args.docs, args.workers).items():
+        unit = "s" if name.endswith("_s") else "docs/s"
+        print(f"{name:<24} {value:>12.1f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
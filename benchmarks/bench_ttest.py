@@ -0,0 +1,71 @@
+# orchestrAIframework/benchmarks/bench_ttest.py
+"""
+Benchmark - Batch Welch t-tests
+Author: Marcos Paulo Pazzinatto | License: MIT
+
+Times Bass.ttest_batch on sample matrices and on precomputed sufficient
+statistics for thousands of metrics, against a Python loop of Bass.ttest.
+
+Usage:
+    python -m orchestrAIframework.benchmarks.bench_ttest [--metrics 1000 5000 20000] [--samples 200]
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from orchestrAIframework.bass.bass import Bass
+from orchestrAIframework.common.logging import configure_logging
+
+
+def run(metrics: List[int], samples: int = 200, loop_limit: int = 2000) -> List[Dict[str, float]]:
+    """Seconds per call for each metric count; the Python loop is capped at ``loop_limit`` metrics."""
+    configure_logging(level="warning")
+    bass = Bass()
+    rng = np.random.default_rng(0)
+    rows = []
+    for m in metrics:
+        a = rng.normal(0.0, 1.0, size=(m, samples))
+        b = rng.normal(0.05, 1.0, size=(m, samples))
+        stats = {
+            "n_a": np.full(m, samples), "mean_a": a.mean(1), "var_a": a.var(1, ddof=1),
+            "n_b": np.full(m, samples), "mean_b": b.mean(1), "var_b": b.var(1, ddof=1),
+        }
+
+        start = time.perf_counter()
+        bass.ttest_batch(a, b, correction="bh")
+        matrix_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bass.ttest_batch(stats=stats, correction="bh")
+        stats_s = time.perf_counter() - start
+
+        n_loop = min(m, loop_limit)
+        a_lists, b_lists = a[:n_loop].tolist(), b[:n_loop].tolist()
+        start = time.perf_counter()
+        for i in range(n_loop):
+            bass.ttest(a_lists[i], b_lists[i])
+        loop_s = (time.perf_counter() - start) * m / n_loop
+
+        rows.append({"metrics": m, "matrix_s": matrix_s, "stats_s": stats_s, "loop_s_est": loop_s})
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--metrics", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'metrics':>8} {'matrix ms':>10} {'stats ms':>10} {'loop ms':>10}")
+    for row in run(args.metrics, args.samples):
+        print(
+            f"{row['metrics']:>8} {row['matrix_s'] * 1e3:>10.1f} {row['stats_s'] * 1e3:>10.1f} "
+            f"{row['loop_s_est'] * 1e3:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
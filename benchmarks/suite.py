@@ -0,0 +1,504 @@
+# orchestrAIframework/benchmarks/suite.py
+"""
+Benchmark - Suite Runner
+Author: Marcos Paulo Pazzinatto | License: MIT
+
+Runs microbenchmarks for the hot methods of every section at several input
+sizes, plus end-to-end Conductor scenarios (all built-in sections, and
+large synthetic DAGs on play/aplay, with and without profiling).
+
+Each case is calibrated to run at least --min-time seconds per sample and
+sampled --repeat times. Min and median seconds per call and throughput
+(items/s) are recorded. Results go to
+ORCH_PATHS["experiments"]/benchmarks/run-<timestamp>.json with machine
+metadata (Python, NumPy, platform, CPUs, git commit).
+
+--baseline compares the run against a saved result on the per-call
+minimum, the least noisy statistic. Cases slower by more than
+--threshold are flagged as regressions, and the exit status is 1, so
+the suite can gate CI. --save-baseline also stores the run as
+benchmarks/baseline.json.
+
+Usage:
+    python -m orchestrAIframework.benchmarks.suite [--quick] [--filter bass,conductor] [--repeat 5]
+    python -m orchestrAIframework.benchmarks.suite --save-baseline
+    python -m orchestrAIframework.benchmarks.suite --baseline baseline [--threshold 0.10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from orchestrAIframework.common.logging import configure_logging
+from orchestrAIframework.common.paths import get_path
+
+
+class Case(NamedTuple):
+    name: str
+    sizes: Tuple[int, ...]
+    setup: Callable[[int], Callable[[], Any]]  # size -> zero-arg callable to time
+
+
+CASES: List[Case] = []
+_CLEANUP: List[Callable[[], None]] = []
+
+
+def case(name: str, sizes: Sequence[int]) -> Callable:
+    """Register ``setup(size) -> fn``; only ``fn()`` is timed."""
+
+    def register(setup: Callable[[int], Callable[[], Any]]) -> Callable[[int], Callable[[], Any]]:
+        CASES.append(Case(name, tuple(sizes), setup))
+        return setup
+
+    return register
+
+
+def _scratch_dir() -> str:
+    path = tempfile.mkdtemp(prefix="orchestrai-bench-")
+    _CLEANUP.append(lambda: shutil.rmtree(path, ignore_errors=True))
+    return path
+
+
+def _texts(n: int, seed: int = 0) -> List[str]:
+    words = np.array("the quick brown fox jumps over a lazy dog while an orchestra plays harmony melody rhythm tempo".split())
+    rng = np.random.default_rng(seed)
+    return [" ".join(words[rng.integers(0, words.size, 12)]) + f" doc{seed}-{i}" for i in range(n)]
+
+
+# --- Bass ---
+@case("bass.describe", sizes=(1_000, 100_000, 1_000_000))
+def _bass_describe(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.bass.bass import Bass
+
+    bass, values = Bass(), np.random.default_rng(0).normal(size=size)
+    return lambda: bass.describe(values)
+
+
+@case("bass.ttest_batch", sizes=(10, 1_000))
+def _bass_ttest(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.bass.bass import Bass
+
+    bass, rng = Bass(), np.random.default_rng(0)
+    a, b = rng.normal(size=(1_000, size)), rng.normal(0.1, size=(1_000, size))
+    return lambda: bass.ttest_batch(a, b)
+
+
+@case("bass.drift_score", sizes=(10_000, 1_000_000))
+def _bass_drift(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.bass.bass import Bass
+
+    bass, rng = Bass(), np.random.default_rng(0)
+    ref, cur = rng.normal(size=size), rng.normal(0.2, size=size)
+    return lambda: bass.drift_score(ref, cur)
+
+
+# --- Keyboards ---
+@case("keyboards.fuse", sizes=(16, 1_024))
+def _keyboards_fuse(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.keyboards.keyboards import Keyboards
+
+    keyboards, a, b = Keyboards(), [0.1] * size, [0.2] * size
+    return lambda: keyboards.fuse(a, b)
+
+
+@case("keyboards.fuse_batch", sizes=(1_000, 100_000))
+def _keyboards_fuse_batch(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.keyboards.keyboards import Keyboards
+
+    rng = np.random.default_rng(0)
+    blocks = [rng.normal(size=(size, d)).astype(np.float32) for d in (64, 32, 16)]
+    keyboards = Keyboards()
+    keyboards.configure_fusion([64, 32, 16], normalize="l2")
+    return lambda: keyboards.fuse_batch(*blocks)
+
+
+@case("keyboards.search", sizes=(1, 100))
+def _keyboards_search(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.keyboards.keyboards import Keyboards
+
+    rng = np.random.default_rng(0)
+    keyboards = Keyboards()
+    keyboards.build_index(64)
+    keyboards.add_vectors(rng.normal(size=(50_000, 64)).astype(np.float32))
+    queries = rng.normal(size=(size, 64)).astype(np.float32)
+    return lambda: keyboards.search(queries, k=10)
+
+
+@case("keyboards.get_features", sizes=(100, 10_000))
+def _keyboards_features(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.keyboards.keyboards import Keyboards
+
+    rng = np.random.default_rng(0)
+    keyboards = Keyboards()
+    keyboards.open_feature_store(os.path.join(_scratch_dir(), "store"), cache_size=0)
+    ids = np.arange(200_000)
+    keyboards.write_features(ids, {f"f{j}": rng.random(ids.size) for j in range(8)})
+    wanted = rng.integers(0, ids.size, size)
+    return lambda: keyboards.get_features(wanted)
+
+
+# --- Woodwinds ---
+@case("woodwinds.embed_matrix", sizes=(100, 1_000))
+def _woodwinds_embed(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.woodwinds.embedding import HashingEmbedder
+    from orchestrAIframework.woodwinds.woodwinds import Woodwinds
+
+    woodwinds = Woodwinds()
+    woodwinds.set_embedding_backend(HashingEmbedder(dim=256), cache_size=0)
+    texts = _texts(size)
+    return lambda: woodwinds.embed_matrix(texts)
+
+
+@case("woodwinds.retrieve", sizes=(10_000,))
+def _woodwinds_retrieve(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.woodwinds.woodwinds import Woodwinds
+
+    woodwinds = Woodwinds()
+    woodwinds.add_documents(_texts(size))
+    return lambda: woodwinds.retrieve("quick orchestra harmony", k=10, mode="hybrid")
+
+
+# --- Brass ---
+@case("brass.predict", sizes=(1_000, 100_000))
+def _brass_predict(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.benchmarks.bench_trees import synthetic
+    from orchestrAIframework.brass.brass import Brass
+
+    X, y = synthetic(20_000, 10)
+    brass = Brass()
+    brass.load_model("boosting", n_estimators=30, max_leaves=31)
+    brass.fit(X, y)
+    X_test = synthetic(size, 10, seed=1)[0]
+    return lambda: brass.predict(X_test)
+
+
+# --- Percussion ---
+@case("percussion.collect", sizes=(16, 1_024))
+def _percussion_collect(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.percussion.percussion import Percussion
+
+    percussion = Percussion()
+    percussion.make_env("cartpole", num_envs=size, seed=0)
+    percussion.create_replay(100_000)
+    policy = lambda obs: (obs[:, 2] > 0).astype(np.int64)
+    return lambda: percussion.collect(10, policy=policy)
+
+
+@case("percussion.sample_prioritized", sizes=(256,))
+def _percussion_sample(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.percussion.replay import PrioritizedReplayBuffer
+
+    rng = np.random.default_rng(0)
+    buffer = PrioritizedReplayBuffer(100_000, (4,), seed=0)
+    buffer.add(rng.normal(size=(100_000, 4)), np.zeros(100_000), np.ones(100_000), rng.normal(size=(100_000, 4)), np.zeros(100_000, bool))
+    return lambda: buffer.sample(size)
+
+
+# --- Choir ---
+@case("choir.log_metric", sizes=(10_000,))
+def _choir_log_metric(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.choir.choir import Choir
+
+    choir, values = Choir(), np.random.default_rng(0).random(size).tolist()
+
+    def run() -> None:
+        for v in values:
+            choir.log_metric("latency", v)
+
+    return run
+
+
+@case("choir.evaluate_slices", sizes=(100_000, 1_000_000))
+def _choir_slices(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.choir.choir import Choir
+
+    rng = np.random.default_rng(0)
+    p = rng.random(size)
+    y = (rng.random(size) < p).astype(np.int8)
+    slices = {"region": rng.integers(0, 20, size), "version": rng.integers(0, 10, size)}
+    choir = Choir()
+    return lambda: choir.evaluate_slices(y, p, slices)
+
+
+# --- Harp / Strings ---
+@case("harp.generate_text", sizes=(16, 128))
+def _harp_generate(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.harp.generation import EchoBackend
+    from orchestrAIframework.harp.harp import Harp
+
+    harp = Harp()
+    harp.set_text_backend(EchoBackend(length=size))
+    _CLEANUP.append(harp.generator.close)
+    return lambda: harp.generate_text("the orchestra tunes", max_len=size)
+
+
+@case("strings.predict", sizes=(100, 1_000))
+def _strings_predict(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.strings.strings import Strings
+
+    rng = np.random.default_rng(0)
+    sequences = [rng.normal(size=(n, 4)).astype(np.float32) for n in np.clip(rng.lognormal(np.log(100), 0.8, size), 4, 1000).astype(int)]
+    strings = Strings()
+    strings.load_model("esn", hidden_dim=64)
+    strings.fit(sequences[:50], [s[:, :1] for s in sequences[:50]])
+    return lambda: strings.predict(sequences)
+
+
+@case("strings.stream", sizes=(1, 16))
+def _strings_stream(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.strings.strings import Strings
+
+    rng = np.random.default_rng(0)
+    strings = Strings()
+    strings.load_model("esn", hidden_dim=64)
+    strings.fit([rng.normal(size=(200, 1))], [rng.normal(size=(200, 1))])
+    strings.open_stream(window=256, hop=16, num_streams=size)
+    chunk = rng.normal(size=(size, 16, 1)) if size > 1 else rng.normal(size=16)
+    return lambda: strings.push(chunk)
+
+
+@case("strings.perform", sizes=(1,))
+def _strings_perform(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.strings.strings import Strings
+
+    strings = Strings()
+    return lambda: strings.perform({"task": "noop"})
+
+
+# --- Conductor, end to end ---
+class _Noop:
+    def perform(self, score: Dict[str, Any]) -> None:
+        return None
+
+
+class _AsyncNoop:
+    async def aperform(self, score: Dict[str, Any]) -> None:
+        return None
+
+
+def _synthetic_conductor(size: int, shape: str, **kwargs: Any) -> Tuple[Any, Dict[str, Any]]:
+    from orchestrAIframework.conductor.conductor import Conductor
+
+    conductor = Conductor(**kwargs)
+    _CLEANUP.append(conductor.close)
+    names = [f"s{i:04d}" for i in range(size)]
+    for name in names:
+        conductor.register_section(name, _AsyncNoop() if shape == "async" else _Noop())
+    if shape == "chain":
+        deps = {names[i]: [names[i - 1]] for i in range(1, size)}
+    else:  # fan-out / fan-in diamond: root -> everything -> sink
+        deps = {name: [names[0]] for name in names[1:-1]}
+        deps[names[-1]] = names[1:-1]
+    return conductor, {"dependencies": deps}
+
+
+@case("conductor.play_builtin", sizes=(8,))
+def _conductor_builtin(size: int) -> Callable[[], Any]:
+    from orchestrAIframework.conductor.conductor import SECTION_REGISTRY, Conductor
+
+    conductor = Conductor(on_error="continue")
+    _CLEANUP.append(conductor.close)
+    for name in list(SECTION_REGISTRY)[:size]:
+        conductor.register_lazy(name)
+    conductor.play()  # build the lazy sections outside the timed region
+    return lambda: conductor.play()
+
+
+@case("conductor.play_chain", sizes=(16, 256))
+def _conductor_chain(size: int) -> Callable[[], Any]:
+    conductor, score = _synthetic_conductor(size, "chain")
+    return lambda: conductor.play(score)
+
+
+@case("conductor.play_diamond", sizes=(16, 256))
+def _conductor_diamond(size: int) -> Callable[[], Any]:
+    conductor, score = _synthetic_conductor(size, "diamond")
+    return lambda: conductor.play(score)
+
+
+@case("conductor.play_diamond_profiled", sizes=(16, 256))
+def _conductor_profiled(size: int) -> Callable[[], Any]:
+    conductor, score = _synthetic_conductor(size, "diamond", profile=True)
+
+    def run() -> None:
+        conductor.play(score)
+        conductor.profiler.clear()
+
+    _CLEANUP.append(conductor.profiler.stop)
+    return run
+
+
+@case("conductor.aplay_diamond", sizes=(16, 256))
+def _conductor_aplay(size: int) -> Callable[[], Any]:
+    conductor, score = _synthetic_conductor(size, "async")
+    return lambda: asyncio.run(conductor.aplay(score))
+
+
+# --- Runner ---
+def _time(fn: Callable[[], Any], repeat: int, min_time: float) -> Dict[str, float]:
+    fn()  # warm-up: caches, lazy imports, pool start
+    loops, elapsed = 1, 0.0
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return {"min_s": min(samples), "median_s": statistics.median(samples), "loops": loops, "repeat": repeat}
+
+
+def _quiet(fn: Callable[..., Any], *args: Any) -> Any:
+    """Silence section print() chatter while ``fn`` runs."""
+    devnull = open(os.devnull, "w")
+    stdout, sys.stdout = sys.stdout, devnull
+    try:
+        return fn(*args)
+    finally:
+        sys.stdout = stdout
+        devnull.close()
+
+
+def machine_metadata() -> Dict[str, Any]:
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "hostname": socket.gethostname(),
+        "argv": sys.argv[1:],
+    }
+    try:
+        meta["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        meta["git_commit"] = None
+    return meta
+
+
+def run(filters: Sequence[str] = (), quick: bool = False, repeat: int = 5, min_time: float = 0.2) -> Dict[str, Any]:
+    configure_logging(level="error")
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for bench in CASES:
+            if filters and not any(f in bench.name for f in filters):
+                continue
+            for size in bench.sizes[:1] if quick else bench.sizes:
+                key = f"{bench.name}[{size}]"
+                fn = _quiet(bench.setup, size)
+                timing = _quiet(_time, fn, repeat, min_time)
+                timing.update(size=size, throughput_per_s=size / timing["median_s"])
+                results[key] = timing
+                print(f"{key:<44} median={timing['median_s'] * 1e3:>10.3f} ms  min={timing['min_s'] * 1e3:>10.3f} ms  "
+                      f"{timing['throughput_per_s']:>14,.0f}/s", flush=True)
+    finally:
+        while _CLEANUP:
+            _CLEANUP.pop()()
+    return {"meta": machine_metadata(), "results": results}
+
+
+def results_dir() -> Path:
+    directory = get_path("experiments") / "benchmarks"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def save(report: Dict[str, Any], path: Optional[Path] = None) -> Path:
+    path = path or results_dir() / f"run-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def load(name_or_path: str) -> Dict[str, Any]:
+    """A path, or a bare name resolved under experiments/benchmarks ("baseline" -> baseline.json)."""
+    path = Path(name_or_path)
+    if not path.exists() and len(path.parts) == 1:
+        path = results_dir() / (name_or_path if name_or_path.endswith(".json") else f"{name_or_path}.json")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    Bucket cases by ratio = current / baseline of the per-call minimum.
+    Moves beyond ``threshold`` are regressions or improvements. Cases in only
+    one run (filtered out, or added since) are listed as "not_run" / "new".
+    """
+    out: Dict[str, List[Tuple[str, float]]] = {"regressions": [], "improvements": [], "unchanged": [], "not_run": [], "new": []}
+    out["new"] = [(key, float("nan")) for key in current["results"] if key not in baseline["results"]]
+    for key, old in baseline["results"].items():
+        new = current["results"].get(key)
+        if new is None:
+            out["not_run"].append((key, float("nan")))
+            continue
+        ratio = new["min_s"] / old["min_s"] if old["min_s"] > 0 else float("inf")
+        bucket = "regressions" if ratio > 1 + threshold else "improvements" if ratio < 1 - threshold else "unchanged"
+        out[bucket].append((key, ratio))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="comma-separated substrings of case names")
+    parser.add_argument("--quick", action="store_true", help="smallest size of each case only")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per sample")
+    parser.add_argument("--output", default=None, help="result file (default: experiments/benchmarks/run-<ts>.json)")
+    parser.add_argument("--baseline", default=None, help="result file or name to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown flagged as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="also store this run as benchmarks/baseline.json")
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for bench in CASES:
+            print(f"{bench.name:<36} sizes={list(bench.sizes)}")
+        return
+
+    report = run([f for f in args.filter.split(",") if f], args.quick, args.repeat, args.min_time)
+    path = save(report, Path(args.output) if args.output else None)
+    print(f"\nResults written to {path}")
+    if args.save_baseline:
+        print(f"Baseline written to {save(report, results_dir() / 'baseline.json')}")
+
+    if args.baseline:
+        diff = compare(report, load(args.baseline), args.threshold)
+        for bucket in ("regressions", "improvements"):
+            for key, ratio in sorted(diff[bucket], key=lambda kv: -kv[1]):
+                print(f"{bucket[:-1].upper():<12} {key:<44} x{ratio:.2f}")
+        print(f"{len(diff['regressions'])} regression(s), {len(diff['improvements'])} improvement(s), "
+              f"{len(diff['unchanged'])} unchanged, {len(diff['new'])} new, {len(diff['not_run'])} not run "
+              f"(threshold {args.threshold:.0%}).")
+        if diff["regressions"]:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,43 +2,81 @@
 """
 Brass Section — Decision Forests & Boosting
 Author: Marcos Paulo Pazzinatto | License: MIT
+
+Models come from the native histogram tree engine in brass/trees.py.
 """
 
-from typing import Any, Dict, Optional, List
-from orchestrAIframework.common.logging import log_message
+from typing import Any, Dict, Optional
+from orchestrAIframework.common.logging import log_enabled, log_message
 from orchestrAIframework.interfaces.section_protocol import Section
 
 class Brass(Section):
     """
     Crisp decisions on tabular data.
-    Backends (future): RandomForest, XGBoost, LightGBM, CatBoost.
+    Backends: native histogram RandomForest ("forest") and gradient boosting
+    ("boosting"); future: XGBoost, LightGBM, CatBoost adapters.
     """
 
     def __init__(self, name: str = "Brass"):
         self.name = name
         self.model_type: str = "forest"
         self.model: Optional[Any] = None
+        self.compiled: Optional[Any] = None  # CompiledEnsemble used by predict()
         self.config: Dict[str, Any] = {}
         log_message("info", f"[Brass] Initialized section: {self.name}")
 
     def load_model(self, model_type: str = "forest", **kwargs) -> None:
+        """
+        Create an unfitted model: "forest" (RandomForest) or "boosting"
+        (GradientBoosting). ``kwargs`` go to the estimator, e.g. objective="binary",
+        n_estimators=200, max_leaves=31, n_jobs=4.
+        """
+        from orchestrAIframework.brass.trees import make_model
+
+        self.model = make_model(model_type, **kwargs)
         self.model_type = model_type
         self.config = kwargs
-        # self.model = ... (plug real estimator later)
         log_message("info", f"[Brass] Model set to '{model_type}' with config={kwargs}")
 
-    def fit(self, X: List[List[float]], y: List[float]) -> None:
+    def fit(self, X: Any, y: Any) -> None:
         if self.model is None:
             log_message("warning", "[Brass] No model loaded. Use load_model() first.")
             return
-        log_message("info", f"[Brass] Fitting '{self.model_type}' (stub).")
+        from orchestrAIframework.brass.compiled import compile_ensemble
 
-    def predict(self, X: List[List[float]]) -> List[float]:
-        if self.model is None:
-            log_message("warning", "[Brass] No model loaded. Returning zeros (stub).")
+        self.model.fit(X, y)
+        self.compiled = compile_ensemble(self.model)
+        log_message("info", f"[Brass] Fitted '{self.model_type}' with {len(self.model.trees)} trees.")
+
+    def predict(self, X: Any) -> Any:
+        """
+        Predictions from the compiled ensemble (probabilities for objective="binary").
+        Takes a NumPy matrix directly; a list input gets a list back.
+        """
+        if self.compiled is None:
+            log_message("warning", "[Brass] No fitted model. Returning zeros.")
             return [0.0 for _ in X]
-        log_message("info", f"[Brass] Predicting with '{self.model_type}' (stub).")
-        return [0.0 for _ in X]
+        preds = self.compiled.predict(X)
+        if log_enabled("info"):
+            log_message("info", f"[Brass] Predicted {len(preds)} rows with '{self.model_type}'.")
+        return preds.tolist() if isinstance(X, list) else preds
+
+    # --- Compiled model persistence (see brass/compiled.py) ---
+    def save_model(self, name: str) -> Any:
+        """Save the flattened ensemble under ORCH_PATHS["models"]/ensembles/<name>."""
+        if self.compiled is None:
+            raise RuntimeError("No fitted model to save. Use fit() first.")
+        path = self.compiled.save(name)
+        log_message("info", f"[Brass] Saved compiled '{self.model_type}' to {path}.")
+        return path
+
+    def load_compiled(self, name: str, mmap: bool = True) -> Any:
+        """Serve predict() from a saved ensemble; with ``mmap`` the arrays are mapped, not read."""
+        from orchestrAIframework.brass.compiled import CompiledEnsemble
+
+        self.compiled = CompiledEnsemble.load(name, mmap=mmap)
+        log_message("info", f"[Brass] Loaded compiled ensemble '{name}' ({self.compiled.n_trees} trees).")
+        return self.compiled
 
     def perform(self, score: Optional[Dict[str, Any]] = None) -> None:
         log_message("info", f"[Brass] Performing decision task...")
@@ -0,0 +1,180 @@
+# orchestrAIframework/brass/compiled.py
+"""
+OrchestrAIFramework - Brass Compiled Ensembles
+----------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Flat, inference-only form of a fitted tree ensemble.
+
+- Every tree is concatenated into five contiguous arrays: feature,
+  threshold, left, right and value. ``roots`` holds each tree's first node.
+- Siblings are adjacent (``right == left + 1``), so one step is
+  ``node = left[node] + (x > threshold[node])``. Leaves point to themselves
+  with an infinite threshold and stay put. A batch steps all trees and rows
+  together level by level with gathers and comparisons only, with no masks
+  and no Python per node. Trees are stored deepest first, so each level
+  only touches the trees that are still that deep.
+- Raw float thresholds are stored, so inputs need no binning. NaN is read
+  as +inf and goes right, matching the training bins.
+- The arrays save as ``.npy`` files plus ``meta.json`` under
+  ORCH_PATHS["models"]/ensembles. ``CompiledEnsemble.load`` memory-maps
+  them, so a worker starts in milliseconds and shares pages with its
+  siblings.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import numpy as np
+
+from orchestrAIframework.common.paths import get_path
+
+ARRAYS = ("feature", "threshold", "left", "right", "value", "roots", "tree_depth")
+LINKS = ("identity", "sigmoid")
+
+
+class CompiledEnsemble:
+    """Vectorized batch scorer over flattened trees."""
+
+    def __init__(
+        self,
+        arrays: Dict[str, np.ndarray],
+        depth: int,
+        n_features: int,
+        base_score: float = 0.0,
+        scale: float = 1.0,
+        link: str = "identity",
+        block_rows: int = 8192,
+    ):
+        if link not in LINKS:
+            raise ValueError(f"Unknown link '{link}'. Choose from {LINKS}.")
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+        self.depth = depth
+        self.n_features = n_features
+        self.base_score = base_score
+        self.scale = scale
+        self.link = link
+        self.block_rows = block_rows
+
+    @property
+    def n_trees(self) -> int:
+        return self.roots.size
+
+    @property
+    def n_nodes(self) -> int:
+        return self.feature.size
+
+    # --- Scoring ---
+    def predict_raw(self, X: Any) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1) if X.size == self.n_features else X.reshape(-1, 1)
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {X.shape[1]}.")
+        out = np.empty(X.shape[0], dtype=np.float64)
+        feature, threshold, left, value = self.feature, self.threshold, self.left, self.value
+        # Trees are stored deepest first, so level L only steps the first active[L] trees.
+        active = [int(np.sum(self.tree_depth > level)) for level in range(self.depth)]
+        for start in range(0, X.shape[0], self.block_rows):
+            block = X[start:start + self.block_rows]
+            n = block.shape[0]
+            # Feature-major copy: value (row, f) sits at f * n + row. NaN routes right like +inf.
+            flat = np.nan_to_num(block.T, nan=np.inf).ravel()
+            rows = np.arange(n, dtype=np.intp)
+            nodes = np.repeat(self.roots[:, None], n, axis=1)
+            for width in active:
+                current = nodes[:width]
+                x = flat[feature[current] * n + rows]
+                nodes[:width] = left[current] + (x > threshold[current])
+            out[start:start + n] = value[nodes].sum(axis=0)
+        return self.base_score + self.scale * out
+
+    def predict(self, X: Any) -> np.ndarray:
+        raw = self.predict_raw(X)
+        return 1.0 / (1.0 + np.exp(-raw)) if self.link == "sigmoid" else raw
+
+    # --- Persistence ---
+    def save(self, name_or_dir: Union[str, Path]) -> Path:
+        """Write the flat arrays next to the old ones and swap them in with ``os.replace``."""
+        directory = ensemble_dir(name_or_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            tmp = directory / f".{name}.npy.tmp"
+            with open(tmp, "wb") as fh:
+                np.save(fh, getattr(self, name))
+            os.replace(tmp, directory / f"{name}.npy")
+        meta = {
+            "depth": self.depth, "n_features": self.n_features, "base_score": self.base_score,
+            "scale": self.scale, "link": self.link, "n_trees": self.n_trees, "n_nodes": self.n_nodes,
+        }
+        tmp = directory / ".meta.json.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, directory / "meta.json")
+        return directory
+
+    @classmethod
+    def load(cls, name_or_dir: Union[str, Path], mmap: bool = True) -> "CompiledEnsemble":
+        directory = ensemble_dir(name_or_dir)
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        mode = "r" if mmap else None
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode=mode) for name in ARRAYS}
+        return cls(arrays, meta["depth"], meta["n_features"], meta["base_score"], meta["scale"], meta["link"])
+
+
+def compile_ensemble(model: Any) -> CompiledEnsemble:
+    """Flatten a fitted RandomForest or GradientBoosting (see brass/trees.py)."""
+    if not getattr(model, "trees", None):
+        raise RuntimeError("Cannot compile an unfitted model.")
+    depths = [_depth(tree) for tree in model.trees]
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    for i in np.argsort(depths, kind="stable")[::-1]:
+        tree = model.trees[i]
+        n = len(tree)
+        leaf = tree.feature < 0
+        if np.any(tree.right[~leaf] != tree.left[~leaf] + 1):
+            raise ValueError("Compiled ensembles need sibling nodes stored next to each other.")
+        own = np.arange(offset, offset + n, dtype=np.int64)
+        features.append(np.where(leaf, 0, tree.feature).astype(np.int64))
+        thresholds.append(np.where(leaf, np.inf, tree.threshold))
+        lefts.append(np.where(leaf, own, tree.left + offset).astype(np.int64))
+        rights.append(np.where(leaf, own, tree.right + offset).astype(np.int64))
+        values.append(tree.value.astype(np.float64))
+        roots.append(offset)
+        offset += n
+
+    forest = type(model).__name__ == "RandomForest"
+    arrays = {
+        "feature": np.concatenate(features), "threshold": np.concatenate(thresholds),
+        "left": np.concatenate(lefts), "right": np.concatenate(rights),
+        "value": np.concatenate(values), "roots": np.asarray(roots, dtype=np.int64),
+        "tree_depth": np.sort(np.asarray(depths, dtype=np.int64))[::-1].copy(),
+    }
+    return CompiledEnsemble(
+        arrays,
+        depth=max(depths),
+        n_features=model.n_features,
+        base_score=0.0 if forest else float(model.base_score),
+        scale=1.0 / len(model.trees) if forest else 1.0,
+        link="sigmoid" if (not forest and model.objective == "binary") else "identity",
+    )
+
+
+def _depth(tree: Any) -> int:
+    """Longest root-to-leaf path; children are always created after their parent."""
+    node_depth = np.zeros(len(tree), dtype=np.int64)
+    for node in np.flatnonzero(tree.feature >= 0):
+        node_depth[tree.left[node]] = node_depth[tree.right[node]] = node_depth[node] + 1
+    return int(node_depth.max())
+
+
+def ensemble_dir(name_or_dir: Union[str, Path]) -> Path:
+    """Plain names live under ORCH_PATHS['models']/ensembles; paths are used as given."""
+    path = Path(name_or_dir)
+    if path.is_absolute() or len(path.parts) > 1:
+        return path
+    return get_path("models") / "ensembles" / str(name_or_dir)
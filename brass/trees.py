@@ -0,0 +1,432 @@
+# orchestrAIframework/brass/trees.py
+"""
+OrchestrAIFramework - Brass Tree Ensembles
+------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Native histogram-based decision forests and gradient boosting.
+
+- Binner maps every feature to at most 255 quantile bins once, stored as a
+  column-major uint8 matrix. Split finding only ever reads the bins.
+- A node's split search works on per-feature gradient/hessian/count
+  histograms. After a split only the smaller child is histogrammed; the
+  larger child is the parent minus the smaller one (histogram subtraction).
+- Trees grow best-first under a leaf budget (``max_leaves``) or depth-first
+  otherwise, so at most a root-to-leaf path of histograms is alive at once.
+- GradientBoosting fits squared-error or logistic trees sequentially with
+  Newton leaf values and L2 regularization. RandomForest fits bootstrap
+  trees with per-split feature sampling; trees are built in parallel worker
+  processes that receive the binned matrix once.
+"""
+
+import heapq
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+OBJECTIVES = ("regression", "binary")
+
+
+class Binner:
+    """Per-feature quantile bin edges; ``transform`` yields uint8 bin codes."""
+
+    def __init__(self, max_bins: int = 255, sample_size: int = 200_000, seed: int = 0):
+        if not 2 <= max_bins <= 255:
+            raise ValueError("max_bins must be between 2 and 255.")
+        self.max_bins = max_bins
+        self.sample_size = sample_size
+        self.seed = seed
+        self.edges: List[np.ndarray] = []
+
+    def fit(self, X: np.ndarray) -> "Binner":
+        rng = np.random.default_rng(self.seed)
+        sample = X[rng.choice(X.shape[0], self.sample_size, replace=False)] if X.shape[0] > self.sample_size else X
+        quantiles = np.linspace(0.0, 1.0, self.max_bins + 1)[1:-1]
+        self.edges = []
+        for f in range(X.shape[1]):
+            column = sample[:, f]
+            column = column[~np.isnan(column)]
+            distinct = np.unique(column)
+            if distinct.size <= self.max_bins - 1:
+                # Few distinct values: split exactly between neighbours.
+                edges = (distinct[:-1] + distinct[1:]) / 2.0 if distinct.size > 1 else distinct[:0]
+            else:
+                edges = np.unique(np.quantile(column, quantiles))
+            self.edges.append(edges.astype(np.float64))
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Column-major uint8 codes; bin b holds values in (edges[b-1], edges[b]]. NaN goes to the last bin."""
+        out = np.empty(X.shape, dtype=np.uint8, order="F")
+        for f, edges in enumerate(self.edges):
+            out[:, f] = np.searchsorted(edges, X[:, f], side="left")
+        return out
+
+    @property
+    def n_bins(self) -> int:
+        return max((e.size + 1 for e in self.edges), default=1)
+
+
+class Tree:
+    """Flat node arrays; a node with ``feature == -1`` is a leaf."""
+
+    def __init__(self, feature, threshold_bin, threshold, left, right, value):
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold_bin = np.asarray(threshold_bin, dtype=np.uint8)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.value = np.asarray(value, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self.feature.size
+
+    @property
+    def n_leaves(self) -> int:
+        return int(np.sum(self.feature < 0))
+
+    def predict_binned(self, Xb: np.ndarray) -> np.ndarray:
+        """Route all rows down together, one level per iteration."""
+        node = np.zeros(Xb.shape[0], dtype=np.int32)
+        rows = np.arange(Xb.shape[0])
+        while rows.size:
+            current = node[rows]
+            feature = self.feature[current]
+            internal = feature >= 0
+            rows, current, feature = rows[internal], current[internal], feature[internal]
+            go_left = Xb[rows, feature] <= self.threshold_bin[current]
+            node[rows] = np.where(go_left, self.left[current], self.right[current])
+        return self.value[node]
+
+
+def _histograms(Xb: np.ndarray, rows: np.ndarray, g: np.ndarray, h: Optional[np.ndarray], n_bins: int) -> np.ndarray:
+    """(3, n_features, n_bins) gradient, hessian and count histograms of ``rows``."""
+    hist = np.empty((3, Xb.shape[1], n_bins), dtype=np.float64)
+    g_rows = g[rows]
+    h_rows = h[rows] if h is not None else None
+    for f in range(Xb.shape[1]):
+        codes = Xb[rows, f]
+        hist[0, f] = np.bincount(codes, weights=g_rows, minlength=n_bins)
+        hist[2, f] = np.bincount(codes, minlength=n_bins)
+        hist[1, f] = np.bincount(codes, weights=h_rows, minlength=n_bins) if h_rows is not None else hist[2, f]
+    return hist
+
+
+def _best_split(hist: np.ndarray, params: Dict[str, Any], rng: np.random.Generator) -> Tuple[float, int, int]:
+    """(gain, feature, bin) of the best split; gain is -inf when nothing is valid."""
+    G, H, C = hist[0, 0].sum(), hist[1, 0].sum(), hist[2, 0].sum()
+    left = np.cumsum(hist, axis=2)[:, :, :-1]
+    GL, HL, CL = left[0], left[1], left[2]
+    GR, HR, CR = G - GL, H - HL, C - CL
+    lam = params["l2"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gain = GL * GL / (HL + lam) + GR * GR / (HR + lam) - G * G / (H + lam)
+    msl = params["min_samples_leaf"]
+    invalid = (CL < msl) | (CR < msl) | (HL < params["min_child_weight"]) | (HR < params["min_child_weight"])
+    gain[invalid | np.isnan(gain)] = -np.inf
+
+    n_features = params["features_per_split"]
+    if n_features < gain.shape[0]:
+        banned = np.ones(gain.shape[0], dtype=bool)
+        banned[rng.choice(gain.shape[0], n_features, replace=False)] = False
+        gain[banned] = -np.inf
+    flat = int(np.argmax(gain))
+    f, b = divmod(flat, gain.shape[1])
+    return float(gain[f, b]), f, b
+
+
+def grow_tree(
+    Xb: np.ndarray,
+    g: np.ndarray,
+    h: Optional[np.ndarray],
+    rows: np.ndarray,
+    edges: List[np.ndarray],
+    params: Dict[str, Any],
+    rng: np.random.Generator,
+) -> Tree:
+    """
+    Grow one tree on gradients ``g`` and hessians ``h`` (None means all ones)
+    restricted to ``rows``. Leaf values are Newton steps -G / (H + l2).
+    """
+    n_bins = params["n_bins"]
+    max_leaves = params["max_leaves"]
+    max_depth = params["max_depth"] or np.inf
+    lam = params["l2"]
+    feature: List[int] = []
+    threshold_bin: List[int] = []
+    left: List[int] = []
+    right: List[int] = []
+    value: List[float] = []
+
+    def new_node(hist: np.ndarray) -> int:
+        feature.append(-1)
+        threshold_bin.append(0)
+        left.append(-1)
+        right.append(-1)
+        value.append(-hist[0, 0].sum() / (hist[1, 0].sum() + lam))
+        return len(feature) - 1
+
+    # Best-first under a leaf budget, depth-first otherwise (bounded live histograms).
+    pending: List[Tuple[float, int, int, int, int, np.ndarray, np.ndarray]] = []
+    push = heapq.heappush if max_leaves else (lambda heap, item: heap.append(item))
+    pop = heapq.heappop if max_leaves else (lambda heap: heap.pop())
+    order = 0
+
+    def consider(node: int, depth: int, node_rows: np.ndarray, hist: np.ndarray) -> None:
+        nonlocal order
+        if depth >= max_depth or node_rows.size < 2 * params["min_samples_leaf"]:
+            return
+        gain, f, b = _best_split(hist, params, rng)
+        if gain > params["min_gain"]:
+            order += 1
+            push(pending, (-gain, order, node, depth, f * 256 + b, node_rows, hist))
+
+    root_hist = _histograms(Xb, rows, g, h, n_bins)
+    consider(new_node(root_hist), 0, rows, root_hist)
+    n_leaves = 1
+    while pending and (not max_leaves or n_leaves < max_leaves):
+        _, _, node, depth, packed, node_rows, hist = pop(pending)
+        f, b = divmod(packed, 256)
+        go_left = Xb[node_rows, f] <= b
+        left_rows, right_rows = node_rows[go_left], node_rows[~go_left]
+        if left_rows.size <= right_rows.size:
+            left_hist = _histograms(Xb, left_rows, g, h, n_bins)
+            right_hist = hist - left_hist
+        else:
+            right_hist = _histograms(Xb, right_rows, g, h, n_bins)
+            left_hist = hist - right_hist
+        del hist
+
+        feature[node], threshold_bin[node] = f, b
+        left[node] = new_node(left_hist)
+        right[node] = new_node(right_hist)
+        n_leaves += 1
+        consider(left[node], depth + 1, left_rows, left_hist)
+        consider(right[node], depth + 1, right_rows, right_hist)
+
+    thresholds = [
+        edges[f][b] if f >= 0 and b < edges[f].size else np.inf for f, b in zip(feature, threshold_bin)
+    ]
+    return Tree(feature, threshold_bin, thresholds, left, right, value)
+
+
+def _as_matrix(X: Any) -> np.ndarray:
+    X = np.asarray(X, dtype=np.float64)
+    return X.reshape(-1, 1) if X.ndim == 1 else X
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+class _Ensemble(ABC):
+    """Shared binning, validation and prediction plumbing."""
+
+    def __init__(self, objective: str, max_bins: int, seed: int):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}'. Choose from {OBJECTIVES}.")
+        self.objective = objective
+        self.max_bins = max_bins
+        self.seed = seed
+        self.binner: Optional[Binner] = None
+        self.trees: List[Tree] = []
+        self.base_score = 0.0
+
+    def _bin(self, X: Any, y: Any) -> Tuple[np.ndarray, np.ndarray]:
+        X = _as_matrix(X)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if X.shape[0] != y.size or y.size == 0:
+            raise ValueError("X and y must be non-empty and have the same number of rows.")
+        if self.objective == "binary" and not np.isin(y, (0.0, 1.0)).all():
+            raise ValueError("The 'binary' objective expects 0/1 labels.")
+        self.binner = Binner(self.max_bins, seed=self.seed).fit(X)
+        return self.binner.transform(X), y
+
+    @abstractmethod
+    def _params(self, n_features: int) -> Dict[str, Any]:
+        """Tree-growing parameters for data with ``n_features`` columns."""
+        raise NotImplementedError
+
+    def predict_raw(self, X: Any) -> np.ndarray:
+        if self.binner is None:
+            raise RuntimeError(f"{type(self).__name__} is not fitted.")
+        return self._combine(self.binner.transform(_as_matrix(X)))
+
+    @abstractmethod
+    def _combine(self, Xb: np.ndarray) -> np.ndarray:
+        """Raw ensemble output for a binned matrix."""
+        raise NotImplementedError
+
+    @property
+    def n_features(self) -> int:
+        return len(self.binner.edges) if self.binner is not None else 0
+
+
+class GradientBoosting(_Ensemble):
+    """Histogram gradient-boosted trees (squared error or logistic loss)."""
+
+    def __init__(
+        self,
+        objective: str = "regression",
+        n_estimators: int = 100,
+        learning_rate: float = 0.1,
+        max_leaves: Optional[int] = 31,
+        max_depth: Optional[int] = None,
+        min_samples_leaf: int = 20,
+        min_child_weight: float = 1e-3,
+        l2: float = 1.0,
+        min_gain: float = 0.0,
+        subsample: float = 1.0,
+        max_bins: int = 255,
+        seed: int = 0,
+    ):
+        super().__init__(objective, max_bins, seed)
+        self.n_estimators = n_estimators
+        self.learning_rate = learning_rate
+        self.max_leaves = max_leaves
+        self.max_depth = max_depth
+        self.min_samples_leaf = min_samples_leaf
+        self.min_child_weight = min_child_weight
+        self.l2 = l2
+        self.min_gain = min_gain
+        self.subsample = subsample
+
+    def _params(self, n_features: int) -> Dict[str, Any]:
+        return {
+            "n_bins": self.binner.n_bins, "max_leaves": self.max_leaves, "max_depth": self.max_depth,
+            "min_samples_leaf": self.min_samples_leaf, "min_child_weight": self.min_child_weight,
+            "l2": self.l2, "min_gain": self.min_gain, "features_per_split": n_features,
+        }
+
+    def fit(self, X: Any, y: Any) -> "GradientBoosting":
+        Xb, y = self._bin(X, y)
+        n = y.size
+        params = self._params(Xb.shape[1])
+        rng = np.random.default_rng(self.seed)
+        if self.objective == "binary":
+            p = np.clip(y.mean(), 1e-6, 1 - 1e-6)
+            self.base_score = float(np.log(p / (1 - p)))
+        else:
+            self.base_score = float(y.mean())
+        raw = np.full(n, self.base_score)
+        all_rows = np.arange(n, dtype=np.int64)
+        self.trees = []
+        for _ in range(self.n_estimators):
+            if self.objective == "binary":
+                p = _sigmoid(raw)
+                g, h = p - y, p * (1.0 - p)
+            else:
+                g, h = raw - y, None
+            rows = all_rows if self.subsample >= 1.0 else np.sort(rng.choice(n, int(self.subsample * n), replace=False))
+            tree = grow_tree(Xb, g, h, rows, self.binner.edges, params, rng)
+            tree.value *= self.learning_rate
+            self.trees.append(tree)
+            raw += tree.predict_binned(Xb)
+        return self
+
+    def _combine(self, Xb: np.ndarray) -> np.ndarray:
+        raw = np.full(Xb.shape[0], self.base_score)
+        for tree in self.trees:
+            raw += tree.predict_binned(Xb)
+        return raw
+
+    def predict(self, X: Any) -> np.ndarray:
+        raw = self.predict_raw(X)
+        return _sigmoid(raw) if self.objective == "binary" else raw
+
+
+class RandomForest(_Ensemble):
+    """Bootstrap-aggregated histogram trees with per-split feature sampling."""
+
+    def __init__(
+        self,
+        objective: str = "regression",
+        n_estimators: int = 100,
+        max_depth: Optional[int] = 10,
+        max_leaves: Optional[int] = None,
+        min_samples_leaf: int = 5,
+        max_features: Union[str, float, int] = "sqrt",
+        min_gain: float = 0.0,
+        max_bins: int = 255,
+        n_jobs: Optional[int] = None,
+        seed: int = 0,
+    ):
+        super().__init__(objective, max_bins, seed)
+        self.n_estimators = n_estimators
+        self.max_depth = max_depth
+        self.max_leaves = max_leaves
+        self.min_samples_leaf = min_samples_leaf
+        self.max_features = max_features
+        self.min_gain = min_gain
+        self.n_jobs = n_jobs
+
+    def _params(self, n_features: int) -> Dict[str, Any]:
+        if self.max_features == "sqrt":
+            per_split = int(np.sqrt(n_features))
+        elif isinstance(self.max_features, float):
+            per_split = int(self.max_features * n_features)
+        else:
+            per_split = int(self.max_features)
+        return {
+            "n_bins": self.binner.n_bins, "max_leaves": self.max_leaves, "max_depth": self.max_depth,
+            "min_samples_leaf": self.min_samples_leaf, "min_child_weight": 0.0, "l2": 0.0,
+            "min_gain": self.min_gain, "features_per_split": max(1, min(per_split, n_features)),
+        }
+
+    def fit(self, X: Any, y: Any) -> "RandomForest":
+        Xb, y = self._bin(X, y)
+        params = self._params(Xb.shape[1])
+        seeds = np.random.SeedSequence(self.seed).spawn(self.n_estimators)
+        jobs = min(self.n_jobs or os.cpu_count() or 1, self.n_estimators)
+        if jobs <= 1:
+            _init_worker(Xb, y, self.binner.edges, params)
+            self.trees = [_forest_tree(s) for s in seeds]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker, initargs=(Xb, y, self.binner.edges, params)
+            ) as pool:
+                self.trees = list(pool.map(_forest_tree, seeds))
+        _init_worker(None, None, None, None)
+        return self
+
+    def _combine(self, Xb: np.ndarray) -> np.ndarray:
+        total = np.zeros(Xb.shape[0])
+        for tree in self.trees:
+            total += tree.predict_binned(Xb)
+        return total / max(len(self.trees), 1)
+
+    def predict(self, X: Any) -> np.ndarray:
+        return self.predict_raw(X)
+
+
+# --- Forest workers: the binned matrix is shipped once per process ---
+_worker_data: Dict[str, Any] = {}
+
+
+def _init_worker(Xb: Optional[np.ndarray], y: Optional[np.ndarray], edges: Any, params: Any) -> None:
+    _worker_data.clear()
+    if Xb is not None:
+        _worker_data.update(Xb=Xb, y=y, edges=edges, params=params)
+
+
+def _forest_tree(seed: np.random.SeedSequence) -> Tree:
+    Xb, y = _worker_data["Xb"], _worker_data["y"]
+    rng = np.random.default_rng(seed)
+    n = y.size
+    weights = np.bincount(rng.integers(0, n, n), minlength=n).astype(np.float64)
+    rows = np.flatnonzero(weights)
+    # Squared error around zero: the leaf value -G/H is the bootstrap-weighted mean of y.
+    return grow_tree(Xb, -y * weights, weights, rows, _worker_data["edges"], _worker_data["params"], rng)
+
+
+MODELS = {"forest": RandomForest, "boosting": GradientBoosting}
+
+
+def make_model(model_type: str, **kwargs) -> Any:
+    if model_type not in MODELS:
+        raise ValueError(f"Unknown model type '{model_type}'. Choose from {sorted(MODELS)}.")
+    return MODELS[model_type](**kwargs)
@@ -5,27 +5,114 @@ Author: Marcos Paulo Pazzinatto | License: MIT
 """
 
 from typing import Any, Dict, List, Optional
-from orchestrAIframework.common.logging import log_message
+from orchestrAIframework.common.logging import log_enabled, log_message
 from orchestrAIframework.interfaces.section_protocol import Section
 
 class Choir(Section):
     """
     Metrics registry, slice analysis, and simple reporting.
+    Backends: in-project sharded registry (choir/metrics.py) with counters,
+    gauges and DDSketch histograms, safe to update from any section thread;
+    chunked, vectorized slice evaluation (choir/slices.py).
     """
 
     def __init__(self, name: str = "Choir"):
         self.name = name
-        self.metrics: Dict[str, float] = {}
+        self.metrics: Dict[str, float] = {}  # last value logged per key
+        self.registry: Optional[Any] = None  # MetricsRegistry, created on first use
+        self.evaluator: Optional[Any] = None  # SliceEvaluator fed by update_slices()
         log_message("info", f"[Choir] Initialized section: {self.name}")
 
+    def configure(self, **kwargs) -> None:
+        """
+        Recognized keys: ``relative_accuracy`` (sketch error, default 0.01), ``quantiles``.
+        Recorded metrics and handles already given out stay live: new quantiles apply to
+        the next ``summary()``, a new accuracy to histograms created from now on.
+        """
+        registry = self._registry()
+        if "relative_accuracy" in kwargs:
+            registry.relative_accuracy = float(kwargs["relative_accuracy"])
+        if "quantiles" in kwargs:
+            registry.quantiles = tuple(kwargs["quantiles"])
+        log_message("info", f"[Choir] Configured with {kwargs}")
+
+    # --- Registry (see choir/metrics.py) ---
+    def _registry(self) -> Any:
+        if self.registry is None:
+            from orchestrAIframework.choir.metrics import MetricsRegistry
+
+            self.registry = MetricsRegistry()
+        return self.registry
+
+    def counter(self, name: str, window_s: Optional[float] = None, slices: int = 6) -> Any:
+        """Handle with ``inc(n)``; keep it and call it from hot loops."""
+        return self._registry().counter(name, window_s, slices)
+
+    def gauge(self, name: str) -> Any:
+        return self._registry().gauge(name)
+
+    def histogram(self, name: str, window_s: Optional[float] = None, slices: int = 6) -> Any:
+        """Handle with ``observe(v)``, ``observe_many(array)`` and ``time()``."""
+        return self._registry().histogram(name, window_s, slices)
+
     def log_metric(self, key: str, value: float) -> None:
+        """Record ``value`` in the ``key`` histogram and remember it as the latest value."""
         self.metrics[key] = value
-        log_message("info", f"[Choir] metric {key}={value}")
+        self._registry().histogram(key).observe(value)
+        if log_enabled("debug"):
+            log_message("debug", f"[Choir] metric {key}={value}")
+
+    # --- Slice evaluation (see choir/slices.py) ---
+    def slice_evaluator(self, slice_columns: List[str], **kwargs) -> Any:
+        """Start a chunked evaluation; options: intersections, threshold, score_bins, calibration_bins."""
+        from orchestrAIframework.choir.slices import SliceEvaluator
+
+        self.evaluator = SliceEvaluator(slice_columns, **kwargs)
+        log_message("info", f"[Choir] Slice evaluator over {slice_columns} ({len(self.evaluator.specs) - 1} slice specs).")
+        return self.evaluator
+
+    def update_slices(self, labels: Any, predictions: Any, slices: Dict[str, Any]) -> None:
+        """Feed one chunk of labels, predictions and slice keys."""
+        if self.evaluator is None:
+            raise RuntimeError("No slice evaluator. Use slice_evaluator() first.")
+        self.evaluator.update(labels, predictions, slices)
+
+    def slice_results(self, min_count: int = 0) -> Dict[str, Dict[str, Any]]:
+        """Per-slice metrics; overall accuracy/auc/log_loss/ece are also logged as metrics."""
+        if self.evaluator is None:
+            raise RuntimeError("No slice evaluator. Use slice_evaluator() first.")
+        from orchestrAIframework.choir.slices import ALL
+
+        results = self.evaluator.results(min_count)
+        overall = results[ALL]
+        for metric in ("accuracy", "auc", "log_loss", "ece"):
+            if overall["count"].size:
+                self.log_metric(f"eval.{metric}", float(overall[metric][0]))
+        log_message("info", f"[Choir] Evaluated {self.evaluator.rows_seen} rows over {sum(len(r['keys']) for r in results.values())} slices.")
+        return results
+
+    def evaluate_slices(self, labels: Any, predictions: Any, slices: Dict[str, Any], chunk_size: int = 1_000_000, **kwargs) -> Dict[str, Dict[str, Any]]:
+        """In-memory arrays, processed in ``chunk_size`` chunks."""
+        self.slice_evaluator(list(slices), **kwargs)
+        for start in range(0, len(labels), chunk_size):
+            end = start + chunk_size
+            self.update_slices(labels[start:end], predictions[start:end], {c: v[start:end] for c, v in slices.items()})
+        return self.slice_results()
 
     def report(self) -> Dict[str, float]:
-        log_message("info", f"[Choir] report -> {self.metrics}")
+        """Latest value logged per key (see ``summary`` for the full distributions)."""
+        if log_enabled("info"):
+            log_message("info", f"[Choir] report -> {self.metrics}")
         return dict(self.metrics)
 
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Merged view of every registry metric; histograms fed by log_metric() also carry ``last``."""
+        summary = self._registry().report()
+        for key, value in self.metrics.items():
+            if key in summary:
+                summary[key]["last"] = value
+        return summary
+
     def perform(self, score: Optional[Dict[str, Any]] = None) -> None:
         log_message("info", "[Choir] Performing evaluation step...")
         # Example: aggregate a provided metric
@@ -34,4 +121,3 @@ class Choir(Section):
             self.log_metric(k, float(v))
         _ = self.report()
         log_message("success", f"[Choir] Section '{self.name}' completed performance.")
-
@@ -0,0 +1,336 @@
+# orchestrAIframework/choir/metrics.py
+"""
+OrchestrAIFramework - Choir Metrics Registry
+--------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Counters, gauges and quantile histograms with a lock-free hot path.
+
+- Every counter or histogram keeps one shard per writing thread, found
+  through a ``threading.local``. Updates touch only the calling thread's
+  shard: no shared lock, no contention. The registry lock is taken once
+  per (metric, thread), when the shard is created. ``report()`` merges the
+  shards. It reads them while writers keep going, so a report is a
+  snapshot that may miss updates still in flight.
+- Histograms are DDSketch-style log-bucketed sketches. Every quantile has
+  bounded relative error (default 1%), and a sketch is a dict of bucket
+  counts, so merging shards, windows or processes adds counts.
+  ``observe_many`` buckets a whole array with NumPy.
+- ``window_s`` adds rolling aggregates. A shard splits time into ``slices``
+  sub-windows. The writer rotates to a new slice when the clock crosses a
+  boundary and folds expired slices into a cumulative total. A report
+  merges the live slices for the window, and the total plus the slices for
+  the lifetime view.
+- Gauges hold a single value, last write wins. A plain attribute store is
+  atomic under the GIL, so they need no shards.
+"""
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class DDSketch:
+    """Relative-error quantile sketch (Masson et al. 2019), mergeable by bucket counts."""
+
+    __slots__ = ("alpha", "gamma", "_multiplier", "min_value", "max_bins", "pos", "neg", "zero", "count", "sum", "min", "max")
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9, max_bins: int = 2048):
+        self.alpha = relative_accuracy
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._multiplier = 1.0 / math.log(self.gamma)
+        self.min_value = min_value
+        self.max_bins = max_bins
+        self.pos: Dict[int, int] = {}
+        self.neg: Dict[int, int] = {}
+        self.zero = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value > self.min_value:
+            key = math.ceil(math.log(value) * self._multiplier)
+            self.pos[key] = self.pos.get(key, 0) + 1
+        elif value < -self.min_value:
+            key = math.ceil(math.log(-value) * self._multiplier)
+            self.neg[key] = self.neg.get(key, 0) + 1
+        else:
+            self.zero += 1
+
+    def add_many(self, values: Any) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        self.count += values.size
+        self.sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        for bins, part in ((self.pos, values[values > self.min_value]), (self.neg, -values[values < -self.min_value])):
+            if part.size:
+                keys, counts = np.unique(np.ceil(np.log(part) * self._multiplier).astype(np.int64), return_counts=True)
+                for key, n in zip(keys.tolist(), counts.tolist()):
+                    bins[key] = bins.get(key, 0) + n
+        self.zero += int(np.count_nonzero(np.abs(values) <= self.min_value))
+        self._collapse()
+
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy.")
+        for bins, theirs in ((self.pos, other.pos), (self.neg, other.neg)):
+            for key, n in list(theirs.items()):
+                bins[key] = bins.get(key, 0) + n
+        self.zero += other.zero
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._collapse()
+        return self
+
+    def _collapse(self) -> None:
+        """Fold the smallest-magnitude buckets together when over ``max_bins``."""
+        for bins in (self.pos, self.neg):
+            if len(bins) > self.max_bins:
+                keys = sorted(bins)
+                extra = keys[: len(keys) - self.max_bins + 1]
+                bins[extra[-1]] = sum(bins.pop(k) for k in extra)
+
+    def _value(self, key: int) -> float:
+        return 2.0 * self.gamma ** key / (self.gamma + 1.0)
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.neg, reverse=True):
+            seen += self.neg[key]
+            if seen > rank:
+                return max(self.min, -self._value(key))
+        seen += self.zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.pos):
+            seen += self.pos[key]
+            if seen > rank:
+                return min(self.max, max(self.min, self._value(key)))
+        return self.max
+
+    def summary(self, quantiles: Sequence[float] = QUANTILES) -> Dict[str, float]:
+        out = {
+            "count": self.count, "sum": self.sum,
+            "mean": self.sum / self.count if self.count else math.nan,
+            "min": self.min if self.count else math.nan, "max": self.max if self.count else math.nan,
+        }
+        for q in quantiles:
+            out[f"p{q * 100:g}"] = self.quantile(q)
+        return out
+
+
+class _Sum:
+    """Counter cell; same add/merge shape as DDSketch."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def add(self, n: float) -> None:
+        self.value += n
+
+    def merge(self, other: "_Sum") -> "_Sum":
+        self.value += other.value
+        return self
+
+
+class _Shard:
+    """One thread's state for one metric."""
+
+    __slots__ = ("current", "idx", "slices", "retired")
+
+    def __init__(self, cell: Any, retired: Any):
+        self.current = cell
+        self.idx = -1
+        self.slices: Dict[int, Any] = {}
+        self.retired = retired
+
+
+class _Metric:
+    """Per-thread sharded metric; subclasses pick the cell type."""
+
+    kind = "metric"
+
+    def __init__(self, name: str, factory: Callable[[], Any], window_s: Optional[float] = None, slices: int = 6):
+        self.name = name
+        self._factory = factory
+        self.window_s = window_s
+        self.slices = slices
+        self._slice_s = window_s / slices if window_s else None
+        self._tls = threading.local()
+        self._shards: List[_Shard] = []
+        self._lock = threading.Lock()
+
+    def _new_shard(self) -> _Shard:
+        shard = _Shard(self._factory(), self._factory())
+        with self._lock:
+            self._shards.append(shard)
+        self._tls.shard = shard
+        return shard
+
+    def _cell(self) -> Any:
+        """The calling thread's live cell (hot path)."""
+        try:
+            shard = self._tls.shard
+        except AttributeError:
+            shard = self._new_shard()
+        if self._slice_s is not None:
+            idx = int(time.monotonic() / self._slice_s)
+            if idx != shard.idx:
+                self._rotate(shard, idx)
+        return shard.current
+
+    def _rotate(self, shard: _Shard, idx: int) -> None:
+        shard.current = self._factory()
+        shard.slices[idx] = shard.current
+        shard.idx = idx
+        for old in [k for k in list(shard.slices) if k <= idx - self.slices]:
+            shard.retired.merge(shard.slices[old])
+            del shard.slices[old]
+
+    def _merged(self) -> Dict[str, Any]:
+        with self._lock:
+            shards = list(self._shards)
+        total, window = self._factory(), self._factory()
+        now = int(time.monotonic() / self._slice_s) if self._slice_s else 0
+        for shard in shards:
+            if self._slice_s is None:
+                total.merge(shard.current)
+                continue
+            total.merge(shard.retired)
+            for idx, cell in list(shard.slices.items()):
+                total.merge(cell)
+                if idx > now - self.slices:
+                    window.merge(cell)
+        return {"total": total, "window": window}
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, window_s: Optional[float] = None, slices: int = 6):
+        super().__init__(name, _Sum, window_s, slices)
+
+    def inc(self, n: float = 1.0) -> None:
+        self._cell().value += n
+
+    def summary(self, quantiles: Sequence[float] = QUANTILES) -> Dict[str, Any]:
+        merged = self._merged()
+        out: Dict[str, Any] = {"type": self.kind, "value": merged["total"].value}
+        if self.window_s:
+            value = merged["window"].value
+            out["window"] = {"seconds": self.window_s, "value": value, "rate_per_s": value / self.window_s}
+        return out
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, relative_accuracy: float = 0.01, window_s: Optional[float] = None, slices: int = 6):
+        super().__init__(name, lambda: DDSketch(relative_accuracy), window_s, slices)
+
+    def observe(self, value: float) -> None:
+        self._cell().add(value)
+
+    def observe_many(self, values: Any) -> None:
+        self._cell().add_many(values)
+
+    def time(self) -> "_Timer":
+        """``with histogram.time(): ...`` records the block's wall time in seconds."""
+        return _Timer(self)
+
+    def summary(self, quantiles: Sequence[float] = QUANTILES) -> Dict[str, Any]:
+        merged = self._merged()
+        out: Dict[str, Any] = {"type": self.kind, **merged["total"].summary(quantiles)}
+        if self.window_s:
+            out["window"] = {"seconds": self.window_s, **merged["window"].summary(quantiles)}
+        return out
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name: str):
+        self.name = name
+        self.value = math.nan
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def summary(self, quantiles: Sequence[float] = QUANTILES) -> Dict[str, Any]:
+        return {"type": self.kind, "value": self.value}
+
+
+class _Timer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms; ``report()`` merges every shard."""
+
+    def __init__(self, relative_accuracy: float = 0.01, quantiles: Sequence[float] = QUANTILES):
+        self.relative_accuracy = relative_accuracy
+        self.quantiles = tuple(quantiles)
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, cls: type, make: Callable[[], Any]) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = make()
+        if not isinstance(metric, cls):
+            raise ValueError(f"Metric '{name}' is a {metric.kind}, not a {cls.kind}.")
+        return metric
+
+    def counter(self, name: str, window_s: Optional[float] = None, slices: int = 6) -> Counter:
+        return self._get(name, Counter, lambda: Counter(name, window_s, slices))
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get(name, Gauge, lambda: Gauge(name))
+
+    def histogram(self, name: str, window_s: Optional[float] = None, slices: int = 6) -> Histogram:
+        return self._get(name, Histogram, lambda: Histogram(name, self.relative_accuracy, window_s, slices))
+
+    def names(self) -> List[str]:
+        return sorted(self._metrics)
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            metrics = list(self._metrics.items())
+        return {name: metric.summary(self.quantiles) for name, metric in sorted(metrics)}
@@ -0,0 +1,292 @@
+# orchestrAIframework/choir/slices.py
+"""
+OrchestrAIFramework - Choir Slice Evaluation
+--------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Accuracy, AUC, log-loss and calibration error per slice and per slice
+intersection, computed over columnar arrays in chunks.
+
+- Each slice column is factorized once per chunk. Integer keys in a
+  compact range go through a bincount presence map with no sort; other
+  keys use ``np.unique``. An intersection combines the column codes into
+  one int64 key by mixed radix and factorizes that key the same way.
+  Local groups are mapped to stable global ids, so chunks line up.
+- Every metric is then a ``np.bincount`` over group ids, with no Python
+  loop over rows. Each group accumulates count, correct predictions and
+  log-loss sum. It also keeps a fine score histogram: positives, rows and
+  sum of predictions per score bin.
+- AUC is read off the score histogram: P(score_pos > score_neg), with ties
+  inside a bin counted as one half. The error is bounded by the bin width,
+  set with ``score_bins``. Expected calibration error (ECE) regroups the
+  same histogram into ``calibration_bins`` equal-width bins. It is exact
+  when ``score_bins`` is a multiple of ``calibration_bins``.
+- State is O(groups x score_bins) whatever the row count. Feed any number
+  of chunks with ``update`` and read ``results`` at any time.
+- 2-D predictions of shape (n, classes) are treated as multiclass:
+  accuracy by argmax, log-loss on the true class, and top-label
+  calibration. AUC is NaN there.
+"""
+
+from itertools import combinations
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+ALL = "__all__"
+EPS = 1e-15
+
+
+def _dense_codes(keys: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(present keys, dense code per row) for int keys in [0, size), via a bincount presence map."""
+    present = np.flatnonzero(np.bincount(keys, minlength=size))
+    remap = np.empty(size, dtype=np.int64)
+    remap[present] = np.arange(present.size)
+    return present, remap[keys]
+
+
+def factorize(values: np.ndarray, dense_limit: int = 1 << 22) -> Tuple[np.ndarray, np.ndarray]:
+    """(uniques, codes). Integer keys in a compact range skip the sort."""
+    if values.dtype.kind in "iub" and values.size:
+        low, high = int(values.min()), int(values.max())
+        if high - low < dense_limit:
+            present, codes = _dense_codes(values.astype(np.int64) - low, high - low + 1)
+            return (present + low).astype(values.dtype), codes
+    return np.unique(values, return_inverse=True)
+
+
+class _SliceStats:
+    """Growable per-group accumulators for one slice spec (a tuple of columns)."""
+
+    def __init__(self, columns: Tuple[str, ...], score_bins: int):
+        self.columns = columns
+        self.score_bins = score_bins
+        self.index: Dict[Tuple[Any, ...], int] = {}
+        self.keys: List[Tuple[Any, ...]] = []
+        self.count = np.zeros(0, dtype=np.int64)
+        self.correct = np.zeros(0, dtype=np.float64)
+        self.log_loss = np.zeros(0, dtype=np.float64)
+        self.pos = np.zeros((0, score_bins), dtype=np.float64)
+        self.rows = np.zeros((0, score_bins), dtype=np.float64)
+        self.psum = np.zeros((0, score_bins), dtype=np.float64)
+
+    def _grow(self, groups: int) -> None:
+        if groups <= self.count.size:
+            return
+        size = max(groups, 2 * self.count.size, 8)
+        for name in ("count", "correct", "log_loss", "pos", "rows", "psum"):
+            old = getattr(self, name)
+            new = np.zeros((size,) + old.shape[1:], dtype=old.dtype)
+            new[: old.shape[0]] = old
+            setattr(self, name, new)
+
+    def global_ids(self, local_keys: List[Tuple[Any, ...]]) -> np.ndarray:
+        """Stable group id for each local key, registering new ones."""
+        out = np.empty(len(local_keys), dtype=np.int64)
+        for i, key in enumerate(local_keys):
+            gid = self.index.get(key)
+            if gid is None:
+                gid = self.index[key] = len(self.keys)
+                self.keys.append(key)
+            out[i] = gid
+        self._grow(len(self.keys))
+        return out
+
+    def add(self, groups: np.ndarray, correct: np.ndarray, log_loss: np.ndarray,
+            target: np.ndarray, score: np.ndarray, score_bin: np.ndarray) -> None:
+        G, B = self.count.size, self.score_bins
+        self.count += np.bincount(groups, minlength=G)
+        self.correct += np.bincount(groups, weights=correct, minlength=G)
+        self.log_loss += np.bincount(groups, weights=log_loss, minlength=G)
+        cell = groups * B + score_bin
+        self.rows += np.bincount(cell, minlength=G * B).reshape(G, B)
+        self.pos += np.bincount(cell, weights=target, minlength=G * B).reshape(G, B)
+        self.psum += np.bincount(cell, weights=score, minlength=G * B).reshape(G, B)
+
+
+class SliceEvaluator:
+    """Chunked, vectorized per-slice evaluation of probabilistic predictions."""
+
+    def __init__(
+        self,
+        slice_columns: Sequence[str],
+        intersections: Any = 2,
+        threshold: float = 0.5,
+        score_bins: int = 1000,
+        calibration_bins: int = 10,
+        dense_limit: int = 1 << 22,
+    ):
+        """
+        ``intersections`` is the highest number of columns crossed together
+        (1 = single columns only), or an explicit list of column tuples.
+        """
+        self.slice_columns = list(slice_columns)
+        if isinstance(intersections, int):
+            specs = [c for order in range(1, intersections + 1) for c in combinations(self.slice_columns, order)]
+        else:
+            specs = [tuple(spec) for spec in intersections]
+            unknown = {c for spec in specs for c in spec} - set(self.slice_columns)
+            if unknown:
+                raise ValueError(f"Unknown slice column(s) {sorted(unknown)}. Choose from {self.slice_columns}.")
+        self.specs: List[Tuple[str, ...]] = [()] + specs  # () is the whole dataset
+        if score_bins < calibration_bins:
+            raise ValueError("score_bins must be at least calibration_bins.")
+        self.threshold = threshold
+        self.score_bins = score_bins
+        self.calibration_bins = calibration_bins
+        self.dense_limit = dense_limit
+        self.multiclass: Optional[bool] = None
+        self._stats = {spec: _SliceStats(spec, score_bins) for spec in self.specs}
+        self.rows_seen = 0
+
+    # --- Accumulation ---
+    def _row_terms(self, labels: np.ndarray, predictions: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Per-row (correct, log_loss, calibration target, score)."""
+        if predictions.ndim == 2:
+            labels = labels.astype(np.int64)
+            predicted = predictions.argmax(axis=1)
+            p_true = np.clip(predictions[np.arange(labels.size), labels], EPS, 1.0)
+            correct = (predicted == labels).astype(np.float64)
+            return correct, -np.log(p_true), correct, predictions.max(axis=1)
+        score = np.clip(predictions, 0.0, 1.0)
+        target = labels.astype(np.float64)
+        p = np.clip(score, EPS, 1.0 - EPS)
+        log_loss = -(target * np.log(p) + (1.0 - target) * np.log1p(-p))
+        correct = ((score >= self.threshold) == (target > 0.5)).astype(np.float64)
+        return correct, log_loss, target, score
+
+    def _groups(self, spec: Tuple[str, ...], codes: Dict[str, Tuple[np.ndarray, np.ndarray]], n: int) -> np.ndarray:
+        stats = self._stats[spec]
+        if not spec:
+            return np.zeros(n, dtype=np.int64) + stats.global_ids([()])[0]
+        if len(spec) == 1:
+            uniques, inverse = codes[spec[0]]
+            local_keys = [(u,) for u in uniques.tolist()]
+            return stats.global_ids(local_keys)[inverse]
+        combined = np.zeros(n, dtype=np.int64)
+        radix = 1
+        for column in spec:
+            uniques, inverse = codes[column]
+            combined = combined * uniques.size + inverse
+            radix *= uniques.size
+        if radix <= self.dense_limit:
+            local, inverse = _dense_codes(combined, radix)
+        else:
+            local, inverse = np.unique(combined, return_inverse=True)
+        # Decode each combined key back into its column values (last column is the lowest digit).
+        parts = []
+        rest = local
+        for column in reversed(spec):
+            uniques = codes[column][0]
+            parts.append(uniques[rest % uniques.size].tolist())
+            rest = rest // uniques.size
+        local_keys = list(zip(*reversed(parts)))
+        return stats.global_ids(local_keys)[inverse]
+
+    def update(self, labels: Any, predictions: Any, slices: Mapping[str, Any]) -> "SliceEvaluator":
+        """Accumulate one chunk. ``slices`` maps every slice column to an array of keys."""
+        labels = np.asarray(labels).ravel()
+        predictions = np.asarray(predictions, dtype=np.float64)
+        multiclass = predictions.ndim == 2
+        if self.multiclass is None:
+            self.multiclass = multiclass
+        elif self.multiclass != multiclass:
+            raise ValueError("All chunks must be either binary (1-D) or multiclass (2-D) predictions.")
+        n = labels.size
+        if predictions.shape[0] != n:
+            raise ValueError(f"Got {n} labels and {predictions.shape[0]} predictions.")
+        missing = [c for c in self.slice_columns if c not in slices]
+        if missing:
+            raise ValueError(f"Missing slice column(s) {missing}.")
+
+        correct, log_loss, target, score = self._row_terms(labels, predictions)
+        score_bin = np.minimum((score * self.score_bins).astype(np.int64), self.score_bins - 1)
+        codes = {}
+        for column in self.slice_columns:
+            values = np.asarray(slices[column]).ravel()
+            if values.size != n:
+                raise ValueError(f"Slice column '{column}' has {values.size} values for {n} rows.")
+            codes[column] = factorize(values, self.dense_limit)
+        for spec in self.specs:
+            groups = self._groups(spec, codes, n)
+            self._stats[spec].add(groups, correct, log_loss, target, score, score_bin)
+        self.rows_seen += n
+        return self
+
+    def update_chunks(self, chunks: Iterable[Tuple[Any, Any, Mapping[str, Any]]]) -> "SliceEvaluator":
+        """Consume ``(labels, predictions, slices)`` chunks, e.g. from a file reader."""
+        for labels, predictions, slices in chunks:
+            self.update(labels, predictions, slices)
+        return self
+
+    # --- Results ---
+    def _metrics(self, stats: _SliceStats) -> Dict[str, Any]:
+        G = len(stats.keys)
+        count = stats.count[:G].astype(np.float64)
+        rows, pos, psum = stats.rows[:G], stats.pos[:G], stats.psum[:G]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out: Dict[str, Any] = {
+                "keys": list(stats.keys),
+                "count": stats.count[:G].copy(),
+                "accuracy": stats.correct[:G] / count,
+                "log_loss": stats.log_loss[:G] / count,
+                "mean_prediction": psum.sum(axis=1) / count,
+            }
+            if self.multiclass:
+                out["auc"] = np.full(G, np.nan)
+            else:
+                neg = rows - pos
+                P, N = pos.sum(axis=1), neg.sum(axis=1)
+                pos_above = P[:, None] - np.cumsum(pos, axis=1)  # positives in strictly higher bins
+                out["auc"] = (neg * (pos_above + 0.5 * pos)).sum(axis=1) / (P * N)
+                out["positive_rate"] = P / count
+            # Regroup the fine score histogram into calibration bins.
+            edges = (np.arange(self.score_bins) * self.calibration_bins) // self.score_bins
+            starts = np.searchsorted(edges, np.arange(self.calibration_bins))
+            cal_pos = np.add.reduceat(pos, starts, axis=1)
+            cal_psum = np.add.reduceat(psum, starts, axis=1)
+            out["ece"] = np.abs(cal_pos - cal_psum).sum(axis=1) / count
+        return out
+
+    def results(self, min_count: int = 0) -> Dict[str, Dict[str, Any]]:
+        """
+        ``{spec_name: columns}`` where spec_name is "__all__", "region" or
+        "region x version", and columns hold keys, count, accuracy, auc,
+        log_loss, ece and mean_prediction (plus positive_rate for binary).
+        """
+        out = {}
+        for spec, stats in self._stats.items():
+            metrics = self._metrics(stats)
+            if min_count > 0:
+                keep = metrics["count"] >= min_count
+                metrics = {k: ([key for key, ok in zip(v, keep) if ok] if k == "keys" else v[keep]) for k, v in metrics.items()}
+            out[" x ".join(spec) if spec else ALL] = metrics
+        return out
+
+    def rows(self, min_count: int = 0) -> List[Dict[str, Any]]:
+        """Flattened results, one dict per (spec, key), largest slices first."""
+        table = []
+        for name, metrics in self.results(min_count).items():
+            for i, key in enumerate(metrics["keys"]):
+                row = {"slice": name, "key": key}
+                row.update({k: (v[i].item() if hasattr(v[i], "item") else v[i]) for k, v in metrics.items() if k != "keys"})
+                table.append(row)
+        table.sort(key=lambda r: (r["slice"] != ALL, r["slice"], -r["count"]))
+        return table
+
+
+def evaluate_slices(
+    labels: Any,
+    predictions: Any,
+    slices: Mapping[str, Any],
+    chunk_size: int = 1_000_000,
+    **kwargs,
+) -> Dict[str, Dict[str, Any]]:
+    """One-shot helper: evaluate in-memory arrays in ``chunk_size`` chunks."""
+    evaluator = SliceEvaluator(list(slices), **kwargs)
+    n = len(labels)
+    for start in range(0, n, chunk_size):
+        end = start + chunk_size
+        evaluator.update(labels[start:end], predictions[start:end], {c: v[start:end] for c, v in slices.items()})
+    return evaluator.results()
@@ -8,13 +8,22 @@ License: MIT
 This module provides a unified logging interface for all sections of the
 OrchestrAIFramework. It defines color-coded levels, timestamps, and formatting
 to maintain readability and harmony across components.
+
+Hot paths should check ``log_enabled`` before building expensive messages.
+``configure_logging(async_mode=True)`` hands records to a background writer
+thread through a queue, so callers never wait on console or file I/O.
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
+from typing import Any, Dict, Optional, Union
 
-from orchestrAIframework.common.paths import ORCH_PATHS
+from orchestrAIframework.common.paths import ORCH_PATHS, get_path
 
 LOG_FILE = Path(ORCH_PATHS["logs"]) / "orchestrai.log"
 
@@ -22,29 +31,142 @@ LOG_FILE = Path(ORCH_PATHS["logs"]) / "orchestrai.log"
 LOG_FORMAT = "[%(asctime)s] [%(levelname)s] %(name)s: %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "success": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+_settings = {
+    "async_mode": False,
+    "color_echo": True,
+    "level": logging.DEBUG,
+    "log_file": LOG_FILE,
+}
+_loggers: Dict[str, logging.Logger] = {}
+_listener: Optional[Any] = None  # logging.handlers.QueueListener, imported on demand
+_lock = threading.RLock()
+
+
+def _build_handlers() -> list:
+    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+
+    # File handler (the directory is created here, not at import time)
+    log_file = Path(_settings["log_file"])
+    if log_file == LOG_FILE:
+        get_path("logs")
+    else:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    return [console_handler, file_handler]
+
+
+@functools.lru_cache(maxsize=None)
+def _deferred_queue_handler_class() -> type:
+    import logging.handlers  # pulls in socket & co., so only when async mode is used
+
+    class _DeferredQueueHandler(logging.handlers.QueueHandler):
+        """Queue handler that leaves formatting to the background writer thread."""
+
+        def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+            return record
+
+    return _DeferredQueueHandler
+
+
+def _queue_handler() -> logging.Handler:
+    import logging.handlers
+
+    global _listener
+    if _listener is None:
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(records, *_build_handlers(), respect_handler_level=True)
+        _listener.start()
+    return _deferred_queue_handler_class()(_listener.queue)
+
+
 def configure_logger(name: str = "OrchestrAI") -> logging.Logger:
     """
     Configure and return a logger with both console and file handlers.
+    In async mode the logger only enqueues records for the background writer.
     """
     logger = logging.getLogger(name)
 
-    if not logger.handlers:  # avoid duplicate handlers
-        logger.setLevel(logging.DEBUG)
-
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+    with _lock:
+        if not logger.handlers:  # avoid duplicate handlers
+            logger.setLevel(_settings["level"])
+            if _settings["async_mode"]:
+                logger.addHandler(_queue_handler())
+            else:
+                for handler in _build_handlers():
+                    logger.addHandler(handler)
+        _loggers[name] = logger
+    return logger
 
-        # File handler
-        file_handler = logging.FileHandler(LOG_FILE)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
 
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+def configure_logging(
+    async_mode: Optional[bool] = None,
+    color_echo: Optional[bool] = None,
+    level: Optional[Union[str, int]] = None,
+    log_file: Optional[Union[str, Path]] = None,
+) -> None:
+    """
+    Change framework-wide logging behaviour. Options left as None are kept.
 
-    return logger
+    async_mode: enqueue records for a background writer instead of writing inline.
+    color_echo: print the colored copy of each message to stdout.
+    level:      minimum level ("debug", "info", ...); lower messages are dropped
+                before any formatting work happens.
+    log_file:   destination of the file handler.
+    """
+    if isinstance(level, str) and level.lower() not in LEVELS:
+        raise ValueError(f"Unknown log level '{level}'. Choose from {sorted(LEVELS)}.")
+    if async_mode is not None:
+        _settings["async_mode"] = async_mode
+    if color_echo is not None:
+        _settings["color_echo"] = color_echo
+    if level is not None:
+        _settings["level"] = LEVELS[level.lower()] if isinstance(level, str) else int(level)
+    if log_file is not None:
+        _settings["log_file"] = Path(log_file)
+
+    # Rebuild handlers of every logger handed out so far with the new settings.
+    with _lock:
+        shutdown_logging()
+        for name, logger in list(_loggers.items()):
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            configure_logger(name)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background writer, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def log_enabled(level: str, name: str = "OrchestrAI") -> bool:
+    """Cheap check to guard message formatting on hot paths."""
+    logger = _loggers.get(name) or configure_logger(name)
+    return logger.isEnabledFor(LEVELS.get(level.lower(), logging.DEBUG))
 
 
 # --- Color-enhanced helper (optional but aesthetic) ---
@@ -55,24 +177,25 @@ class LogColors:
     ERROR = "\033[91m"
     END = "\033[0m"
 
+_COLORS = {
+    "info": LogColors.INFO,
+    "success": LogColors.SUCCESS,
+    "warning": LogColors.WARNING,
+    "error": LogColors.ERROR,
+}
+
 def log_message(level: str, message: str, name: str = "OrchestrAI") -> None:
     """
     Simplified helper for quick colorful messages without configuring manually.
     """
-    logger = configure_logger(name)
-
-    if level.lower() == "info":
-        print(f"{LogColors.INFO}{message}{LogColors.END}")
-        logger.info(message)
-    elif level.lower() == "success":
-        print(f"{LogColors.SUCCESS}{message}{LogColors.END}")
-        logger.info(message)
-    elif level.lower() == "warning":
-        print(f"{LogColors.WARNING}{message}{LogColors.END}")
-        logger.warning(message)
-    elif level.lower() == "error":
-        print(f"{LogColors.ERROR}{message}{LogColors.END}")
-        logger.error(message)
-    else:
-        logger.debug(message)
-
+    logger = _loggers.get(name) or configure_logger(name)
+    level = level.lower()
+    numeric = LEVELS.get(level, logging.DEBUG)
+    if not logger.isEnabledFor(numeric):
+        return
+
+    color = _COLORS.get(level)
+    if color is not None and _settings["color_echo"]:
+        print(f"{color}{message}{LogColors.END}")
+    # Build the record directly: caller lookup would only ever point at this helper.
+    logger.handle(logger.makeRecord(logger.name, numeric, __file__, 0, message, None, None))
@@ -9,13 +9,18 @@ This module defines and manages all default paths used by the framework.
 It ensures consistent organization of directories for data, models, logs, and outputs,
 independent of the runtime environment.
 
+Importing this module has no side effects: each directory is created the first
+time it is requested through ``get_path``.
+
 Usage:
-    from orchestrAIframework.common.paths import ORCH_PATHS
-    print(ORCH_PATHS['data'])
+    from orchestrAIframework.common.paths import ORCH_PATHS, get_path
+    print(ORCH_PATHS['data'])      # just the path
+    models_dir = get_path('models')  # path, created on first use
 """
 
 import os
 from pathlib import Path
+from typing import Set
 
 # Determine the project root dynamically (relative to this file)
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -32,13 +37,26 @@ ORCH_PATHS = {
     "tmp": PROJECT_ROOT / "tmp",
 }
 
+_ensured: Set[str] = set()
+
+def get_path(name: str) -> Path:
+    """
+    Return the directory registered under ``name``, creating it on first use.
+    Later calls for the same name skip the filesystem entirely.
+    """
+    path = Path(ORCH_PATHS[name])
+    if name not in _ensured:
+        os.makedirs(path, exist_ok=True)
+        _ensured.add(name)
+    return path
+
 def ensure_directories() -> None:
     """
     Ensure all standard directories exist.
     Creates them if missing.
     """
-    for name, path in ORCH_PATHS.items():
-        os.makedirs(path, exist_ok=True)
+    for name in ORCH_PATHS:
+        get_path(name)
 
 def print_paths() -> None:
     """Pretty-print all registered paths."""
@@ -47,6 +65,3 @@ def print_paths() -> None:
         print(f"{name:<12}: {path}")
     print("=================================")
 
-# Automatically ensure paths exist when the module is imported
-ensure_directories()
-
@@ -11,42 +11,505 @@ by handling registration, configuration, and communication among them.
 
 Each section acts as a specialized AI unit, and the Conductor ensures that
 all modules play together in harmony — like a real orchestra.
+
+Sections that do not depend on each other are cued at the same time on a
+thread or process pool, so a performance lasts as long as its critical path.
+``aplay`` is the asyncio counterpart: async sections are awaited directly and
+legacy blocking sections are pushed to the same pool.
+
+Sections can also be registered lazily by name; they are imported and built
+only when a score first needs them.
+
+With ``profile=True`` every section invocation is timed (wall, CPU and
+optionally tracemalloc peak), sections can open nested spans with
+``conductor.profiling.span``, and the timeline exports as a Chrome trace.
 """
 
-from typing import Dict, Any, Optional
+import contextlib
+import importlib
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import TYPE_CHECKING, Dict, Any, Optional, Set, Tuple
+
+from orchestrAIframework.conductor.dag import build_dag, dependents_of, descendants, topological_order
+
+if TYPE_CHECKING:
+    import asyncio
+
+# asyncio, multiprocessing and the profiler are imported on first use to keep start-up cheap.
+EXECUTORS = ("thread", "process")
+ERROR_POLICIES = {"fail_fast", "continue"}
+
+# Built-in sections available to ``register_lazy`` by name ("module:Class").
+SECTION_REGISTRY: Dict[str, str] = {
+    "Strings": "orchestrAIframework.strings.strings:Strings",
+    "Brass": "orchestrAIframework.brass.brass:Brass",
+    "Woodwinds": "orchestrAIframework.woodwinds.woodwinds:Woodwinds",
+    "Percussion": "orchestrAIframework.percussion.percussion:Percussion",
+    "Keyboards": "orchestrAIframework.keyboards.keyboards:Keyboards",
+    "Bass": "orchestrAIframework.bass.bass:Bass",
+    "Harp": "orchestrAIframework.harp.harp:Harp",
+    "Choir": "orchestrAIframework.choir.choir:Choir",
+}
+
+
+class LazySection:
+    """Placeholder for a section that is imported and constructed on first use."""
+
+    def __init__(self, target: str, *args: Any, **kwargs: Any):
+        module, _, attr = target.partition(":")
+        if not module or not attr:
+            raise ValueError(f"Lazy section target must look like 'package.module:Class', got '{target}'.")
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+
+    def load(self) -> Any:
+        module, _, attr = self.target.partition(":")
+        factory = getattr(importlib.import_module(module), attr)
+        return factory(*self.args, **self.kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazySection({self.target!r})"
+
+
+class SectionFailure(RuntimeError):
+    """Raised by ``play`` under the fail-fast policy when a section fails or times out."""
+
+    def __init__(self, name: str, reason: str, results: Dict[str, Dict[str, Any]]):
+        super().__init__(f"Section '{name}' {reason}")
+        self.name = name
+        self.results = results
+
+
+def _perform(section: Any, score: Dict[str, Any]) -> None:
+    """Top-level trampoline so sections can also be cued on a process pool."""
+    section.perform(score)
+
+
+def _outcome(status: str, elapsed_s: float = 0.0, error: Optional[str] = None) -> Dict[str, Any]:
+    return {"status": status, "elapsed_s": elapsed_s, "error": error}
+
 
 class Conductor:
     """Main orchestrator of the AI framework."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        on_error: str = "fail_fast",
+        max_concurrency: Optional[int] = None,
+        profile: bool = False,
+        profile_memory: bool = False,
+    ):
         self.sections: Dict[str, Any] = {}
+        self._load_lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self.profiler: Optional[Any] = None  # conductor.profiling.Profiler when profile=True
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.configure(
+            executor=executor,
+            max_workers=max_workers,
+            timeout=timeout,
+            on_error=on_error,
+            max_concurrency=max_concurrency,
+            profile=profile,
+            profile_memory=profile_memory,
+        )
         print("[Conductor] Initialized.")
 
+    def configure(
+        self,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        on_error: str = "fail_fast",
+        max_concurrency: Optional[int] = None,
+        profile: bool = False,
+        profile_memory: bool = False,
+    ) -> None:
+        """
+        Configure how sections are cued.
+
+        executor:    "thread" or "process" pool used for independent sections.
+        max_workers: pool size (None lets the pool choose; 1 runs sections one by one).
+        timeout:     default per-section timeout in seconds (None = no limit), counted
+                     from when the section starts on a worker. A thread cannot be
+                     interrupted, so a timed-out section keeps holding its worker
+                     until it returns and fewer sections run alongside it.
+        on_error:    "fail_fast" aborts the performance on the first failure,
+                     "continue" cancels only the failed section's dependents.
+        max_concurrency: cap on section invocations in flight per event loop,
+                     shared by every concurrent ``aplay`` (None = unbounded).
+        profile:     record per-section wall/CPU time, spans and latency histograms.
+        profile_memory: also record the tracemalloc peak per section (slower).
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Choose from {sorted(EXECUTORS)}.")
+        if on_error not in ERROR_POLICIES:
+            raise ValueError(f"Unknown error policy '{on_error}'. Choose from {sorted(ERROR_POLICIES)}.")
+        self.close()
+        self.executor = executor
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.on_error = on_error
+        self.max_concurrency = max_concurrency
+        self._semaphores.clear()
+        if self.profiler is not None:
+            self.profiler.stop()
+            self.profiler = None
+        if profile or profile_memory:
+            from orchestrAIframework.conductor.profiling import Profiler
+
+            self.profiler = Profiler(memory=profile_memory).start()
+
     def register_section(self, name: str, section: Any) -> None:
         """Register a new orchestral section (e.g., Brass, Strings)."""
         self.sections[name] = section
         print(f"[Conductor] Registered section: {name}")
 
-    def play(self, score: Optional[Dict[str, Any]] = None) -> None:
+    def register_lazy(self, name: str, target: Optional[str] = None, *args: Any, **kwargs: Any) -> None:
+        """
+        Register a section without importing it yet.
+
+        ``target`` is "package.module:Class" (or any factory); when omitted, ``name``
+        is looked up in SECTION_REGISTRY. Extra arguments are passed to the factory
+        when the section is first cued.
+        """
+        if target is None:
+            if name not in SECTION_REGISTRY:
+                raise ValueError(f"Unknown built-in section '{name}'. Choose from {sorted(SECTION_REGISTRY)}.")
+            target = SECTION_REGISTRY[name]
+        self.sections[name] = LazySection(target, *args, **kwargs)
+        print(f"[Conductor] Registered section: {name} (lazy)")
+
+    def get_section(self, name: str) -> Any:
+        """Return the section registered under ``name``, building it if it is still lazy."""
+        section = self.sections[name]
+        if isinstance(section, LazySection):
+            with self._load_lock:
+                section = self.sections[name]
+                if isinstance(section, LazySection):
+                    section = self.sections[name] = section.load()
+        return section
+
+    def play(self, score: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
         """
         Execute the orchestral performance.
-        The 'score' defines which sections to activate and in what order.
+        The 'score' defines which sections to activate and how they depend on each other:
+
+            score["sections"]      optional list of section names (default: all registered)
+            score["dependencies"]  optional {section: [sections it waits for]}
+            score["timeouts"]      optional {section: seconds}, overrides the default timeout
+
+        Returns a mapping ``section -> {"status", "elapsed_s", "error"}`` where status is
+        one of "ok", "failed", "timeout", "cancelled" or "skipped".
         """
+        score = score or {}
         print("[Conductor] Beginning orchestral performance...")
 
-        for name, section in self.sections.items():
+        dag = build_dag(
+            score.get("sections") or list(self.sections),
+            score.get("dependencies"),
+            known=self.sections,
+        )
+        started = time.perf_counter()
+        try:
+            results = self._run_dag(dag, score)
+        finally:
+            if self.profiler is not None:
+                self.profiler.add_event("play", "conductor", started, time.perf_counter() - started)
+
+        print("[Conductor] Performance complete.")
+        return results
+
+    def _run_dag(self, dag: Dict[str, Any], score: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        order = topological_order(dag, priority=self.sections)
+        rank = {name: i for i, name in enumerate(order)}
+        dependents = dependents_of(dag)
+        waiting = {name: set(deps) for name, deps in dag.items()}
+        timeouts = score.get("timeouts", {})
+
+        results: Dict[str, Dict[str, Any]] = {}
+        ready = [name for name in order if not waiting[name]]
+        running: Dict[Future, Tuple[str, float, Optional[float]]] = {}
+        executor = self._get_executor()
+
+        def release(name: str) -> None:
+            for child in dependents[name]:
+                waiting[child].discard(name)
+                if not waiting[child] and child not in results:
+                    ready.append(child)
+            ready.sort(key=rank.__getitem__)
+
+        def fail(name: str, status: str, elapsed: float, error: str) -> None:
+            results[name] = _outcome(status, elapsed, error)
+            print(f"[Conductor] Section '{name}' {status}: {error}")
+            if self.on_error == "fail_fast":
+                for fut, (other, started, _) in running.items():
+                    fut.cancel()
+                    results.setdefault(other, _outcome("cancelled", time.perf_counter() - started))
+                for other in dag:
+                    results.setdefault(other, _outcome("cancelled"))
+                raise SectionFailure(name, f"{status}: {error}", results)
+            for child in descendants(dependents, name):
+                results.setdefault(child, _outcome("cancelled", error=f"dependency '{name}' {status}"))
+
+        # Submit no more than the pool can start at once, so a section's timeout runs
+        # from when it actually starts rather than while it is queued behind others.
+        capacity = self._pool_size()
+        stragglers: Set[Future] = set()  # timed-out sections whose worker is still busy
+
+        while ready or running:
+            stragglers = {fut for fut in stragglers if not fut.done()}
+            while ready and len(running) + len(stragglers) < capacity:
+                name = ready.pop(0)
+                print(f"[Conductor] Cueing section: {name}")
+                try:
+                    section = self.get_section(name)
+                except Exception as exc:
+                    fail(name, "failed", 0.0, f"could not load section: {exc!r}")
+                    continue
+                if not hasattr(section, "perform"):
+                    print(f"[Conductor] Section '{name}' has no 'perform' method.")
+                    results[name] = _outcome("skipped", error="no 'perform' method")
+                    release(name)
+                    continue
+                limit = timeouts.get(name, self.timeout)
+                started = time.perf_counter()
+                if self.profiler is not None:
+                    from orchestrAIframework.conductor.profiling import measure
+
+                    fut = executor.submit(measure, section, score, name, self.profiler.memory)
+                else:
+                    fut = executor.submit(_perform, section, score)
+                running[fut] = (name, started, None if limit is None else started + limit)
+
+            if not running and not stragglers:
+                break
+
+            deadlines = [d for (_, _, d) in running.values() if d is not None]
+            budget = max(0.0, min(deadlines) - time.perf_counter()) if deadlines else None
+            done, _ = wait([*running, *stragglers], timeout=budget, return_when=FIRST_COMPLETED)
+            now = time.perf_counter()
+
+            # Record every finished section before handling failures, so a fail-fast
+            # abort does not mark sections that completed in the same batch as cancelled.
+            failures = []
+            for fut in done:
+                if fut not in running:
+                    continue  # a straggler freed its worker; its result was already discarded
+                name, started, _ = running.pop(fut)
+                exc = fut.exception()
+                if self.profiler is not None:
+                    self._record(name, started, now, None if exc is not None else fut.result())
+                if exc is not None:
+                    failures.append((name, now - started, repr(exc)))
+                else:
+                    results[name] = _outcome("ok", now - started)
+                    release(name)
+            for name, elapsed, error in failures:
+                fail(name, "failed", elapsed, error)
+
+            for fut, (name, started, deadline) in list(running.items()):
+                if deadline is not None and now >= deadline:
+                    # Threads cannot be interrupted: the late result is discarded, but the
+                    # worker stays busy until the section returns.
+                    if not fut.cancel():
+                        stragglers.add(fut)
+                    del running[fut]
+                    if self.profiler is not None:
+                        self._record(name, started, now, None, "timeout")
+                    fail(name, "timeout", now - started, f"exceeded {deadline - started:.3f}s")
+
+        return {name: results[name] for name in order}
+
+    async def aplay(self, score: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Asyncio counterpart of ``play`` with the same score keys and return value.
+
+        Sections exposing ``aperform`` (see AsyncSection) are awaited on the running
+        loop; blocking sections run on the Conductor's pool via ``run_in_executor``.
+        Cancelling the ``aplay`` task cancels every section still in flight.
+        """
+        import asyncio
+
+        score = score or {}
+        print("[Conductor] Beginning orchestral performance (async)...")
+
+        dag = build_dag(
+            score.get("sections") or list(self.sections),
+            score.get("dependencies"),
+            known=self.sections,
+        )
+        order = topological_order(dag, priority=self.sections)
+        timeouts = score.get("timeouts", {})
+        limiter = self._semaphore() or contextlib.nullcontext()
+        results: Dict[str, Dict[str, Any]] = {}
+        tasks: Dict[str, "asyncio.Task[None]"] = {}
+
+        async def cue(name: str) -> None:
+            if dag[name]:
+                await asyncio.wait([tasks[dep] for dep in dag[name]])
+            broken = [dep for dep in dag[name] if results.get(dep, {}).get("status") not in ("ok", "skipped")]
+            if broken:
+                results[name] = _outcome("cancelled", error=f"dependency '{broken[0]}' did not complete")
+                return
+
             print(f"[Conductor] Cueing section: {name}")
-            if hasattr(section, "perform"):
-                section.perform(score or {})
-            else:
+            try:
+                section = self.get_section(name)
+            except Exception as exc:
+                results[name] = _outcome("failed", error=f"could not load section: {exc!r}")
+                print(f"[Conductor] Section '{name}' failed: {results[name]['error']}")
+                return
+            if not hasattr(section, "aperform") and not hasattr(section, "perform"):
                 print(f"[Conductor] Section '{name}' has no 'perform' method.")
+                results[name] = _outcome("skipped", error="no 'perform' method")
+                return
+
+            limit = timeouts.get(name, self.timeout)
+            async with limiter:
+                started = time.perf_counter()
+                measured = None
+                try:
+                    if hasattr(section, "aperform"):
+                        call = section.aperform(score)
+                    elif self.profiler is not None:
+                        from orchestrAIframework.conductor.profiling import measure
+
+                        call = asyncio.get_running_loop().run_in_executor(
+                            self._get_executor(), measure, section, score, name, self.profiler.memory
+                        )
+                    else:
+                        call = asyncio.get_running_loop().run_in_executor(
+                            self._get_executor(), _perform, section, score
+                        )
+                    measured = await asyncio.wait_for(call, limit)
+                except asyncio.TimeoutError:
+                    results[name] = _outcome("timeout", time.perf_counter() - started, f"exceeded {limit:.3f}s")
+                except asyncio.CancelledError:
+                    results.setdefault(name, _outcome("cancelled", time.perf_counter() - started))
+                    raise
+                except Exception as exc:
+                    results[name] = _outcome("failed", time.perf_counter() - started, repr(exc))
+                else:
+                    results[name] = _outcome("ok", time.perf_counter() - started)
+                if self.profiler is not None:
+                    # Awaited sections share the loop thread, so only their wall time is attributable.
+                    self._record(name, started, time.perf_counter(), measured if isinstance(measured, dict) else None,
+                                 results[name]["status"])
+            if results[name]["status"] != "ok":
+                print(f"[Conductor] Section '{name}' {results[name]['status']}: {results[name]['error']}")
+
+        for name in order:
+            tasks[name] = asyncio.create_task(cue(name), name=f"section:{name}")
+
+        try:
+            pending = set(tasks.values())
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if self.on_error != "fail_fast":
+                    continue
+                failed = next(
+                    (n for n, t in tasks.items() if t in done and results[n]["status"] in ("failed", "timeout")),
+                    None,
+                )
+                if failed is not None:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    for other in dag:
+                        results.setdefault(other, _outcome("cancelled"))
+                    outcome = results[failed]
+                    raise SectionFailure(failed, f"{outcome['status']}: {outcome['error']}", results)
+        finally:
+            for task in tasks.values():
+                task.cancel()
 
         print("[Conductor] Performance complete.")
+        return {name: results[name] for name in order}
+
+    # --- Profiling (see conductor/profiling.py) ---
+    def _record(self, name: str, started: float, ended: float, measured: Optional[Dict[str, Any]], status: Optional[str] = None) -> None:
+        profiler = self.profiler
+        status = status or ("ok" if measured is not None else "failed")
+        if measured is None:
+            profiler.add_event(name, "section", started, ended - started, args={"status": status})
+            return
+        profiler.merge_events(measured["events"])
+        profiler.add_event(
+            name, "section", measured["start"], measured["wall_s"], measured["cpu_s"],
+            {"status": status, "queued_ms": (measured["start"] - started) * 1e3},
+            measured["peak_bytes"], measured["pid"], measured["tid"],
+        )
+
+    def profile_report(self) -> Dict[str, Dict[str, Any]]:
+        """Latency histograms per section and span ("<name>.wall_s", ".cpu_s", ".peak_mb")."""
+        if self.profiler is None:
+            raise RuntimeError("Profiling is off. Use configure(profile=True) first.")
+        return self.profiler.report()
+
+    def export_trace(self, path: Optional[str] = None) -> Any:
+        """Write a Chrome trace-event JSON (default: ORCH_PATHS["experiments"]/traces)."""
+        if self.profiler is None:
+            raise RuntimeError("Profiling is off. Use configure(profile=True) first.")
+        path = self.profiler.export_chrome_trace(path)
+        print(f"[Conductor] Trace written to {path}")
+        return path
+
+    def _semaphore(self) -> Optional["asyncio.Semaphore"]:
+        import asyncio
+
+        if self.max_concurrency is None:
+            return None
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return sem
+
+    def _pool_size(self) -> int:
+        """Worker count of the pool: ``max_workers``, or the default each pool type picks."""
+        if self.max_workers is not None:
+            return self.max_workers
+        cpus = os.cpu_count() or 1
+        return cpus if self.executor == "process" else min(32, cpus + 4)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor == "process":
+                from concurrent.futures import ProcessPoolExecutor as pool
+            else:
+                from concurrent.futures import ThreadPoolExecutor as pool
+            self._executor = pool(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool (it is recreated on the next performance)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "Conductor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self.profiler is not None:
+            self.profiler.stop()
 
     def summary(self) -> None:
         """Display a summary of registered sections."""
         print("\n=== OrchestrAIFramework Summary ===")
-        for name in self.sections:
-            print(f"🎵 Section: {name}")
+        for name, section in self.sections.items():
+            suffix = " (not loaded yet)" if isinstance(section, LazySection) else ""
+            print(f"🎵 Section: {name}{suffix}")
         print("===================================")
-
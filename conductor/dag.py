@@ -0,0 +1,107 @@
+# orchestrAIframework/conductor/dag.py
+"""
+OrchestrAIFramework - Score Dependency Graph
+-------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Helpers used by the Conductor to turn a score's declared dependencies into a
+directed acyclic graph of sections. A score may declare:
+
+    score = {
+        "sections": ["Woodwinds", "Keyboards", "Brass"],      # optional subset
+        "dependencies": {"Keyboards": ["Woodwinds"], "Brass": ["Keyboards"]},
+    }
+
+Sections that do not depend on each other can then be cued at the same time.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Set
+
+
+class DAGError(ValueError):
+    """Raised when a score's dependency graph is invalid (unknown section or cycle)."""
+
+
+def build_dag(
+    sections: Iterable[str],
+    dependencies: Optional[Mapping[str, Iterable[str]]] = None,
+    known: Optional[Iterable[str]] = None,
+) -> Dict[str, Set[str]]:
+    """
+    Build a mapping ``section -> set of sections it depends on``.
+
+    Dependencies of a requested section are pulled in even when they are not
+    listed in ``sections``, so a score never runs a section before its inputs.
+    ``known`` restricts the graph to registered section names.
+    """
+    dependencies = dependencies or {}
+    known_set = set(known) if known is not None else None
+
+    dag: Dict[str, Set[str]] = {}
+    stack: List[str] = list(sections)
+    while stack:
+        name = stack.pop()
+        if name in dag:
+            continue
+        if known_set is not None and name not in known_set:
+            raise DAGError(f"Unknown section '{name}' in score.")
+        deps = set(dependencies.get(name, ()))
+        if name in deps:
+            raise DAGError(f"Section '{name}' cannot depend on itself.")
+        dag[name] = deps
+        stack.extend(deps)
+
+    topological_order(dag)  # validates acyclicity
+    return dag
+
+
+def topological_order(dag: Mapping[str, Set[str]], priority: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Return a topological order of ``dag`` (Kahn's algorithm).
+
+    Ties are broken by ``priority`` (e.g. registration order) so the result is
+    deterministic; sections missing from ``priority`` come last, sorted by name.
+    """
+    rank = {name: i for i, name in enumerate(priority or ())}
+    key = lambda n: (rank.get(n, len(rank)), n)
+
+    indegree = {name: len(deps) for name, deps in dag.items()}
+    dependents = dependents_of(dag)
+
+    ready = sorted((n for n, d in indegree.items() if d == 0), key=key)
+    order: List[str] = []
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        for child in dependents[name]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+        ready.sort(key=key)
+
+    if len(order) != len(dag):
+        cyclic = sorted(n for n, d in indegree.items() if d > 0)
+        raise DAGError(f"Dependency cycle detected among sections: {cyclic}")
+    return order
+
+
+def dependents_of(dag: Mapping[str, Set[str]]) -> Dict[str, List[str]]:
+    """Invert ``dag`` into ``section -> sections that depend on it``."""
+    out: Dict[str, List[str]] = {name: [] for name in dag}
+    for name, deps in dag.items():
+        for dep in deps:
+            out[dep].append(name)
+    return out
+
+
+def descendants(dependents: Mapping[str, List[str]], name: str) -> Set[str]:
+    """All sections that transitively depend on ``name``."""
+    seen: Set[str] = set()
+    stack = list(dependents.get(name, ()))
+    while stack:
+        child = stack.pop()
+        if child not in seen:
+            seen.add(child)
+            stack.extend(dependents.get(child, ()))
+    return seen
@@ -0,0 +1,245 @@
+# orchestrAIframework/conductor/profiling.py
+"""
+OrchestrAIFramework - Conductor Profiling
+-----------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Per-section instrumentation for ``Conductor.play`` / ``aplay``.
+
+- Each section invocation records wall time and the worker thread's CPU
+  time. With ``memory=True`` it also records the tracemalloc peak above
+  the starting allocation. tracemalloc is process-wide: peaks are exact
+  when sections run one at a time (``max_workers=1`` or the process
+  executor). Under concurrent threads they are an upper bound.
+- Sections open their own nested spans with ``with span("tokenize"): ...``.
+  Spans nest per thread and end up on the same timeline as the section
+  that opened them. Spans opened in process-pool workers are collected in
+  the worker and shipped back with the section's result.
+- Sections and spans feed DDSketch latency histograms (choir/metrics.py)
+  keyed "<name>.wall_s" / "<name>.cpu_s" / "<name>.peak_mb". The registry
+  is built in ``start``, so importing it never lands in a measured
+  section. Sections that time out are recorded with status "timeout".
+- ``export_chrome_trace`` writes Chrome trace-event JSON (complete "X"
+  events) under ORCH_PATHS["experiments"]/traces. Open it in
+  chrome://tracing or https://ui.perfetto.dev.
+- Disabled (the default), ``span()`` returns one shared no-op context
+  manager after a single global check. The Conductor submits the plain
+  trampoline, so the hooks can stay in production code.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from orchestrAIframework.common.paths import get_path
+
+_profiler: Optional["Profiler"] = None  # the active profiler in this process
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "args", "start", "cpu")
+
+    def __init__(self, profiler: "Profiler", name: str, args: Dict[str, Any]):
+        self.profiler, self.name, self.args = profiler, name, args
+
+    def __enter__(self) -> "_Span":
+        self.cpu = time.thread_time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        end = time.perf_counter()
+        self.profiler.add_event(self.name, "span", self.start, end - self.start, time.thread_time() - self.cpu, self.args)
+
+
+def span(name: str, **args: Any) -> Any:
+    """Context manager timing a nested region; a shared no-op when profiling is off."""
+    profiler = _profiler
+    if profiler is None:
+        return _NULL_SPAN
+    return _Span(profiler, name, args)
+
+
+def active() -> Optional["Profiler"]:
+    return _profiler
+
+
+class Profiler:
+    """Collects trace events and latency histograms for one process."""
+
+    def __init__(self, memory: bool = False, max_events: int = 1_000_000):
+        self.memory = memory
+        self.max_events = max_events
+        self.events: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self.pid = os.getpid()
+        self._registry: Optional[Any] = None
+        self._histograms: Dict[str, Any] = {}  # name -> (wall, cpu, peak) histogram handles
+        self._started_tracemalloc = False
+
+    # --- Lifecycle ---
+    def start(self) -> "Profiler":
+        global _profiler
+        if self._registry is None:
+            self._registry = self._new_registry()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        _profiler = self
+        return self
+
+    def stop(self) -> None:
+        global _profiler
+        if _profiler is self:
+            _profiler = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # --- Recording ---
+    @staticmethod
+    def _new_registry() -> Any:
+        from orchestrAIframework.choir.metrics import MetricsRegistry
+
+        return MetricsRegistry()
+
+    @property
+    def registry(self) -> Any:
+        if self._registry is None:
+            self._registry = self._new_registry()
+        return self._registry
+
+    def add_event(self, name: str, cat: str, start: float, wall: float, cpu: Optional[float] = None,
+                  args: Optional[Dict[str, Any]] = None, peak_bytes: Optional[int] = None,
+                  pid: Optional[int] = None, tid: Optional[int] = None) -> None:
+        """
+        Record one complete event; ``start`` is a perf_counter timestamp. A profiler
+        that was never started (a worker's temporary one) keeps events only.
+        """
+        registry = self._registry
+        if registry is not None:
+            histograms = self._histograms.get(name)
+            if histograms is None:
+                histograms = self._histograms[name] = (
+                    registry.histogram(f"{name}.wall_s"), registry.histogram(f"{name}.cpu_s"),
+                    registry.histogram(f"{name}.peak_mb"),
+                )
+            histograms[0].observe(wall)
+            if cpu is not None:
+                histograms[1].observe(cpu)
+            if peak_bytes is not None:
+                histograms[2].observe(peak_bytes / 2**20)
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+        event_args = dict(args or {})
+        if cpu is not None:
+            event_args["cpu_ms"] = cpu * 1e3
+        if peak_bytes is not None:
+            event_args["peak_mb"] = peak_bytes / 2**20
+        self.events.append({
+            "name": name, "cat": cat, "ph": "X", "ts": start, "dur": wall,
+            "pid": self.pid if pid is None else pid,
+            "tid": threading.get_ident() if tid is None else tid,
+            "args": event_args,
+        })
+
+    def merge_events(self, events: List[Dict[str, Any]]) -> None:
+        """Adopt events recorded by another process (e.g. a process-pool worker)."""
+        for event in events:
+            args = dict(event["args"])
+            cpu = args.pop("cpu_ms", None)
+            peak = args.pop("peak_mb", None)
+            self.add_event(
+                event["name"], event["cat"], event["ts"], event["dur"],
+                None if cpu is None else cpu / 1e3, args,
+                None if peak is None else int(peak * 2**20), event["pid"], event["tid"],
+            )
+
+    # --- Reporting ---
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Latency histograms (count, mean, p50/p90/p99, ...) per section and span."""
+        if self._registry is None:
+            return {}
+        return {name: summary for name, summary in self._registry.report().items() if summary["count"]}
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        origin = min((e["ts"] for e in self.events), default=0.0)
+        events = [dict(e, ts=(e["ts"] - origin) * 1e6, dur=e["dur"] * 1e6) for e in list(self.events)]
+        threads: Dict[Any, int] = {}
+        for e in events:
+            threads.setdefault((e["pid"], e["tid"]), len(threads))
+        meta = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": f"worker-{i}"}}
+                for (pid, tid), i in threads.items()]
+        return {"traceEvents": meta + events, "displayTimeUnit": "ms", "otherData": {"dropped_events": self.dropped}}
+
+    def export_chrome_trace(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """Write the trace to ``path`` or ORCH_PATHS["experiments"]/traces/trace-<timestamp>.json."""
+        if path is None:
+            directory = get_path("experiments") / "traces"
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"trace-{time.strftime('%Y%m%d-%H%M%S')}-{self.pid}.json"
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+    def clear(self) -> None:
+        self.events = []
+        self.dropped = 0
+        self._registry = self._new_registry() if self._registry is not None else None
+        self._histograms = {}
+
+
+def measure(section: Any, score: Dict[str, Any], name: str, memory: bool) -> Dict[str, Any]:
+    """
+    Run ``section.perform(score)`` in the worker and measure it. perf_counter
+    is the system monotonic clock, so ``start`` lines up across processes.
+    In a worker process with no active profiler, spans go to a temporary one and are
+    returned in "events".
+    """
+    global _profiler
+    local = None
+    if _profiler is None or _profiler.pid != os.getpid():
+        local = _profiler = Profiler(memory=memory)
+    tracing = memory and tracemalloc.is_tracing()
+    if memory and not tracing:
+        tracemalloc.start()
+    if memory:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    cpu = time.thread_time()
+    start = time.perf_counter()
+    try:
+        section.perform(score)
+    finally:
+        wall = time.perf_counter() - start
+        cpu = time.thread_time() - cpu
+        peak = tracemalloc.get_traced_memory()[1] - base if memory else None
+        if memory and not tracing:
+            tracemalloc.stop()
+        if local is not None:
+            _profiler = None
+    return {
+        "start": start, "wall_s": wall, "cpu_s": cpu, "peak_bytes": peak, "pid": os.getpid(), "tid": threading.get_ident(),
+        "events": local.events if local is not None else [],
+    }
@@ -0,0 +1,205 @@
+# orchestrAIframework/harp/artifacts.py
+"""
+OrchestrAIFramework - Harp Artifact Store
+-----------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Content-addressed cache for generated media.
+
+- Keys are BLAKE2b digests of (backend identity, mode, prompt, parameters)
+  in canonical JSON, so identical requests share one artifact across
+  processes and restarts. The backend identity is its name plus its
+  ``version``, or a hash of its configuration when it has no version, so
+  swapping or reconfiguring a backend never serves stale media. Backends
+  whose weights change under a fixed config should bump ``version``.
+- Artifacts live under ORCH_PATHS["outputs"]/artifacts/<k[:2]>/<k>.npy with a
+  small JSON sidecar. The sidecar and then the array are written to
+  per-process, per-thread temporary files and renamed into place, so a
+  visible array always has its meta. Reads memory-map the file, so a hit
+  is served from the page cache without copying the array.
+- A bounded in-memory LRU tier (item and byte limits) sits in front of disk.
+- ``get_or_create`` is single-flight: concurrent callers with the same key
+  wait for the first caller's generation instead of starting their own.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from orchestrAIframework.common.paths import get_path
+
+Artifact = Tuple[np.ndarray, Dict[str, Any]]
+
+
+PLACEHOLDER_VERSION = "1"
+
+
+def backend_identity(backend: Any) -> str:
+    """``name@version`` of a media backend; ``name#<config hash>`` when it declares no version."""
+    if backend is None or backend is placeholder_media:
+        return f"placeholder@{PLACEHOLDER_VERSION}"
+    name = getattr(backend, "name", None) or f"{getattr(backend, '__module__', '')}.{getattr(backend, '__qualname__', type(backend).__qualname__)}"
+    version = getattr(backend, "version", None)
+    if version is not None:
+        return f"{name}@{version}"
+    config = getattr(backend, "config", None)
+    if config is None:
+        config = {k: v for k, v in getattr(backend, "__dict__", {}).items() if not k.startswith("_")}
+    digest = hashlib.blake2b(json.dumps(config, sort_keys=True, default=str).encode("utf-8"), digest_size=8).hexdigest()
+    return f"{name}#{digest}"
+
+
+def artifact_key(mode: str, prompt: str, params: Optional[Dict[str, Any]] = None, backend: str = "") -> str:
+    """Stable hex digest of a generation request; ``backend`` is a ``backend_identity``."""
+    payload = json.dumps(
+        {"backend": backend, "mode": mode, "prompt": prompt, "params": params or {}}, sort_keys=True, default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class _Flight:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[Artifact] = None
+        self.error: Optional[BaseException] = None
+
+
+class ArtifactStore:
+    """Memory LRU over a memory-mapped disk tier, with single-flight generation."""
+
+    def __init__(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        memory_items: int = 256,
+        memory_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.root = Path(root) if root is not None else get_path("outputs") / "artifacts"
+        self.memory_items = memory_items
+        self.memory_bytes = memory_bytes
+        self._memory: "OrderedDict[str, Artifact]" = OrderedDict()
+        self._memory_used = 0
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "joined": 0}
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.npy"
+
+    # --- Memory tier ---
+    def _remember(self, key: str, artifact: Artifact) -> None:
+        size = artifact[0].nbytes
+        if size > self.memory_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_used -= old[0].nbytes
+            self._memory[key] = artifact
+            self._memory_used += size
+            while self._memory and (len(self._memory) > self.memory_items or self._memory_used > self.memory_bytes):
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_used -= evicted[0].nbytes
+
+    # --- Lookup / store ---
+    def get(self, key: str) -> Optional[Artifact]:
+        """Memory tier, then disk (memory-mapped, read-only). None on a miss."""
+        with self._lock:
+            artifact = self._memory.get(key)
+            if artifact is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return artifact
+        path = self.path(key)
+        try:
+            array = np.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            return None
+        meta_path = path.with_suffix(".json")
+        meta = json.loads(meta_path.read_text(encoding="utf-8")) if meta_path.exists() else {}
+        artifact = (array, meta)
+        self._remember(key, artifact)
+        with self._lock:
+            self.stats["disk_hits"] += 1
+        return artifact
+
+    def put(self, key: str, array: Any, meta: Optional[Dict[str, Any]] = None) -> Artifact:
+        """Write atomically to disk and return the memory-mapped artifact."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        array = np.ascontiguousarray(array)
+        meta = dict(meta or {})
+        suffix = f"{os.getpid()}.{threading.get_ident()}"
+        # The sidecar goes first, so a reader that finds the array also finds its meta.
+        meta_tmp = path.with_name(f".{key}.{suffix}.json.tmp")
+        meta_tmp.write_text(json.dumps(meta, default=str), encoding="utf-8")
+        os.replace(meta_tmp, path.with_suffix(".json"))
+        tmp = path.with_name(f".{key}.{suffix}.tmp")
+        with open(tmp, "wb") as fh:
+            np.save(fh, array)
+        os.replace(tmp, path)
+        artifact = (np.load(path, mmap_mode="r"), meta)
+        self._remember(key, artifact)
+        return artifact
+
+    def get_or_create(self, key: str, produce: Callable[[], Any], meta: Optional[Dict[str, Any]] = None) -> Tuple[Artifact, bool]:
+        """
+        Return ``(artifact, cached)``. On a miss ``produce()`` runs once per key even
+        under concurrent callers; the others wait and share its result or error.
+        """
+        artifact = self.get(key)
+        if artifact is not None:
+            return artifact, True
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.stats["misses"] += 1
+            else:
+                self.stats["joined"] += 1
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            artifact = self.get(key)  # a writer may have finished between our miss and taking the lead
+            if artifact is None:
+                artifact = self.put(key, produce(), meta)
+            flight.result = artifact
+            return artifact, False
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_used = 0
+
+
+def placeholder_media(mode: str, prompt: str, params: Dict[str, Any]) -> np.ndarray:
+    """
+    Deterministic stand-in output until a real backend is wired: uint8 RGB noise for
+    images, float32 noise for audio, seeded by the request key.
+    """
+    rng = np.random.default_rng(int(artifact_key(mode, prompt, params)[:16], 16))
+    if mode == "image":
+        return rng.integers(0, 256, size=(int(params["height"]), int(params["width"]), 3), dtype=np.uint8)
+    samples = int(params["duration_s"] * params.get("sample_rate", 16000))
+    return rng.standard_normal(samples, dtype=np.float32) * np.float32(0.1)
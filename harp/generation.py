@@ -0,0 +1,302 @@
+# orchestrAIframework/harp/generation.py
+"""
+OrchestrAIFramework - Harp Streaming Generation
+-----------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Token streaming with continuous batching.
+
+- GenerationBackend is the plug-in point for real decoders. ``prefill``
+  builds per-request state, and ``decode`` advances every state in a batch
+  by one token.
+- GenerationScheduler owns one decoding thread. Between decoding steps it
+  admits queued prompts into the running batch and retires finished ones,
+  so concurrent requests share every step instead of waiting for each
+  other (continuous batching). The thread sleeps on a condition variable
+  when idle.
+- Each request is consumed as a plain generator (``stream``), an async
+  generator (``astream``) or a complete string (``generate``). Requests
+  record time-to-first-token and tokens/sec.
+- EchoBackend is a deterministic local stand-in. The same prompt always
+  yields the same tokens, and an optional per-step cost imitates batched
+  accelerator latency.
+"""
+
+import hashlib
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Sequence
+
+_END = object()
+
+
+class GenerationBackend(ABC):
+    """Batched incremental decoder."""
+
+    name: str = "backend"
+
+    @abstractmethod
+    def prefill(self, prompts: Sequence[str]) -> List[Any]:
+        """Build one decoding state per prompt."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, states: Sequence[Any]) -> List[Optional[str]]:
+        """Advance every state by one step; return its next text piece, or None at end of sequence."""
+        raise NotImplementedError
+
+
+class EchoBackend(GenerationBackend):
+    """
+    Deterministic stand-in: echoes the prompt words, then continues with words
+    picked from a fixed lexicon by a BLAKE2b hash of (prompt, position).
+    ``step_s + per_seq_s * batch`` seconds are slept per decode step.
+    """
+
+    name = "echo"
+    LEXICON = (
+        "harmony", "melody", "rhythm", "tempo", "chord", "score", "section", "motif",
+        "cadence", "phrase", "timbre", "accent", "measure", "octave", "theme", "coda",
+    )
+
+    def __init__(self, length: int = 32, step_s: float = 0.0, per_seq_s: float = 0.0):
+        self.length = length
+        self.step_s = step_s
+        self.per_seq_s = per_seq_s
+
+    def prefill(self, prompts: Sequence[str]) -> List[Any]:
+        return [{"prompt": p, "words": p.split(), "pos": 0} for p in prompts]
+
+    def _word(self, state: Dict[str, Any]) -> str:
+        pos, words = state["pos"], state["words"]
+        if pos < len(words):
+            return words[pos]
+        digest = hashlib.blake2b(f"{state['prompt']}\x00{pos}".encode("utf-8"), digest_size=2).digest()
+        return self.LEXICON[int.from_bytes(digest, "little") % len(self.LEXICON)]
+
+    def decode(self, states: Sequence[Any]) -> List[Optional[str]]:
+        if self.step_s or self.per_seq_s:
+            time.sleep(self.step_s + self.per_seq_s * len(states))
+        out: List[Optional[str]] = []
+        for state in states:
+            if state["pos"] >= self.length:
+                out.append(None)
+                continue
+            word = self._word(state)
+            out.append(word if state["pos"] == 0 else " " + word)
+            state["pos"] += 1
+        return out
+
+
+class GenerationRequest:
+    """One prompt in flight: its token sink and latency counters."""
+
+    def __init__(self, prompt: str, max_tokens: int, loop: Optional[Any] = None, sink: Optional[Any] = None):
+        if max_tokens <= 0:
+            raise ValueError(f"max_tokens must be positive, got {max_tokens}.")
+        self.prompt = prompt
+        self.max_tokens = max_tokens
+        self.state: Any = None
+        self.cancelled = False
+        self.n_tokens = 0
+        self.submitted_at = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._loop = loop
+        self._sink = sink if sink is not None else queue.SimpleQueue()
+
+    def _deliver(self, item: Any) -> None:
+        """Hand ``item`` to the consumer; a consumer whose event loop has closed is dropped."""
+        if self._loop is None:
+            self._sink.put(item)
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._sink.put_nowait, item)
+        except RuntimeError:  # "Event loop is closed": nobody is listening any more
+            self.cancelled = True
+
+    def _push(self, piece: str) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.n_tokens += 1
+        self._deliver(piece)
+
+    def _finish(self, error: Optional[BaseException] = None) -> None:
+        self.finished_at = time.perf_counter()
+        self._deliver(_END if error is None else error)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    @property
+    def ttft_s(self) -> Optional[float]:
+        return None if self.first_token_at is None else self.first_token_at - self.submitted_at
+
+    @property
+    def tokens_per_s(self) -> Optional[float]:
+        if self.finished_at is None or self.first_token_at is None:
+            return None
+        return self.n_tokens / max(self.finished_at - self.submitted_at, 1e-9)
+
+
+class GenerationScheduler:
+    """Continuous-batching front end shared by every caller of one backend."""
+
+    def __init__(self, backend: GenerationBackend, max_batch_size: int = 32):
+        self.backend = backend
+        self.max_batch_size = max(1, int(max_batch_size))
+        self._waiting: Deque[GenerationRequest] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._active: List[GenerationRequest] = []  # requests in the running batch
+        self._closed = False
+        self.steps = 0
+        self.tokens = 0
+        self.requests = 0
+
+    # --- Submission ---
+    def submit(self, request: GenerationRequest) -> GenerationRequest:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("GenerationScheduler is closed.")
+            self._waiting.append(request)
+            self.requests += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="orchestrai-generation", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return request
+
+    def stream(self, prompt: str, max_tokens: int = 64) -> Iterator[str]:
+        """Yield text pieces as they are decoded. Closing the generator cancels the request."""
+        request = self.submit(GenerationRequest(prompt, max_tokens))
+        try:
+            while True:
+                item = request._sink.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            request.cancel()
+
+    async def astream(self, prompt: str, max_tokens: int = 64) -> AsyncIterator[str]:
+        """Async variant of ``stream``; pieces are handed to the running event loop."""
+        import asyncio
+
+        sink: "asyncio.Queue[Any]" = asyncio.Queue()
+        request = self.submit(GenerationRequest(prompt, max_tokens, loop=asyncio.get_running_loop(), sink=sink))
+        try:
+            while True:
+                item = await sink.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            request.cancel()
+
+    def generate(self, prompt: str, max_tokens: int = 64) -> str:
+        return "".join(self.stream(prompt, max_tokens))
+
+    # --- Decoding loop ---
+    def _admit(self, active: List[GenerationRequest]) -> List[GenerationRequest]:
+        with self._cond:
+            while not self._waiting and not active and not self._closed:
+                self._cond.wait()
+            room = self.max_batch_size - len(active)
+            admitted = [self._waiting.popleft() for _ in range(min(room, len(self._waiting)))]
+        return [r for r in admitted if not r.cancelled]
+
+    def _run(self) -> None:
+        try:
+            self._decode_loop()
+        except BaseException as exc:  # a bug must not strand every later request
+            for request in self._active:
+                self._settle(request, exc)
+            raise
+        finally:
+            with self._cond:
+                self._active = []
+                self._thread = None
+                if self._waiting and not self._closed:  # requests queued while dying get a fresh thread
+                    self._thread = threading.Thread(target=self._run, name="orchestrai-generation", daemon=True)
+                    self._thread.start()
+
+    @staticmethod
+    def _settle(request: GenerationRequest, error: Optional[BaseException] = None) -> None:
+        """Finish ``request`` once; a failing consumer must not take the decoding loop down."""
+        if request.finished_at is not None:
+            return
+        try:
+            request._finish(error)
+        except Exception:
+            request.cancelled = True
+
+    def _decode_loop(self) -> None:
+        self._active = active = []
+        while True:
+            admitted = self._admit(active)
+            if self._closed:
+                for request in active + admitted + list(self._waiting):
+                    self._settle(request, RuntimeError("GenerationScheduler was closed."))
+                return
+            try:
+                if admitted:
+                    for request, state in zip(admitted, self.backend.prefill([r.prompt for r in admitted])):
+                        request.state = state
+                    active.extend(admitted)
+                    self._active = active
+                for request in active:
+                    if request.cancelled:
+                        self._settle(request)
+                self._active = active = [r for r in active if not r.cancelled]
+                if not active:
+                    continue
+                pieces = self.backend.decode([r.state for r in active])
+            except Exception as exc:  # surface backend failures in every consumer
+                for request in active + admitted:
+                    self._settle(request, exc)
+                self._active = active = []
+                continue
+
+            self.steps += 1
+            running: List[GenerationRequest] = []
+            for request, piece in zip(active, pieces):
+                if request.cancelled or piece is None:  # consumer left during the step, or end of sequence
+                    self._settle(request)
+                    continue
+                try:
+                    request._push(piece)
+                except Exception as exc:
+                    self._settle(request, exc)
+                    continue
+                self.tokens += 1
+                if request.cancelled or request.n_tokens >= request.max_tokens:
+                    self._settle(request)
+                else:
+                    running.append(request)
+            self._active = active = running
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "steps": self.steps,
+            "tokens": self.tokens,
+            "mean_batch": self.tokens / self.steps if self.steps else 0.0,
+        }
+
+    def close(self) -> None:
+        """Stop the decoding thread; requests still in flight end with an error."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
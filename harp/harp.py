@@ -7,10 +7,12 @@ License: MIT
 
 The Harp section focuses on generative media (images/audio/text).
 This scaffold defines a clean interface for future diffusion/VAEs/GANs integrations.
+Text is streamed through a continuous-batching scheduler; image/audio outputs
+are cached in a content-addressed artifact store.
 """
 
-from typing import Any, Dict, List, Optional
-from orchestrAIframework.common.logging import log_message
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from orchestrAIframework.common.logging import log_enabled, log_message
 
 
 class Harp:
@@ -27,6 +29,8 @@ class Harp:
         self.name = name
         self.mode: str = "text"
         self.backend: Optional[Any] = None
+        self.generator: Optional[Any] = None  # GenerationScheduler, built on first text request
+        self.artifacts: Optional[Any] = None  # ArtifactStore, built on first image/audio request
         self.config: Dict[str, Any] = {}
         log_message("info", f"[Harp] Initialized section: {self.name}")
 
@@ -40,23 +44,80 @@ class Harp:
         # self.backend = ...  # Wire real models later
         log_message("info", f"[Harp] Backend set to '{self.mode}' with config={kwargs}")
 
-    # --- Text generation stub ---
+    # --- Text generation (see harp/generation.py) ---
+    def set_text_backend(self, backend: Any, max_batch_size: int = 32) -> Any:
+        """
+        Serve text generation from ``backend`` (a GenerationBackend) through a
+        continuous-batching scheduler. By default a deterministic EchoBackend is used.
+        """
+        from orchestrAIframework.harp.generation import GenerationScheduler
+
+        if self.generator is not None:
+            self.generator.close()
+        self.generator = GenerationScheduler(backend, max_batch_size=max_batch_size)
+        log_message("info", f"[Harp] Text backend set to '{backend.name}' (max_batch_size={max_batch_size}).")
+        return self.generator
+
+    def _scheduler(self) -> Any:
+        if self.generator is None:
+            from orchestrAIframework.harp.generation import EchoBackend
+
+            self.set_text_backend(EchoBackend(), max_batch_size=int(self.config.get("max_batch_size", 32)))
+        return self.generator
+
+    def stream_text(self, prompt: str, max_len: int = 64) -> Iterator[str]:
+        """Yield generated text pieces as soon as each decoding step produces them."""
+        return self._scheduler().stream(prompt, max_len)
+
+    def astream_text(self, prompt: str, max_len: int = 64) -> AsyncIterator[str]:
+        """Async-iterator variant of ``stream_text``."""
+        return self._scheduler().astream(prompt, max_len)
+
     def generate_text(self, prompt: str, max_len: int = 64) -> str:
-        out = f"[Stub:{self.mode}] {prompt[:max_len]}"
-        log_message("info", f"[Harp] generate_text() -> {out}")
+        out = "".join(self.stream_text(prompt, max_len))
+        if log_enabled("info"):
+            log_message("info", f"[Harp] generate_text() -> {out}")
         return out
 
-    # --- Image generation stub ---
+    # --- Media generation (see harp/artifacts.py) ---
+    def set_media_backend(self, backend: Any) -> None:
+        """
+        Plug an image/audio generator: a callable ``(mode, prompt, params) -> array``.
+        Until one is set, deterministic placeholder arrays are produced. Cached
+        artifacts are keyed by the backend's ``name`` and ``version`` (or a hash of
+        its config), so outputs of a previous backend are never served.
+        """
+        self.backend = backend
+        log_message("info", f"[Harp] Media backend set to {getattr(backend, '__name__', type(backend).__name__)}.")
+
+    def _artifact(self, mode: str, prompt: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        from orchestrAIframework.harp.artifacts import ArtifactStore, artifact_key, backend_identity, placeholder_media
+
+        if self.artifacts is None:
+            self.artifacts = ArtifactStore(
+                memory_items=int(self.config.get("artifact_cache_items", 256)),
+                memory_bytes=int(self.config.get("artifact_cache_bytes", 256 * 1024 * 1024)),
+            )
+        render = self.backend if callable(self.backend) else placeholder_media
+        backend = backend_identity(render)
+        key = artifact_key(mode, prompt, params, backend)
+        meta = {"mode": mode, "prompt": prompt, "backend": backend, **params}
+        (array, _), cached = self.artifacts.get_or_create(key, lambda: render(mode, prompt, params), meta)
+        return {**meta, "artifact": array, "artifact_key": key,
+                "artifact_path": str(self.artifacts.path(key)), "cached": cached}
+
     def generate_image(self, prompt: str, width: int = 256, height: int = 256) -> Dict[str, Any]:
-        # Returns a metadata stub; real impl would return an image array or path
-        meta = {"prompt": prompt, "width": width, "height": height, "artifact": None}
-        log_message("info", f"[Harp] generate_image() -> meta={meta}")
+        """Metadata plus the (memory-mapped, read-only) image array; identical requests are served from cache."""
+        meta = self._artifact("image", prompt, {"width": width, "height": height})
+        if log_enabled("info"):
+            log_message("info", f"[Harp] generate_image() -> key={meta['artifact_key']} cached={meta['cached']}")
         return meta
 
-    # --- Audio generation stub ---
     def generate_audio(self, prompt: str, duration_s: int = 3) -> Dict[str, Any]:
-        meta = {"prompt": prompt, "duration_s": duration_s, "artifact": None}
-        log_message("info", f"[Harp] generate_audio() -> meta={meta}")
+        """Metadata plus the (memory-mapped, read-only) waveform array; identical requests are served from cache."""
+        meta = self._artifact("audio", prompt, {"duration_s": duration_s})
+        if log_enabled("info"):
+            log_message("info", f"[Harp] generate_audio() -> key={meta['artifact_key']} cached={meta['cached']}")
         return meta
 
     # --- Orchestral entrypoint ---
@@ -15,3 +15,31 @@ class Section(ABC):
         """Entry point called by the Conductor."""
         raise NotImplementedError
 
+
+class AsyncSection(Section):
+    """
+    Base for I/O-bound sections whose entry point is a coroutine.
+    Conductor.aplay awaits ``aperform`` directly; Conductor.play falls back to ``perform``.
+    """
+
+    @abstractmethod
+    async def aperform(self, score: Optional[Dict[str, Any]] = None) -> None:
+        """Async entry point awaited by the Conductor."""
+        raise NotImplementedError
+
+    def perform(self, score: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Blocking entry point: runs ``aperform`` on a private event loop. Inside a
+        running loop, await ``aperform`` (or use Conductor.aplay) instead.
+        """
+        import asyncio
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self.aperform(score))
+            return
+        raise RuntimeError(
+            f"{type(self).__name__}.perform() cannot block inside a running event loop. "
+            "Await aperform() or use Conductor.aplay() instead."
+        )
@@ -0,0 +1,316 @@
+# orchestrAIframework/keyboards/feature_store.py
+"""
+OrchestrAIFramework - Keyboards Feature Store
+---------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Embedded, on-disk columnar store for per-entity features.
+
+Layout under ORCH_PATHS["data"]/feature_stores/<name>:
+
+    segments/s000001/entity_ids.npy    sorted int64 ids
+    segments/s000001/<column>.npy      one file per feature column
+    segments/s000001/<column>.mask.npy optional: rows that hold the column
+    versions/v000001.json              manifest: columns + live segments
+    CURRENT                            name of a recent manifest
+
+Column names must be identifiers, so they never contain the ``.mask`` suffix,
+and ``entity_ids`` is reserved for the id index.
+
+- Writes are append-only. Each write adds one immutable segment, then a
+  new manifest, then swaps CURRENT with ``os.replace``. Readers keep the
+  snapshot they opened and never wait on a writer. ``refresh`` moves a
+  reader to the newest version.
+- A lookup maps every segment's files read-only. Ids are found with a
+  binary search over each segment's sorted ids. Each column takes its value
+  from the newest segment that has that column, so a write may update a
+  subset of the columns. Only the touched rows of each column file are
+  gathered into one dense (keys, columns) matrix.
+- A bounded LRU keeps full raw rows of hot keys for the current snapshot,
+  with a per-column presence mask. ``fill`` is applied after the cache, so
+  callers with different fill values share entries.
+- ``compact`` folds all segments into one, newest value wins, and
+  publishes it as a new version. Columns that some entities lack get a
+  presence mask file, so the merged segment answers ``fill`` the same way.
+- Several writer processes may share a store. Segment directories are
+  claimed with ``mkdir``. A version is claimed by hard-linking its fully
+  written manifest into place, which fails if the file already exists. A
+  writer that loses the race re-reads the newest version and republishes
+  on top of it, so no write is dropped. CURRENT is only a hint: ``refresh``
+  follows it and then walks forward to the newest manifest.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from orchestrAIframework.common.paths import get_path
+
+# Segment file stems that are not feature columns.
+RESERVED_COLUMNS = ("entity_ids",)
+
+
+def store_dir(name_or_dir: Union[str, Path]) -> Path:
+    """Plain names live under ORCH_PATHS['data']/feature_stores; paths are used as given."""
+    path = Path(name_or_dir)
+    if path.is_absolute() or len(path.parts) > 1:
+        return path
+    return get_path("data") / "feature_stores" / str(name_or_dir)
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class _Segment:
+    """Memory-mapped view of one immutable segment."""
+
+    def __init__(self, directory: Path, columns: Sequence[str]):
+        self.name = directory.name
+        self.ids = np.load(directory / "entity_ids.npy", mmap_mode="r")
+        self.columns: Dict[str, np.ndarray] = {}
+        self.masks: Dict[str, np.ndarray] = {}  # column -> rows that hold it, when not every row does
+        for column in columns:
+            path = directory / f"{column}.npy"
+            if path.exists():
+                self.columns[column] = np.load(path, mmap_mode="r")
+                mask = directory / f"{column}.mask.npy"
+                if mask.exists():
+                    self.masks[column] = np.load(mask, mmap_mode="r")
+
+    def find(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(hit mask, row positions) of ``keys`` in this segment."""
+        if self.ids.size == 0:
+            return np.zeros(keys.size, dtype=bool), np.zeros(keys.size, dtype=np.int64)
+        pos = np.searchsorted(self.ids, keys)
+        pos = np.minimum(pos, self.ids.size - 1)
+        return np.asarray(self.ids[pos]) == keys, pos
+
+
+class FeatureStore:
+    """Versioned columnar feature store with batched lookups and a hot-key cache."""
+
+    def __init__(self, name_or_dir: Union[str, Path], cache_size: int = 100_000, dtype: Any = np.float32):
+        self.root = store_dir(name_or_dir)
+        self.cache_size = cache_size
+        self.dtype = np.dtype(dtype)
+        self._write_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._cache: "OrderedDict[int, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()  # id -> (raw row, present)
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self.columns: List[str] = []
+        self._segments: List[_Segment] = []
+        self.refresh()
+
+    # --- Snapshots ---
+    def _manifest(self, version: int) -> Path:
+        return self.root / "versions" / f"v{version:06d}.json"
+
+    def refresh(self) -> int:
+        """Switch to the newest published version. Returns the version number."""
+        current = self.root / "CURRENT"
+        if not current.exists():
+            return self.version
+        version = max(int(current.read_text(encoding="utf-8").strip()[1:].split(".")[0]), self.version)
+        while self._manifest(version + 1).exists():  # another writer may have published past CURRENT
+            version += 1
+        if version == self.version:
+            return self.version
+        manifest = json.loads(self._manifest(version).read_text(encoding="utf-8"))
+        segments = [_Segment(self.root / "segments" / s, manifest["columns"]) for s in manifest["segments"]]
+        with self._cache_lock:
+            self.columns, self._segments, self.version = manifest["columns"], segments, manifest["version"]
+            self._cache.clear()
+        return self.version
+
+    def __len__(self) -> int:
+        """Rows across segments (an upper bound on distinct entities until compaction)."""
+        return sum(s.ids.size for s in self._segments)
+
+    # --- Writes ---
+    def _publish(self, segments: List[str], columns: List[str]) -> bool:
+        """
+        Claim version ``self.version + 1`` for this manifest. Returns False when
+        another writer claimed it first; the caller refreshes and retries.
+        """
+        version = self.version + 1
+        manifest = {"version": version, "columns": columns, "segments": segments}
+        path = self._manifest(version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        try:
+            os.link(tmp, path)  # atomic create-if-absent of a complete file
+        except FileExistsError:
+            return False
+        finally:
+            tmp.unlink()
+        _atomic_write_text(self.root / "CURRENT", path.name)
+        self.refresh()
+        return True
+
+    def _write_segment(self, ids: np.ndarray, features: Mapping[str, np.ndarray],
+                       masks: Optional[Mapping[str, np.ndarray]] = None) -> str:
+        """Write an unpublished segment; its directory name is claimed with mkdir."""
+        segments = self.root / "segments"
+        segments.mkdir(parents=True, exist_ok=True)
+        number = 1 + max((int(p.name[1:]) for p in segments.iterdir() if p.name.startswith("s")), default=0)
+        while True:
+            directory = segments / f"s{number:06d}"
+            try:
+                directory.mkdir()
+                break
+            except FileExistsError:
+                number += 1
+        # Readers only open segments listed in a manifest, so filling the directory in place is safe.
+        np.save(directory / "entity_ids.npy", ids)
+        for column, values in features.items():
+            np.save(directory / f"{column}.npy", values)
+        for column, mask in (masks or {}).items():
+            np.save(directory / f"{column}.mask.npy", mask)
+        return directory.name
+
+    def write(self, entity_ids: Any, features: Mapping[str, Any]) -> int:
+        """
+        Upsert rows for ``entity_ids`` as a new immutable segment and publish a new
+        version. Within one call the last occurrence of an id wins. Returns the version.
+        """
+        ids = np.asarray(entity_ids, dtype=np.int64).ravel()
+        columns = {name: np.asarray(values, dtype=self.dtype).ravel() for name, values in features.items()}
+        for name, values in columns.items():
+            if values.size != ids.size:
+                raise ValueError(f"Column '{name}' has {values.size} values for {ids.size} ids.")
+            if not name.isidentifier():
+                raise ValueError(f"Column name '{name}' must be a valid identifier.")
+            if name in RESERVED_COLUMNS:
+                raise ValueError(f"Column name '{name}' is reserved. Avoid {RESERVED_COLUMNS}.")
+        # Sort by id, keeping the last occurrence of duplicates.
+        last = ids.size - 1 - np.unique(ids[::-1], return_index=True)[1]
+        order = last[np.argsort(ids[last], kind="stable")]
+
+        with self._write_lock:
+            segment = self._write_segment(ids[order], {n: v[order] for n, v in columns.items()})
+            while True:
+                self.refresh()
+                names = self.columns + [c for c in columns if c not in self.columns]
+                if self._publish([s.name for s in self._segments] + [segment], names):
+                    return self.version
+
+    def compact(self) -> int:
+        """Merge every segment into one (newest value wins) and publish it."""
+        with self._write_lock:
+            while True:
+                self.refresh()
+                segments, columns = self._segments, list(self.columns)
+                if len(segments) <= 1:
+                    return self.version
+                ids = np.unique(np.concatenate([np.asarray(s.ids) for s in segments]))
+                values = np.zeros((ids.size, len(columns)), dtype=self.dtype)
+                present = np.zeros(values.shape, dtype=bool)
+                self._gather(ids, values, np.zeros(ids.size, dtype=bool), present, segments, columns)
+                masks = {c: present[:, j] for j, c in enumerate(columns) if not present[:, j].all()}
+                segment = self._write_segment(ids, {c: values[:, j] for j, c in enumerate(columns)}, masks)
+                if self._publish([segment], columns):
+                    return self.version
+
+    # --- Reads ---
+    def _gather(self, keys: np.ndarray, out: np.ndarray, found: np.ndarray, present: np.ndarray,
+                segments: List[_Segment], columns: List[str]) -> None:
+        """Fill ``out``/``found``/``present`` for ``keys``; each cell takes the newest segment holding it."""
+        located = [(segment, *segment.find(keys)) for segment in reversed(segments)]
+        for _, hit, _ in located:
+            found |= hit
+        # Columns present in the same segments share one read plan of (segment, rows, src).
+        plans: Dict[Tuple[Any, ...], List[Tuple[_Segment, np.ndarray, np.ndarray]]] = {}
+        for j, column in enumerate(columns):
+            signature = tuple(
+                (seg.name, column if column in seg.masks else None) for seg, _, _ in located if column in seg.columns
+            )
+            plan = plans.get(signature)
+            if plan is None:
+                plan, need = [], found.copy()
+                for segment, hit, pos in located:
+                    if column not in segment.columns or not need.any():
+                        continue
+                    if column in segment.masks:
+                        hit = hit & np.asarray(segment.masks[column][pos])
+                    rows = np.flatnonzero(need & hit)
+                    if rows.size:
+                        src = pos[rows]
+                        order = np.argsort(src, kind="stable")  # read the mapped file forward
+                        plan.append((segment, rows[order], src[order]))
+                        need[rows] = False
+                plans[signature] = plan
+            for segment, rows, src in plan:
+                out[rows, j] = segment.columns[column][src]
+                present[rows, j] = True
+
+    def lookup(
+        self,
+        entity_ids: Any,
+        columns: Optional[Sequence[str]] = None,
+        fill: float = np.nan,
+        use_cache: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dense ``(len(entity_ids), len(columns))`` matrix plus a ``found`` mask.
+        Unknown ids and columns a segment lacks are filled with ``fill``.
+        """
+        keys = np.asarray(entity_ids, dtype=np.int64).ravel()
+        with self._cache_lock:
+            segments, all_columns = self._segments, self.columns
+        wanted = list(all_columns) if columns is None else list(columns)
+        unknown = [c for c in wanted if c not in all_columns]
+        if unknown:
+            raise ValueError(f"Unknown column(s) {unknown}. Choose from {all_columns}.")
+        select = [all_columns.index(c) for c in wanted]
+
+        full = np.zeros((keys.size, len(all_columns)), dtype=self.dtype)  # raw values; fill is applied last
+        present = np.zeros(full.shape, dtype=bool)
+        found = np.zeros(keys.size, dtype=bool)
+        if use_cache and self.cache_size > 0:
+            with self._cache_lock:
+                cache = self._cache
+                key_list = keys.tolist()
+                cached = [cache.get(key) for key in key_list]
+                hit_idx = [i for i, entry in enumerate(cached) if entry is not None]
+                touch = cache.move_to_end
+                for i in hit_idx:
+                    touch(key_list[i])
+                self.hits += len(hit_idx)
+                self.misses += keys.size - len(hit_idx)
+            if hit_idx:
+                full[hit_idx] = np.stack([cached[i][0] for i in hit_idx])
+                present[hit_idx] = np.stack([cached[i][1] for i in hit_idx])
+                found[hit_idx] = True
+            missing = [i for i, entry in enumerate(cached) if entry is None]
+            if missing:
+                idx = np.asarray(missing, dtype=np.int64)
+                sub = np.zeros((idx.size, len(all_columns)), dtype=self.dtype)
+                sub_present = np.zeros(sub.shape, dtype=bool)
+                sub_found = np.zeros(idx.size, dtype=bool)
+                self._gather(keys[idx], sub, sub_found, sub_present, segments, all_columns)
+                full[idx], present[idx], found[idx] = sub, sub_present, sub_found
+                with self._cache_lock:
+                    if segments is self._segments:  # do not cache rows from a stale snapshot
+                        for key, row, mask in zip(keys[idx][sub_found].tolist(), sub[sub_found], sub_present[sub_found]):
+                            self._cache[key] = (row, mask)
+                        while len(self._cache) > self.cache_size:
+                            self._cache.popitem(last=False)
+        else:
+            self._gather(keys, full, found, present, segments, all_columns)
+        if not present.all():
+            full[~present] = fill
+
+        matrix = full if select == list(range(len(all_columns))) else full[:, select]
+        return matrix, found
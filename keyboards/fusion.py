@@ -0,0 +1,161 @@
+# orchestrAIframework/keyboards/fusion.py
+"""
+OrchestrAIFramework - Keyboards Batch Fusion
+--------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Fuse N feature blocks (embedding, tabular, sequence, ...) for a whole batch.
+
+- "concat": every block is copied once, straight into its column slice of a
+  preallocated output matrix. The matrix is reused across calls and grows
+  only when a larger batch arrives. Per-block normalization ("l2" rows or
+  "standard" columns) and weights are then applied in place on that slice,
+  with the weight folded into the same pass.
+- "linear": the concatenated batch goes through one matrix product with a
+  learned projection ``W`` (plus bias), written into a second reusable
+  buffer. ``fit_projection`` learns ``W`` by ridge regression on the fused
+  features. A trained matrix can also be set directly.
+
+Returned arrays are views of the internal buffers and are overwritten by the
+next call. Copy them, or pass ``out=``, to keep a result.
+"""
+
+from typing import Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+NORMALIZERS = (None, "l2", "standard")
+FUSION_MODES = ("concat", "linear")
+
+
+class BatchFuser:
+    """Writes feature blocks into one reusable (batch, sum(dims)) matrix."""
+
+    def __init__(
+        self,
+        dims: Sequence[int],
+        normalize: Union[None, str, Sequence[Optional[str]]] = None,
+        weights: Optional[Sequence[float]] = None,
+        mode: str = "concat",
+        dtype: Any = np.float32,
+    ):
+        if mode not in FUSION_MODES:
+            raise ValueError(f"Unknown fusion mode '{mode}'. Choose from {FUSION_MODES}.")
+        self.dims = [int(d) for d in dims]
+        norms = [normalize] * len(self.dims) if normalize is None or isinstance(normalize, str) else list(normalize)
+        for norm in norms:
+            if norm not in NORMALIZERS:
+                raise ValueError(f"Unknown normalization '{norm}'. Choose from {NORMALIZERS}.")
+        if len(norms) != len(self.dims):
+            raise ValueError("normalize must be one value or one per block.")
+        self.normalize = norms
+        self.weights = [1.0] * len(self.dims) if weights is None else [float(w) for w in weights]
+        if len(self.weights) != len(self.dims):
+            raise ValueError("weights must have one value per block.")
+        self.mode = mode
+        self.dtype = np.dtype(dtype)
+        self.offsets = np.concatenate([[0], np.cumsum(self.dims)]).astype(int).tolist()
+
+        self.mean: List[Optional[np.ndarray]] = [None] * len(self.dims)
+        self.scale: List[Optional[np.ndarray]] = [None] * len(self.dims)
+        self.projection: Optional[np.ndarray] = None
+        self.bias: Optional[np.ndarray] = None
+        self._buffer = np.empty((0, self.width), dtype=self.dtype)
+        self._projected = np.empty((0, 0), dtype=self.dtype)
+
+    @property
+    def width(self) -> int:
+        return self.offsets[-1]
+
+    def _check(self, blocks: Sequence[Any]) -> int:
+        if len(blocks) != len(self.dims):
+            raise ValueError(f"Expected {len(self.dims)} blocks, got {len(blocks)}.")
+        n = None
+        for i, (block, dim) in enumerate(zip(blocks, self.dims)):
+            shape = np.shape(block)
+            if len(shape) != 2 or shape[1] != dim:
+                raise ValueError(f"Block {i} must have shape (batch, {dim}), got {shape}.")
+            if n is not None and shape[0] != n:
+                raise ValueError("All blocks must have the same number of rows.")
+            n = shape[0]
+        return n or 0
+
+    def _reserve(self, n: int) -> np.ndarray:
+        if self._buffer.shape[0] < n:
+            self._buffer = np.empty((max(n, 2 * self._buffer.shape[0]), self.width), dtype=self.dtype)
+        return self._buffer[:n]
+
+    # --- Fitting ---
+    def fit(self, blocks: Sequence[Any]) -> "BatchFuser":
+        """Learn column means/scales for blocks normalized with "standard"."""
+        self._check(blocks)
+        for i, (block, norm) in enumerate(zip(blocks, self.normalize)):
+            if norm == "standard":
+                block = np.asarray(block, dtype=np.float64)
+                std = block.std(axis=0)
+                self.mean[i] = block.mean(axis=0).astype(self.dtype)
+                self.scale[i] = (1.0 / np.where(std > 0, std, 1.0)).astype(self.dtype)
+        return self
+
+    def fit_projection(self, blocks: Sequence[Any], targets: Any, ridge: float = 1e-3) -> "BatchFuser":
+        """Learn ``W``/``b`` minimizing ||fused @ W + b - targets||^2 + ridge * ||W||^2."""
+        if any(norm == "standard" and self.mean[i] is None for i, norm in enumerate(self.normalize)):
+            self.fit(blocks)
+        X = np.asarray(self._concat(blocks, self._reserve(self._check(blocks))), dtype=np.float64)
+        Y = np.asarray(targets, dtype=np.float64)
+        Y = Y.reshape(-1, 1) if Y.ndim == 1 else Y
+        x_mean, y_mean = X.mean(axis=0), Y.mean(axis=0)
+        Xc = X - x_mean
+        gram = Xc.T @ Xc
+        gram[np.diag_indices_from(gram)] += ridge * X.shape[0]
+        W = np.linalg.solve(gram, Xc.T @ (Y - y_mean))
+        self.set_projection(W, y_mean - x_mean @ W)
+        return self
+
+    def set_projection(self, W: Any, bias: Optional[Any] = None) -> None:
+        W = np.asarray(W, dtype=self.dtype)
+        if W.ndim != 2 or W.shape[0] != self.width:
+            raise ValueError(f"Projection must have shape ({self.width}, out_dim), got {W.shape}.")
+        self.projection = np.ascontiguousarray(W)
+        self.bias = np.zeros(W.shape[1], dtype=self.dtype) if bias is None else np.asarray(bias, dtype=self.dtype)
+
+    # --- Fusion ---
+    def _concat(self, blocks: Sequence[Any], out: np.ndarray) -> np.ndarray:
+        for i, block in enumerate(blocks):
+            part = out[:, self.offsets[i]:self.offsets[i + 1]]
+            np.copyto(part, block, casting="same_kind")
+            norm, weight = self.normalize[i], self.weights[i]
+            if norm == "l2":
+                lengths = np.sqrt(np.einsum("ij,ij->i", part, part))
+                lengths /= weight
+                np.divide(part, lengths[:, None], out=part, where=lengths[:, None] > 0)
+            elif norm == "standard":
+                if self.mean[i] is None:
+                    raise RuntimeError("Standard normalization needs fit() first.")
+                part -= self.mean[i]
+                part *= self.scale[i] * weight if weight != 1.0 else self.scale[i]
+            elif weight != 1.0:
+                part *= weight
+        return out
+
+    def fuse(self, blocks: Sequence[Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Fuse a batch. ``concat`` returns (batch, sum(dims)); ``linear`` returns
+        (batch, out_dim). The result is written to ``out`` when given, otherwise
+        to a reused internal buffer.
+        """
+        n = self._check(blocks)
+        if self.mode == "concat":
+            return self._concat(blocks, out if out is not None else self._reserve(n))
+
+        if self.projection is None:
+            raise RuntimeError("Linear fusion needs a projection. Use fit_projection() or set_projection().")
+        fused = self._concat(blocks, self._reserve(n))
+        if out is None:
+            if self._projected.shape[0] < n or self._projected.shape[1] != self.projection.shape[1]:
+                self._projected = np.empty((max(n, 2 * self._projected.shape[0]), self.projection.shape[1]), dtype=self.dtype)
+            out = self._projected[:n]
+        np.matmul(fused, self.projection, out=out)
+        out += self.bias
+        return out
@@ -5,34 +5,125 @@ Author: Marcos Paulo Pazzinatto | License: MIT
 """
 
 from typing import Any, Dict, List, Optional
-from orchestrAIframework.common.logging import log_message
+from orchestrAIframework.common.logging import log_enabled, log_message
 from orchestrAIframework.interfaces.section_protocol import Section
 
 class Keyboards(Section):
     """
     Glue layer for features, embeddings, and late-fusion.
-    Backends (future): Feature stores, FAISS/Annoy indexes, fusion blocks.
+    Backends: in-project vector index (flat / IVF, memory-mapped), batch
+    fusion into reusable matrices and an embedded columnar feature store.
     """
 
     def __init__(self, name: str = "Keyboards"):
         self.name = name
         self.index: Optional[Any] = None
+        self.fuser: Optional[Any] = None  # BatchFuser used by fuse_batch()
+        self.store: Optional[Any] = None  # FeatureStore used by get_features()
         self.config: Dict[str, Any] = {}
         log_message("info", f"[Keyboards] Initialized section: {self.name}")
 
     def configure(self, **kwargs) -> None:
+        """Recognized keys: ``feature_store`` (name or path), ``feature_cache_size``."""
         self.config = kwargs
+        if "feature_store" in kwargs:
+            self.open_feature_store(kwargs["feature_store"], cache_size=int(kwargs.get("feature_cache_size", 100_000)))
         log_message("info", f"[Keyboards] Configured with {kwargs}")
 
+    # --- Feature store (see keyboards/feature_store.py) ---
+    def open_feature_store(self, name: str, cache_size: int = 100_000) -> Any:
+        """Open (or create) a store under ORCH_PATHS["data"]/feature_stores/<name>."""
+        from orchestrAIframework.keyboards.feature_store import FeatureStore
+
+        self.store = FeatureStore(name, cache_size=cache_size)
+        log_message("info", f"[Keyboards] Feature store '{name}' at version {self.store.version} ({self.store.columns}).")
+        return self.store
+
+    def write_features(self, entity_ids: Any, features: Dict[str, Any]) -> int:
+        """Append-only upsert; readers keep their snapshot until they refresh."""
+        if self.store is None:
+            raise RuntimeError("No feature store. Use open_feature_store() first.")
+        version = self.store.write(entity_ids, features)
+        log_message("info", f"[Keyboards] Wrote {len(entity_ids)} rows -> feature store version {version}.")
+        return version
+
+    def get_features(self, entity_ids: Any, columns: Optional[List[str]] = None) -> Any:
+        """Dense (len(entity_ids), len(columns)) matrix; missing entities are NaN."""
+        if self.store is None:
+            raise RuntimeError("No feature store. Use open_feature_store() first.")
+        matrix, found = self.store.lookup(entity_ids, columns)
+        if log_enabled("info"):
+            log_message("info", f"[Keyboards] Looked up {found.size} entities ({int(found.sum())} found).")
+        return matrix
+
+    # --- Vector index (see keyboards/vector_index.py) ---
+    def build_index(self, dim: int, metric: str = "ip", mode: str = "flat", **kwargs) -> Any:
+        """Create an empty exact ("flat") or approximate ("ivf") vector index."""
+        from orchestrAIframework.keyboards.vector_index import VectorIndex
+
+        self.index = VectorIndex(dim, metric=metric, mode=mode, **kwargs)
+        log_message("info", f"[Keyboards] Built {mode} index (dim={dim}, metric={metric}).")
+        return self.index
+
+    def add_vectors(self, vectors: Any, ids: Optional[Any] = None) -> Any:
+        if self.index is None:
+            raise RuntimeError("No vector index. Use build_index() or open_index() first.")
+        return self.index.add(vectors, ids)
+
+    def search(self, queries: Any, k: int = 10) -> Any:
+        """Top-k ``(scores, ids)`` for a batch of query vectors."""
+        if self.index is None:
+            raise RuntimeError("No vector index. Use build_index() or open_index() first.")
+        return self.index.search(queries, k)
+
+    def save_index(self, name: str) -> Any:
+        if self.index is None:
+            raise RuntimeError("No vector index to save.")
+        path = self.index.save(name)
+        log_message("info", f"[Keyboards] Saved index ({len(self.index)} vectors) to {path}.")
+        return path
+
+    def open_index(self, name: str, mmap: bool = True) -> Any:
+        from orchestrAIframework.keyboards.vector_index import VectorIndex
+
+        self.index = VectorIndex.open(name, mmap=mmap)
+        log_message("info", f"[Keyboards] Opened index '{name}' ({len(self.index)} vectors, mmap={mmap}).")
+        return self.index
+
+    # --- Fusion (see keyboards/fusion.py) ---
+    def configure_fusion(self, dims: List[int], mode: str = "concat", **kwargs) -> Any:
+        """
+        Set up batch fusion of len(dims) feature blocks. ``kwargs``: normalize
+        (None / "l2" / "standard", once or per block), weights, dtype.
+        """
+        from orchestrAIframework.keyboards.fusion import BatchFuser
+
+        self.fuser = BatchFuser(dims, mode=mode, **kwargs)
+        log_message("info", f"[Keyboards] Fusion configured: mode={mode}, dims={list(dims)}.")
+        return self.fuser
+
+    def fuse_batch(self, *blocks: Any, out: Optional[Any] = None) -> Any:
+        """
+        Fuse 2-D feature blocks (one row per example) for a whole batch into a
+        reused matrix. Without configure_fusion(), blocks are concatenated as-is.
+        """
+        if self.fuser is None:
+            self.configure_fusion([b.shape[1] for b in blocks])
+        fused = self.fuser.fuse(blocks, out=out)
+        if log_enabled("info"):
+            log_message("info", f"[Keyboards] Fused {len(blocks)} blocks x {fused.shape[0]} rows -> dim {fused.shape[1]}.")
+        return fused
+
     def fuse(self, *features: List[float]) -> List[float]:
         """
-        Simple concatenation-based fusion (stub).
-        Replace with learned fusion later.
+        Concatenate the feature vectors of a single example.
+        Use fuse_batch() for many rows at once.
         """
         out: List[float] = []
         for vec in features:
             out.extend(vec)
-        log_message("info", f"[Keyboards] Fused {len(features)} vectors -> dim {len(out)}.")
+        if log_enabled("info"):
+            log_message("info", f"[Keyboards] Fused {len(features)} vectors -> dim {len(out)}.")
         return out
 
     def perform(self, score: Optional[Dict[str, Any]] = None) -> None:
@@ -0,0 +1,421 @@
+# orchestrAIframework/keyboards/vector_index.py
+"""
+OrchestrAIFramework - Keyboards Vector Index
+--------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+In-project top-k vector search with two modes:
+
+- "flat": exact brute force. Vectors are scored in blocks with one matrix
+  product per block, and the best k are kept with ``argpartition`` (no heaps).
+- "ivf": approximate inverted-file search. Vectors are assigned to k-means
+  centroids and stored grouped by list; a query only scores the ``nprobe``
+  closest lists. Until ``nlist`` vectors have arrived the index cannot be
+  trained, so adds are buffered and searched exactly. The first add that
+  reaches ``nlist`` trains on everything buffered so far.
+
+An index persists under ORCH_PATHS["models"]/indexes/<name>. Each ``save``
+writes a complete version directory (``v000001/``: ``.npy`` files plus
+``meta.json``), then swaps the ``CURRENT`` pointer with one ``os.replace``.
+Readers never see a mix of old and new files. The previous version is kept for
+readers that are still opening it. ``VectorIndex.open`` memory-maps the files,
+so a worker starts serving without reading every vector into RAM. Vectors added
+after opening go to an in-memory delta segment that is searched together with
+the mapped base and folded in on the next ``save``.
+
+Adding an id that is already present replaces its vector (upsert). ``remove``
+drops delta rows at once. Base rows are only masked, and the mask is
+compacted away once a quarter of the base is dead, or on the next ``save``.
+Search cost therefore does not grow with the number of deletes.
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from orchestrAIframework.common.paths import get_path
+
+METRICS = ("ip", "l2")
+MODES = ("flat", "ivf")
+
+
+def topk_merge(
+    best_scores: Optional[np.ndarray],
+    best_ids: Optional[np.ndarray],
+    scores: np.ndarray,
+    ids: np.ndarray,
+    k: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge a (q, b) block of scores (higher is better) into the running (q, k) best.
+    ``ids`` is either (b,) shared by every query or (q, b).
+    """
+    if ids.ndim == 1:
+        ids = np.broadcast_to(ids, scores.shape)
+    if best_scores is not None:
+        scores = np.concatenate([best_scores, scores], axis=1)
+        ids = np.concatenate([best_ids, ids], axis=1)
+    if scores.shape[1] > k:
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, part, axis=1)
+        ids = np.take_along_axis(ids, part, axis=1)
+    return scores, np.ascontiguousarray(ids)
+
+
+def _sort_topk(scores: np.ndarray, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return np.take_along_axis(scores, order, axis=1), np.take_along_axis(ids, order, axis=1)
+
+
+class VectorIndex:
+    """Exact (flat) or approximate (IVF) top-k index over float32 vectors."""
+
+    def __init__(
+        self,
+        dim: int,
+        metric: str = "ip",
+        mode: str = "flat",
+        nlist: int = 256,
+        nprobe: int = 8,
+        block_size: int = 65536,
+        compact_ratio: float = 0.25,
+    ):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Choose from {METRICS}.")
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode '{mode}'. Choose from {MODES}.")
+        self.dim = int(dim)
+        self.metric = metric
+        self.mode = mode
+        self.nlist = int(nlist)
+        self.nprobe = int(nprobe)
+        self.block_size = int(block_size)
+        self.compact_ratio = compact_ratio
+
+        # Base segment (possibly memory-mapped); IVF keeps it grouped by list.
+        self.vectors = np.empty((0, self.dim), dtype=np.float32)
+        self.ids = np.empty(0, dtype=np.int64)
+        self.centroids: Optional[np.ndarray] = None
+        self.list_offsets: Optional[np.ndarray] = None
+        self._dead: Optional[np.ndarray] = None  # bool per base row, set by remove() until compaction
+        self._n_dead = 0
+        self._count = 0  # live vectors, kept up to date so len() is O(1)
+
+        # Delta segment for incremental adds.
+        self._delta_vectors: List[np.ndarray] = []
+        self._delta_ids: List[np.ndarray] = []
+        self._delta_lists: List[np.ndarray] = []
+        self._next_id = 0
+
+    # --- Building ---
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def is_trained(self) -> bool:
+        return self.mode == "flat" or self.centroids is not None
+
+    def _scores(self, queries: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        """Similarity (higher is better); for l2 the constant ||q||^2 is left out."""
+        dots = queries @ vectors.T
+        if self.metric == "ip":
+            return dots
+        return 2.0 * dots - np.einsum("ij,ij->i", vectors, vectors)[None, :]
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        out = np.empty(vectors.shape[0], dtype=np.int64)
+        for start in range(0, vectors.shape[0], self.block_size):
+            block = vectors[start:start + self.block_size]
+            out[start:start + block.shape[0]] = np.argmax(self._scores(block, self.centroids), axis=1)
+        return out
+
+    def train(self, sample: Any, iters: int = 10, seed: int = 0) -> None:
+        """
+        Fit IVF centroids with k-means (spherical for the inner-product metric).
+        Vectors buffered before training are assigned to lists afterwards.
+        """
+        if self.mode != "ivf":
+            return
+        sample = np.ascontiguousarray(sample, dtype=np.float32)
+        if sample.shape[0] < self.nlist:
+            raise ValueError(f"IVF training needs at least nlist={self.nlist} vectors, got {sample.shape[0]}.")
+        rng = np.random.default_rng(seed)
+        self.centroids = sample[rng.choice(sample.shape[0], self.nlist, replace=False)].copy()
+        for _ in range(iters):
+            assign = self._assign(sample)
+            counts = np.bincount(assign, minlength=self.nlist).astype(np.float32)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, assign, sample)
+            filled = counts > 0
+            self.centroids[filled] = sums[filled] / counts[filled, None]
+            if self.metric == "ip":
+                norms = np.linalg.norm(self.centroids, axis=1, keepdims=True)
+                np.divide(self.centroids, norms, out=self.centroids, where=norms > 0)
+        self._assign_buffered()
+
+    def _assign_buffered(self) -> None:
+        """Give list assignments to rows added while the index was untrained."""
+        if self.list_offsets is None and self.ids.size:
+            # An untrained base has no lists; move it to the delta so it is grouped on save.
+            self._compact()
+            self._delta_vectors.insert(0, np.asarray(self.vectors))
+            self._delta_ids.insert(0, self.ids)
+            self.vectors = np.empty((0, self.dim), dtype=np.float32)
+            self.ids = np.empty(0, dtype=np.int64)
+        self._delta_lists = [self._assign(v) for v in self._delta_vectors]
+
+    def add(self, vectors: Any, ids: Optional[Any] = None) -> np.ndarray:
+        """
+        Append vectors (ids default to a running counter). Returns the ids used.
+        An id repeated within the batch keeps its last vector.
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if ids is None:
+            ids = np.arange(self._next_id, self._next_id + vectors.shape[0], dtype=np.int64)
+        else:
+            ids = np.asarray(ids, dtype=np.int64).ravel()
+            if ids.size != vectors.shape[0]:
+                raise ValueError("ids and vectors must have the same length.")
+            last = np.sort(ids.size - 1 - np.unique(ids[::-1], return_index=True)[1])
+            if last.size != ids.size:
+                ids, vectors = ids[last], vectors[last]
+            if ids.size and len(self):
+                self.remove(ids)  # upsert: an id keeps only its newest vector
+        if ids.size == 0:
+            return ids
+        self._next_id = max(self._next_id, int(ids.max()) + 1)
+        self._delta_vectors.append(vectors)
+        self._delta_ids.append(ids)
+        self._count += ids.size
+        if self.mode == "ivf":
+            if self.centroids is not None:
+                self._delta_lists.append(self._assign(vectors))
+            elif len(self) >= self.nlist:  # enough buffered vectors to train on
+                self._compact()
+                self.train(np.concatenate([np.asarray(self.vectors), *self._delta_vectors]))
+        return ids
+
+    def remove(self, ids: Any) -> int:
+        """Remove vectors by id. Returns how many were removed."""
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        removed = 0
+        if self.ids.size:
+            hit = np.isin(self.ids, ids)
+            if self._dead is not None:
+                hit &= ~self._dead
+            if hit.any():
+                removed += int(hit.sum())
+                self._n_dead += int(hit.sum())
+                self._dead = hit if self._dead is None else self._dead | hit
+        for n, delta_ids in enumerate(self._delta_ids):
+            keep = ~np.isin(delta_ids, ids)
+            if not keep.all():
+                removed += int(keep.size - keep.sum())
+                self._delta_ids[n] = delta_ids[keep]
+                self._delta_vectors[n] = self._delta_vectors[n][keep]
+                if self._delta_lists:
+                    self._delta_lists[n] = self._delta_lists[n][keep]
+        self._count -= removed
+        if self._n_dead > self.compact_ratio * self.ids.size:
+            self._compact()
+        return removed
+
+    def _compact(self) -> None:
+        """Drop masked base rows (reads a memory-mapped base into RAM)."""
+        if self._dead is None:
+            return
+        live = ~self._dead
+        if self.list_offsets is not None:
+            lists = np.repeat(np.arange(self.nlist), np.diff(self.list_offsets))[live]
+            self.list_offsets = np.zeros(self.nlist + 1, dtype=np.int64)
+            np.cumsum(np.bincount(lists, minlength=self.nlist), out=self.list_offsets[1:])
+        self.vectors = np.asarray(self.vectors)[live]
+        self.ids = self.ids[live]
+        self._dead = None
+        self._n_dead = 0
+
+    def _delta(self) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """Consolidate pending adds into single arrays (cheap when already consolidated)."""
+        if len(self._delta_ids) > 1:
+            self._delta_vectors = [np.concatenate(self._delta_vectors)]
+            self._delta_ids = [np.concatenate(self._delta_ids)]
+            if self._delta_lists:
+                self._delta_lists = [np.concatenate(self._delta_lists)]
+        if not self._delta_ids:
+            return np.empty((0, self.dim), dtype=np.float32), np.empty(0, dtype=np.int64), None
+        lists = self._delta_lists[0] if self._delta_lists else None  # None while IVF is untrained
+        return self._delta_vectors[0], self._delta_ids[0], lists
+
+    # --- Searching ---
+    def search(self, queries: Any, k: int = 10, nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k search. Returns ``(scores, ids)`` of shape (n_queries, k), best first.
+        Scores are inner products ("ip") or squared L2 distances ("l2"). Missing
+        slots (fewer than k vectors) have id -1.
+        """
+        queries = np.ascontiguousarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        k = max(1, int(k))
+        if self.mode == "ivf" and self.centroids is not None:
+            scores, ids = self._search_ivf(queries, k, nprobe or self.nprobe)
+        else:
+            scores, ids = self._search_flat(queries, k)
+
+        scores, ids = _sort_topk(scores, ids)
+        ids = np.where(np.isneginf(scores), -1, ids)  # removed rows that still made the top k
+        if scores.shape[1] < k:
+            pad = k - scores.shape[1]
+            scores = np.pad(scores, ((0, 0), (0, pad)), constant_values=-np.inf)
+            ids = np.pad(ids, ((0, 0), (0, pad)), constant_values=-1)
+        if self.metric == "l2":
+            scores = np.einsum("ij,ij->i", queries, queries)[:, None] - scores
+        return scores.astype(np.float32), ids
+
+    def _search_flat(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        best_scores, best_ids = None, None
+        delta_vectors, delta_ids, _ = self._delta()
+        for vectors, ids, dead in ((self.vectors, self.ids, self._dead), (delta_vectors, delta_ids, None)):
+            for start in range(0, ids.size, self.block_size):
+                block = np.asarray(vectors[start:start + self.block_size])
+                scores = self._scores(queries, block)
+                if dead is not None:
+                    scores[:, dead[start:start + block.shape[0]]] = -np.inf
+                best_scores, best_ids = topk_merge(best_scores, best_ids, scores, ids[start:start + block.shape[0]], k)
+        if best_scores is None:
+            return np.empty((queries.shape[0], 0), dtype=np.float32), np.empty((queries.shape[0], 0), dtype=np.int64)
+        return best_scores, best_ids
+
+    def _search_ivf(self, queries: np.ndarray, k: int, nprobe: int) -> Tuple[np.ndarray, np.ndarray]:
+        nprobe = min(nprobe, self.nlist)
+        coarse = self._scores(queries, self.centroids)
+        probes = np.argpartition(-coarse, nprobe - 1, axis=1)[:, :nprobe]
+        delta_vectors, delta_ids, delta_lists = self._delta()
+        offsets = self.list_offsets
+
+        out_scores = np.full((queries.shape[0], k), -np.inf, dtype=np.float32)
+        out_ids = np.full((queries.shape[0], k), -1, dtype=np.int64)
+        for qi in range(queries.shape[0]):
+            parts_v, parts_i = [], []
+            if offsets is not None:
+                for lst in probes[qi]:
+                    lo, hi = offsets[lst], offsets[lst + 1]
+                    if hi > lo:
+                        if self._dead is None:
+                            parts_v.append(self.vectors[lo:hi])
+                            parts_i.append(self.ids[lo:hi])
+                        else:
+                            live = ~self._dead[lo:hi]
+                            parts_v.append(self.vectors[lo:hi][live])
+                            parts_i.append(self.ids[lo:hi][live])
+            if delta_lists is not None:
+                mask = np.isin(delta_lists, probes[qi])
+                if mask.any():
+                    parts_v.append(delta_vectors[mask])
+                    parts_i.append(delta_ids[mask])
+            if not parts_i:
+                continue
+            cand_v = np.concatenate(parts_v)
+            cand_i = np.concatenate(parts_i)
+            s, i = topk_merge(None, None, self._scores(queries[qi:qi + 1], cand_v), cand_i, k)
+            out_scores[qi, :s.shape[1]] = s[0]
+            out_ids[qi, :i.shape[1]] = i[0]
+        return out_scores, out_ids
+
+    # --- Persistence ---
+    def _consolidated(self) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        self._compact()
+        delta_vectors, delta_ids, delta_lists = self._delta()
+        vectors = np.concatenate([np.asarray(self.vectors), delta_vectors])
+        ids = np.concatenate([np.asarray(self.ids), delta_ids])
+        if self.mode != "ivf" or self.centroids is None:
+            return vectors, ids, None
+        base_lists = np.repeat(np.arange(self.nlist), np.diff(self.list_offsets)) if self.list_offsets is not None \
+            else np.empty(0, dtype=np.int64)
+        lists = np.concatenate([base_lists, delta_lists if delta_lists is not None else np.empty(0, dtype=np.int64)])
+        order = np.argsort(lists, kind="stable")
+        offsets = np.zeros(self.nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(lists, minlength=self.nlist), out=offsets[1:])
+        return vectors[order], ids[order], offsets
+
+    def save(self, name_or_dir: Union[str, Path]) -> Path:
+        """
+        Write the index (base + pending adds) as a new version directory and publish
+        it by swapping ``CURRENT``. Readers that still map an older version are not
+        disturbed; versions before the previous one are removed.
+        """
+        directory = index_dir(name_or_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        vectors, ids, offsets = self._consolidated()
+        arrays: Dict[str, np.ndarray] = {"vectors": vectors, "ids": ids}
+        if offsets is not None:
+            arrays["list_offsets"] = offsets
+            arrays["centroids"] = self.centroids
+        meta = {
+            "dim": self.dim, "metric": self.metric, "mode": self.mode, "nlist": self.nlist,
+            "nprobe": self.nprobe, "count": int(ids.size), "next_id": self._next_id,
+        }
+
+        versions = _versions(directory)
+        number = 1 + (versions[-1] if versions else 0)
+        while True:  # claim the version directory; another writer may hold the next number
+            version = directory / f"v{number:06d}"
+            try:
+                version.mkdir()
+                break
+            except FileExistsError:
+                number += 1
+        # Nothing reads a version until CURRENT names it, so it is written in place.
+        for name, arr in arrays.items():
+            np.save(version / f"{name}.npy", arr)
+        (version / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+        tmp = directory / f".CURRENT.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp.write_text(version.name, encoding="utf-8")
+        os.replace(tmp, directory / "CURRENT")
+
+        for old in _versions(directory):
+            if old < number - 1:
+                shutil.rmtree(directory / f"v{old:06d}", ignore_errors=True)
+        for name in ("vectors", "ids", "list_offsets", "centroids"):  # pre-versioning layout
+            (directory / f"{name}.npy").unlink(missing_ok=True)
+        (directory / "meta.json").unlink(missing_ok=True)
+
+        self.vectors, self.ids, self.list_offsets = vectors, ids, offsets
+        self._delta_vectors, self._delta_ids, self._delta_lists = [], [], []
+        return directory
+
+    @classmethod
+    def open(cls, name_or_dir: Union[str, Path], mmap: bool = True) -> "VectorIndex":
+        """Open a saved index; with ``mmap`` the vectors stay on disk until touched."""
+        directory = index_dir(name_or_dir)
+        current = directory / "CURRENT"
+        if current.exists():
+            directory = directory / current.read_text(encoding="utf-8").strip()
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        index = cls(meta["dim"], metric=meta["metric"], mode=meta["mode"], nlist=meta["nlist"], nprobe=meta["nprobe"])
+        mode = "r" if mmap else None
+        index.vectors = np.load(directory / "vectors.npy", mmap_mode=mode)
+        index.ids = np.load(directory / "ids.npy")
+        index._count = int(index.ids.size)
+        if (directory / "centroids.npy").exists():
+            index.centroids = np.load(directory / "centroids.npy")
+            index.list_offsets = np.load(directory / "list_offsets.npy")
+        index._next_id = int(meta.get("next_id", index.ids.size))
+        return index
+
+
+def _versions(directory: Path) -> List[int]:
+    """Sorted version numbers of the ``v000001``-style directories under ``directory``."""
+    return sorted(int(p.name[1:]) for p in directory.iterdir() if p.name[:1] == "v" and p.name[1:].isdigit())
+
+
+def index_dir(name_or_dir: Union[str, Path]) -> Path:
+    """Plain names live under ORCH_PATHS['models']/indexes; paths are used as given."""
+    path = Path(name_or_dir)
+    if path.is_absolute() or len(path.parts) > 1:
+        return path
+    return get_path("models") / "indexes" / str(name_or_dir)
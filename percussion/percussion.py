@@ -4,39 +4,156 @@ Percussion Section — Timing, Control, RL
 Author: Marcos Paulo Pazzinatto | License: MIT
 """
 
-import time
 from typing import Any, Dict, Optional, Callable
-from orchestrAIframework.common.logging import log_message
+from orchestrAIframework.common.logging import log_enabled, log_message
 from orchestrAIframework.interfaces.section_protocol import Section
 
 class Percussion(Section):
     """
     Schedulers, feedback loops, and RL hooks.
+    Backends: in-project timer scheduler (percussion/scheduler.py) running
+    periodic and one-shot jobs on a thread pool or an asyncio loop;
+    vectorized environments (percussion/vec_env.py) and array-backed replay
+    memory (percussion/replay.py) for batched RL.
     """
 
     def __init__(self, name: str = "Percussion"):
         self.name = name
         self.interval_s: float = 0.0
         self.policy: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+        self.scheduler: Optional[Any] = None  # Scheduler, created on first use
+        self.state: Dict[str, Any] = {}
+        self.last_action: Optional[Dict[str, Any]] = None
+        self.config: Dict[str, Any] = {}
+        self.env: Optional[Any] = None  # VectorEnv stepped by collect()
+        self.replay: Optional[Any] = None  # ReplayBuffer / PrioritizedReplayBuffer
+        self._obs: Optional[Any] = None  # last batch of observations from collect()
         log_message("info", f"[Percussion] Initialized section: {self.name}")
 
-    def configure(self, interval_s: float = 0.0, policy: Optional[Callable] = None) -> None:
+    def configure(self, interval_s: float = 0.0, policy: Optional[Callable] = None, **kwargs) -> None:
+        """
+        ``interval_s > 0`` with a policy runs the control loop as a periodic
+        scheduler job. Extra keys: ``max_workers``, ``loop`` (asyncio loop for
+        executor="async"), ``misfire`` ("coalesce" | "skip").
+        """
         self.interval_s = interval_s
         self.policy = policy
+        self.config = kwargs
+        if self.scheduler is not None:
+            self.scheduler.cancel("control")  # re-armed by perform() with the new interval
+        if "max_workers" in kwargs or "loop" in kwargs:
+            self._scheduler(max_workers=kwargs.get("max_workers"), loop=kwargs.get("loop"))
         log_message("info", f"[Percussion] interval={interval_s}s policy={'set' if policy else 'none'}")
 
-    def tick(self) -> None:
-        """A simple timed tick (stub for schedulers)."""
-        if self.interval_s > 0:
-            time.sleep(min(self.interval_s, 0.05))  # cap for fast demos
-        log_message("info", "[Percussion] tick()")
+    # --- Scheduler (see percussion/scheduler.py) ---
+    def _scheduler(self, max_workers: Optional[int] = None, loop: Optional[Any] = None) -> Any:
+        if self.scheduler is None:
+            from orchestrAIframework.percussion.scheduler import Scheduler
+
+            self.scheduler = Scheduler(max_workers=max_workers, loop=loop)
+        elif loop is not None:
+            self.scheduler.attach_loop(loop)
+        return self.scheduler
+
+    def schedule_every(self, interval_s: float, fn: Callable, *args, **kwargs) -> Any:
+        """Periodic job on the drift-free anchor grid; see ``Scheduler.every`` for options."""
+        job = self._scheduler().every(interval_s, fn, *args, **kwargs)
+        log_message("info", f"[Percussion] Scheduled '{job.name}' every {interval_s}s ({job.executor}).")
+        return job
+
+    def schedule_once(self, delay_s: float, fn: Callable, *args, **kwargs) -> Any:
+        job = self._scheduler().once(delay_s, fn, *args, **kwargs)
+        log_message("info", f"[Percussion] Scheduled '{job.name}' in {delay_s}s ({job.executor}).")
+        return job
+
+    def cancel_job(self, job_or_name: Any) -> bool:
+        return self.scheduler.cancel(job_or_name) if self.scheduler is not None else False
+
+    def job_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-job runs, skipped/coalesced fires, errors, lag and run time."""
+        return self.scheduler.stats() if self.scheduler is not None else {}
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=wait)
+            self.scheduler = None
+            log_message("info", "[Percussion] Scheduler stopped.")
+
+    # --- RL: vectorized environments and replay (see percussion/vec_env.py, percussion/replay.py) ---
+    def make_env(self, env: Any = "cartpole", num_envs: int = 16, seed: Optional[int] = None, **kwargs) -> Any:
+        """
+        ``env`` is "cartpole" (built-in array env), a list of single-env
+        factories (wrapped in SyncVectorEnv), or a ready VectorEnv.
+        """
+        from orchestrAIframework.percussion.vec_env import CartPoleVec, SyncVectorEnv, VectorEnv
+
+        if isinstance(env, VectorEnv):
+            self.env = env
+        elif env == "cartpole":
+            self.env = CartPoleVec(num_envs, seed=seed, **kwargs)
+        elif isinstance(env, (list, tuple)):
+            self.env = SyncVectorEnv(env)
+        else:
+            raise ValueError(f"Unknown environment '{env}'. Choose from ('cartpole',), a list of env factories or a VectorEnv.")
+        self._obs = None
+        log_message("info", f"[Percussion] Vector env {type(self.env).__name__} with {self.env.num_envs} envs.")
+        return self.env
+
+    def create_replay(self, capacity: int, prioritized: bool = False, **kwargs) -> Any:
+        """Replay memory shaped after the current env's observations."""
+        from orchestrAIframework.percussion.replay import PrioritizedReplayBuffer, ReplayBuffer
+
+        if self.env is None:
+            raise RuntimeError("No environment. Use make_env() first.")
+        if not self.env.obs_shape:
+            self._obs = self.env.reset()
+        cls = PrioritizedReplayBuffer if prioritized else ReplayBuffer
+        self.replay = cls(capacity, tuple(self.env.obs_shape), **kwargs)
+        log_message("info", f"[Percussion] {cls.__name__} capacity={capacity} ({self.replay.nbytes / 2**20:.1f} MB).")
+        return self.replay
+
+    def collect(self, steps: int, policy: Optional[Callable] = None) -> Dict[str, Any]:
+        """
+        Step every env ``steps`` times. ``policy`` (default: the configured one)
+        maps an (N, *obs_shape) observation batch to N actions. Transitions go
+        to the replay memory when one exists; observations carry over between calls.
+        """
+        from orchestrAIframework.percussion.vec_env import rollout
+
+        if self.env is None:
+            raise RuntimeError("No environment. Use make_env() first.")
+        policy = policy or self.policy
+        if policy is None:
+            raise RuntimeError("No policy. Pass policy= or configure(policy=...) first.")
+        result = rollout(self.env, policy, steps, buffer=self.replay, obs=self._obs)
+        self._obs = result.pop("obs")
+        if log_enabled("info"):
+            log_message("info", f"[Percussion] Collected {result['transitions']} transitions ({result['episodes']} episodes).")
+        return result
+
+    def sample(self, batch_size: int, **kwargs) -> Dict[str, Any]:
+        if self.replay is None:
+            raise RuntimeError("No replay memory. Use create_replay() first.")
+        return self.replay.sample(batch_size, **kwargs)
+
+    # --- Control loop ---
+    def tick(self) -> Optional[Dict[str, Any]]:
+        """One control step: apply the policy to the latest state. Never sleeps."""
+        if self.policy:
+            self.last_action = self.policy(self.state)
+        if log_enabled("info"):
+            log_message("info", "[Percussion] tick()")
+        return self.last_action
 
     def perform(self, score: Optional[Dict[str, Any]] = None) -> None:
         log_message("info", "[Percussion] Performing control loop...")
+        self.state = (score or {})
         self.tick()
-        state = (score or {})
         if self.policy:
-            _ = self.policy(state)
-            log_message("info", "[Percussion] Applied policy function (stub).")
+            log_message("info", "[Percussion] Applied policy function.")
+        if self.policy and self.interval_s > 0:
+            scheduler = self._scheduler()
+            if not any(job.name == "control" for job in scheduler.jobs()):
+                scheduler.every(self.interval_s, self.tick, name="control", misfire=self.config.get("misfire", "coalesce"))
+                log_message("info", f"[Percussion] Control loop scheduled every {self.interval_s}s.")
         log_message("success", f"[Percussion] Section '{self.name}' completed performance.")
-
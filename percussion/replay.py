@@ -0,0 +1,159 @@
+# orchestrAIframework/percussion/replay.py
+"""
+OrchestrAIFramework - Percussion Replay Memory
+----------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Fixed-capacity experience replay in preallocated NumPy arrays.
+
+- ``ReplayBuffer`` is a ring over obs, action, reward, next_obs and done.
+  Nothing is allocated after construction. ``add`` writes a batch of
+  transitions, one slice copy per field, or two when the batch wraps
+  around the end, so each transition costs O(1). The oldest rows are
+  overwritten once the buffer is full.
+- ``sample`` draws uniform indices and gathers every field with one fancy
+  index each.
+- ``PrioritizedReplayBuffer`` adds proportional prioritized replay
+  (Schaul et al. 2016). Priorities ``p ** alpha`` live in an array-backed
+  sum tree. A batch update takes one vectorized write per tree level.
+  A sampled batch descends the tree together, one vectorized step per
+  level, from stratified prefix sums. Importance weights are ``(N * P(i)) ** -beta``,
+  normalized by their maximum.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class ReplayBuffer:
+    """Uniform replay over a ring of preallocated arrays."""
+
+    def __init__(
+        self,
+        capacity: int,
+        obs_shape: Tuple[int, ...],
+        action_shape: Tuple[int, ...] = (),
+        obs_dtype: Any = np.float32,
+        action_dtype: Any = np.int64,
+        seed: Optional[int] = None,
+    ):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+        self.capacity = capacity
+        self.obs = np.zeros((capacity, *obs_shape), dtype=obs_dtype)
+        self.next_obs = np.zeros((capacity, *obs_shape), dtype=obs_dtype)
+        self.action = np.zeros((capacity, *action_shape), dtype=action_dtype)
+        self.reward = np.zeros(capacity, dtype=np.float32)
+        self.done = np.zeros(capacity, dtype=bool)
+        self.pos = 0
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (self.obs, self.next_obs, self.action, self.reward, self.done))
+
+    def add(self, obs: Any, action: Any, reward: Any, next_obs: Any, done: Any) -> np.ndarray:
+        """Append a batch of transitions (leading axis = batch). Returns their slot indices."""
+        obs = np.asarray(obs)
+        if obs.ndim == self.obs.ndim - 1:  # a single transition
+            obs, action, reward, next_obs, done = obs[None], [action], [reward], np.asarray(next_obs)[None], [done]
+        n = obs.shape[0]
+        if n > self.capacity:  # only the newest ``capacity`` rows survive anyway
+            cut = n - self.capacity
+            obs, next_obs = obs[cut:], np.asarray(next_obs)[cut:]
+            action, reward, done = np.asarray(action)[cut:], np.asarray(reward)[cut:], np.asarray(done)[cut:]
+            n = self.capacity
+        idx = (self.pos + np.arange(n)) % self.capacity
+        first = min(n, self.capacity - self.pos)
+        for store, values in ((self.obs, obs), (self.action, action), (self.reward, reward),
+                              (self.next_obs, next_obs), (self.done, done)):
+            values = np.asarray(values)
+            store[self.pos:self.pos + first] = values[:first]
+            if first < n:
+                store[:n - first] = values[first:]
+        self.pos = (self.pos + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+        return idx
+
+    def _gather(self, idx: np.ndarray) -> Dict[str, np.ndarray]:
+        return {
+            "obs": self.obs[idx], "action": self.action[idx], "reward": self.reward[idx],
+            "next_obs": self.next_obs[idx], "done": self.done[idx], "indices": idx,
+        }
+
+    def sample(self, batch_size: int) -> Dict[str, np.ndarray]:
+        if self.size == 0:
+            raise RuntimeError("Replay buffer is empty. Use add() first.")
+        return self._gather(self.rng.integers(0, self.size, size=batch_size))
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """Proportional prioritized replay over an array-backed sum tree."""
+
+    def __init__(
+        self,
+        capacity: int,
+        obs_shape: Tuple[int, ...],
+        action_shape: Tuple[int, ...] = (),
+        alpha: float = 0.6,
+        beta: float = 0.4,
+        eps: float = 1e-6,
+        **kwargs,
+    ):
+        super().__init__(capacity, obs_shape, action_shape, **kwargs)
+        self.alpha, self.beta, self.eps = alpha, beta, eps
+        self.leaves = 1 << int(np.ceil(np.log2(max(capacity, 2))))
+        self.depth = int(np.log2(self.leaves))
+        self.tree = np.zeros(2 * self.leaves, dtype=np.float64)  # node i has children 2i, 2i+1; root is 1
+        self.max_priority = 1.0
+
+    @property
+    def total(self) -> float:
+        return float(self.tree[1])
+
+    def _set(self, idx: np.ndarray, values: np.ndarray) -> None:
+        """Write leaf values, then recompute each affected parent from its children."""
+        nodes = np.asarray(idx, dtype=np.int64) + self.leaves
+        self.tree[nodes] = values  # duplicate indices: last write wins
+        for _ in range(self.depth):
+            nodes >>= 1  # repeated parents just write the same sum twice
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def add(self, obs: Any, action: Any, reward: Any, next_obs: Any, done: Any) -> np.ndarray:
+        """New transitions get the highest priority seen so far, so each is replayed at least once."""
+        idx = super().add(obs, action, reward, next_obs, done)
+        self._set(idx, np.full(idx.size, self.max_priority ** self.alpha))
+        return idx
+
+    def sample(self, batch_size: int, beta: Optional[float] = None) -> Dict[str, np.ndarray]:
+        if self.size == 0:
+            raise RuntimeError("Replay buffer is empty. Use add() first.")
+        beta = self.beta if beta is None else beta
+        total = self.tree[1]
+        # Stratified: one uniform draw inside each of batch_size equal segments of the mass.
+        bounds = (np.arange(batch_size) + self.rng.random(batch_size)) * (total / batch_size)
+        nodes = np.ones(batch_size, dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            go_right = bounds >= self.tree[left]
+            bounds = np.where(go_right, bounds - self.tree[left], bounds)
+            nodes = left + go_right
+        idx = np.minimum(nodes - self.leaves, self.size - 1)  # guards float round-off at the far edge
+
+        probs = self.tree[idx + self.leaves] / total
+        weights = (self.size * probs) ** -beta
+        batch = self._gather(idx)
+        batch["weights"] = (weights / weights.max()).astype(np.float32)
+        return batch
+
+    def update_priorities(self, indices: Any, priorities: Any) -> None:
+        """Set new priorities (e.g. |TD error|) for sampled ``indices``."""
+        priorities = np.abs(np.asarray(priorities, dtype=np.float64)) + self.eps
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self._set(np.asarray(indices), priorities ** self.alpha)
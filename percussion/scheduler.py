@@ -0,0 +1,314 @@
+# orchestrAIframework/percussion/scheduler.py
+"""
+OrchestrAIFramework - Percussion Scheduler
+------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Timer-driven job scheduler for periodic and one-shot work.
+
+- One timer thread owns a heap of (due time, sequence, job). It sleeps on a
+  condition variable until the earliest deadline or until a job is added or
+  cancelled, so an idle scheduler costs no CPU whatever the job count.
+  Cancelled or rescheduled entries are dropped lazily when they surface.
+- Periodic jobs are anchored: the k-th fire is due at ``anchor + k * interval``
+  on the monotonic clock. Run time and wake-up jitter never accumulate.
+- A late fire follows the job's misfire policy. "coalesce" runs once for
+  all missed slots. "skip" drops the fire if it is later than the grace
+  period. A fire that finds the previous run still going is not started
+  (no overlap); it counts as coalesced or skipped per the policy.
+- Jobs run on a shared thread pool ("thread") or on an attached asyncio
+  loop ("async"). Coroutine results are awaited on the loop.
+- Every job tracks runs, skipped/coalesced fires, errors, start lag and
+  run time. A one-shot job is marked finished after its run and dropped
+  from the scheduler, so its name can be reused and ``jobs()`` / ``stats()``
+  only list live jobs. The returned Job keeps its own stats.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from orchestrAIframework.common.logging import log_message
+
+EXECUTORS = ("thread", "async")
+MISFIRE_POLICIES = ("coalesce", "skip")
+
+
+class _Timing:
+    """Count / mean / max / last of a duration series."""
+
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self):
+        self.count, self.total, self.max, self.last = 0, 0.0, 0.0, 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self, prefix: str) -> Dict[str, float]:
+        mean = self.total / self.count if self.count else 0.0
+        return {f"{prefix}_mean_s": mean, f"{prefix}_max_s": self.max, f"{prefix}_last_s": self.last}
+
+
+class Job:
+    """A scheduled callable; returned by ``Scheduler.every`` / ``Scheduler.once``."""
+
+    def __init__(self, name: str, fn: Callable, args: Tuple, kwargs: Dict[str, Any], interval: Optional[float],
+                 first_due: float, executor: str, misfire: str, grace: float):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.interval = interval
+        self.anchor = first_due
+        self.due = first_due
+        self.slot = 0  # index of the next fire relative to ``anchor``
+        self.seq = 0
+        self.executor = executor
+        self.misfire = misfire
+        self.grace = grace
+        self.cancelled = False
+        self.finished = False  # a one-shot job that has run
+        self.running = False
+        self.runs = 0
+        self.skipped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.lag = _Timing()
+        self.runtime = _Timing()
+
+    def stats(self) -> Dict[str, Any]:
+        out = {
+            "runs": self.runs, "skipped": self.skipped, "coalesced": self.coalesced,
+            "errors": self.errors, "interval_s": self.interval, "cancelled": self.cancelled,
+            "finished": self.finished,
+        }
+        out.update(self.lag.to_dict("lag"))
+        out.update(self.runtime.to_dict("run"))
+        return out
+
+
+class Scheduler:
+    """Heap-based timer with thread-pool and asyncio execution."""
+
+    def __init__(self, max_workers: Optional[int] = None, loop: Optional[Any] = None):
+        self.max_workers = max_workers
+        self.loop = loop
+        self._heap: List[Tuple[float, int, Job]] = []
+        self._jobs: Dict[str, Job] = {}
+        self._cond = threading.Condition()
+        self._counter = 0
+        self._sequence = itertools.count()  # unique heap tie-breaker; Jobs never compare
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._tasks: set = set()
+        self._closed = False
+
+    # --- Registration ---
+    def every(
+        self,
+        interval_s: float,
+        fn: Callable,
+        *args,
+        name: Optional[str] = None,
+        start_in: Optional[float] = None,
+        executor: str = "thread",
+        misfire: str = "coalesce",
+        grace_s: Optional[float] = None,
+        **kwargs,
+    ) -> Job:
+        """Run ``fn`` every ``interval_s`` seconds, first after ``start_in`` (default one interval)."""
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive.")
+        delay = interval_s if start_in is None else start_in
+        grace = interval_s / 2.0 if grace_s is None else grace_s
+        return self._add(name, fn, args, kwargs, float(interval_s), delay, executor, misfire, grace)
+
+    def once(self, delay_s: float, fn: Callable, *args, name: Optional[str] = None, executor: str = "thread", **kwargs) -> Job:
+        """Run ``fn`` once after ``delay_s`` seconds."""
+        return self._add(name, fn, args, kwargs, None, max(0.0, delay_s), executor, "coalesce", float("inf"))
+
+    def _add(self, name, fn, args, kwargs, interval, delay, executor, misfire, grace) -> Job:
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Choose from {EXECUTORS}.")
+        if misfire not in MISFIRE_POLICIES:
+            raise ValueError(f"Unknown misfire policy '{misfire}'. Choose from {MISFIRE_POLICIES}.")
+        if executor == "async" and self.loop is None:
+            raise RuntimeError("No asyncio loop attached. Pass loop= or call attach_loop() first.")
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Scheduler is shut down.")
+            self._counter += 1
+            name = name or f"{getattr(fn, '__name__', 'job')}-{self._counter}"
+            if name in self._jobs and not (self._jobs[name].cancelled or self._jobs[name].finished):
+                raise ValueError(f"A job named '{name}' is already scheduled.")
+            job = Job(name, fn, args, kwargs, interval, time.monotonic() + delay, executor, misfire, grace)
+            self._jobs[name] = job
+            self._push(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._timer, name="orchestrai-scheduler", daemon=True)
+                self._thread.start()
+        return job
+
+    def _push(self, job: Job) -> None:
+        """Queue ``job`` at ``job.due``; caller holds the lock."""
+        job.seq = next(self._sequence)
+        heapq.heappush(self._heap, (job.due, job.seq, job))
+        if self._heap[0][2] is job:
+            self._cond.notify()
+
+    def cancel(self, job_or_name: Any) -> bool:
+        with self._cond:
+            job = self._jobs.get(job_or_name) if isinstance(job_or_name, str) else job_or_name
+            if job is None or job.cancelled or job.finished:
+                return False
+            job.cancelled = True
+            self._cond.notify()
+        return True
+
+    def attach_loop(self, loop: Any) -> None:
+        """Use ``loop`` (running in another thread) for jobs with executor="async"."""
+        self.loop = loop
+
+    # --- Timer ---
+    def _next_due(self) -> Optional[Tuple[Job, float]]:
+        with self._cond:
+            while not self._closed:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                due, seq, job = self._heap[0]
+                if job.cancelled or seq != job.seq:
+                    heapq.heappop(self._heap)
+                    continue
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._heap)
+                return job, due
+        return None
+
+    def _timer(self) -> None:
+        while True:
+            item = self._next_due()
+            if item is None:
+                return
+            job, due = item
+            now = time.monotonic()
+            if job.running:  # no overlap: this fire folds into the next slot
+                if job.misfire == "coalesce":
+                    job.coalesced += 1
+                else:
+                    job.skipped += 1
+            elif job.interval is not None and job.misfire == "skip" and now - due > job.grace:
+                job.skipped += 1
+            else:
+                self._dispatch(job, due)
+
+            if job.interval is None:
+                continue
+            # Drift-free: next slot strictly after now on the anchor grid.
+            slot = int((now - job.anchor) // job.interval) + 1
+            missed = max(0, slot - job.slot - 1)
+            if job.misfire == "coalesce":
+                job.coalesced += missed
+            else:
+                job.skipped += missed
+            job.slot = slot
+            with self._cond:
+                if not job.cancelled and not self._closed:
+                    job.due = job.anchor + slot * job.interval
+                    self._push(job)
+
+    # --- Execution ---
+    def _dispatch(self, job: Job, due: float) -> None:
+        job.running = True
+        try:
+            if job.executor == "async":
+                self.loop.call_soon_threadsafe(self._start_task, job, due)
+                return
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="orchestrai-job")
+            self._pool.submit(self._run, job, due)
+        except RuntimeError as exc:  # loop closed / pool shut down
+            job.running = False
+            job.errors += 1
+            log_message("error", f"[Percussion] Could not dispatch job '{job.name}': {exc}")
+            self._finish(job)
+
+    def _finish(self, job: Job) -> None:
+        """After a fire ends: retire a one-shot job so it stops counting as scheduled."""
+        if job.interval is not None:
+            return
+        with self._cond:
+            job.finished = True
+            if self._jobs.get(job.name) is job:
+                del self._jobs[job.name]
+
+    def _start_task(self, job: Job, due: float) -> None:
+        task = self.loop.create_task(self._run_async(job, due))
+        self._tasks.add(task)  # the loop only keeps weak references to tasks
+        task.add_done_callback(self._tasks.discard)
+
+    def _run(self, job: Job, due: float) -> None:
+        start = time.monotonic()
+        job.lag.add(start - due)
+        try:
+            job.fn(*job.args, **job.kwargs)
+        except Exception as exc:  # keep the schedule alive; report per job
+            job.errors += 1
+            log_message("error", f"[Percussion] Job '{job.name}' failed: {exc}")
+        finally:
+            job.runs += 1
+            job.runtime.add(time.monotonic() - start)
+            job.running = False
+            self._finish(job)
+
+    async def _run_async(self, job: Job, due: float) -> None:
+        start = time.monotonic()
+        job.lag.add(start - due)
+        try:
+            result = job.fn(*job.args, **job.kwargs)
+            if hasattr(result, "__await__"):
+                await result
+        except Exception as exc:
+            job.errors += 1
+            log_message("error", f"[Percussion] Job '{job.name}' failed: {exc}")
+        finally:
+            job.runs += 1
+            job.runtime.add(time.monotonic() - start)
+            job.running = False
+            self._finish(job)
+
+    # --- Introspection / lifecycle ---
+    def jobs(self) -> List[Job]:
+        with self._cond:
+            return [job for job in self._jobs.values() if not job.cancelled]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._cond:
+            return {name: job.stats() for name, job in self._jobs.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None and wait:
+            self._thread.join()
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "Scheduler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
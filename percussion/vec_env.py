@@ -0,0 +1,190 @@
+# orchestrAIframework/percussion/vec_env.py
+"""
+OrchestrAIFramework - Percussion Vectorized Environments
+--------------------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Step N environments at once and hand the policy one batch of observations.
+
+- ``VectorEnv`` is the batch contract. ``reset()`` returns an (N, *obs_shape)
+  array. ``step(actions)`` returns ``(obs, rewards, dones)`` as arrays.
+  Finished environments reset automatically. The observation they ended on
+  is kept in ``final_obs`` for the rows where ``dones`` is set.
+- ``CartPoleVec`` is the classic cart-pole written on arrays: all N
+  environments advance with a handful of NumPy operations per step.
+- ``SyncVectorEnv`` adapts N single environments with a gym-style
+  ``reset`` / ``step``. It loops in Python, but the policy still sees one
+  batch.
+- ``rollout`` drives any vector env with a batch policy and can feed a
+  replay buffer (see percussion/replay.py).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class VectorEnv(ABC):
+    """N environments stepped together; arrays in, arrays out."""
+
+    num_envs: int
+    obs_shape: Tuple[int, ...]
+    n_actions: Optional[int] = None  # discrete action count, when applicable
+
+    @abstractmethod
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def step(self, actions: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        ...
+
+    def sample_actions(self, rng: np.random.Generator) -> np.ndarray:
+        if self.n_actions is None:
+            raise NotImplementedError("sample_actions() needs a discrete action space.")
+        return rng.integers(0, self.n_actions, size=self.num_envs)
+
+
+class CartPoleVec(VectorEnv):
+    """Cart-pole balancing (Barto et al. 1983 dynamics), N copies on arrays."""
+
+    gravity, cart_mass, pole_mass, half_length = 9.8, 1.0, 0.1, 0.5
+    force_mag, tau = 10.0, 0.02
+    theta_limit, x_limit = 12 * 2 * np.pi / 360, 2.4
+    n_actions = 2
+
+    def __init__(self, num_envs: int, max_steps: int = 500, seed: Optional[int] = None):
+        self.num_envs = num_envs
+        self.obs_shape = (4,)
+        self.max_steps = max_steps
+        self.rng = np.random.default_rng(seed)
+        self.state = np.zeros((num_envs, 4), dtype=np.float64)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.final_obs = np.zeros((num_envs, 4), dtype=np.float32)
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.state[:] = self.rng.uniform(-0.05, 0.05, size=self.state.shape)
+        self.steps[:] = 0
+        return self.state.astype(np.float32)
+
+    def step(self, actions: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        x, x_dot, theta, theta_dot = self.state.T
+        force = np.where(np.asarray(actions) == 1, self.force_mag, -self.force_mag)
+        cos, sin = np.cos(theta), np.sin(theta)
+        total = self.cart_mass + self.pole_mass
+        pole_ml = self.pole_mass * self.half_length
+        temp = (force + pole_ml * theta_dot * theta_dot * sin) / total
+        theta_acc = (self.gravity * sin - cos * temp) / (
+            self.half_length * (4.0 / 3.0 - self.pole_mass * cos * cos / total)
+        )
+        x_acc = temp - pole_ml * theta_acc * cos / total
+        # Explicit Euler, written into the state columns in place.
+        self.state[:, 0] += self.tau * x_dot
+        self.state[:, 1] += self.tau * x_acc
+        self.state[:, 2] += self.tau * theta_dot
+        self.state[:, 3] += self.tau * theta_acc
+        self.steps += 1
+
+        dones = (np.abs(self.state[:, 0]) > self.x_limit) | (np.abs(self.state[:, 2]) > self.theta_limit)
+        dones |= self.steps >= self.max_steps
+        rewards = np.ones(self.num_envs, dtype=np.float32)
+        if dones.any():
+            self.final_obs[dones] = self.state[dones]
+            self.state[dones] = self.rng.uniform(-0.05, 0.05, size=(int(dones.sum()), 4))
+            self.steps[dones] = 0
+        return self.state.astype(np.float32), rewards, dones
+
+
+class SyncVectorEnv(VectorEnv):
+    """
+    Batch adapter over single environments. Each must offer ``reset()`` and
+    ``step(action)``. 3-, 4- (gym) and 5-tuple (gymnasium) step results and
+    ``(obs, info)`` reset results are accepted.
+    """
+
+    def __init__(self, env_fns: Sequence[Callable[[], Any]]):
+        self.envs = [fn() for fn in env_fns]
+        self.num_envs = len(self.envs)
+        first = self.envs[0]
+        self.n_actions = getattr(getattr(first, "action_space", None), "n", getattr(first, "n_actions", None))
+        self.obs_shape = ()
+        self.final_obs: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _obs(result: Any) -> np.ndarray:
+        if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], dict):
+            result = result[0]
+        return np.asarray(result, dtype=np.float32)
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        obs = []
+        for i, env in enumerate(self.envs):
+            try:
+                result = env.reset(seed=None if seed is None else seed + i)
+            except TypeError:
+                result = env.reset()
+            obs.append(self._obs(result))
+        batch = np.stack(obs)
+        self.obs_shape = batch.shape[1:]
+        self.final_obs = np.zeros_like(batch)
+        return batch
+
+    def step(self, actions: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.final_obs is None:
+            raise RuntimeError("No observations yet. Use reset() first.")
+        obs, rewards, dones = [], np.zeros(self.num_envs, dtype=np.float32), np.zeros(self.num_envs, dtype=bool)
+        for i, (env, action) in enumerate(zip(self.envs, np.asarray(actions))):
+            result = env.step(action.item() if action.ndim == 0 else action)
+            if len(result) == 5:
+                ob, reward, done = result[0], result[1], bool(result[2] or result[3])
+            else:
+                ob, reward, done = result[0], result[1], bool(result[2])
+            ob = np.asarray(ob, dtype=np.float32)
+            if done:
+                self.final_obs[i] = ob
+                ob = self._obs(env.reset())
+            obs.append(ob)
+            rewards[i], dones[i] = reward, done
+        return np.stack(obs), rewards, dones
+
+
+def rollout(
+    env: VectorEnv,
+    policy: Callable[[np.ndarray], Any],
+    steps: int,
+    buffer: Optional[Any] = None,
+    obs: Optional[np.ndarray] = None,
+) -> Dict[str, Any]:
+    """
+    Run ``steps`` batched steps (``steps * num_envs`` transitions). The policy
+    maps an (N, *obs_shape) batch to N actions. When ``buffer`` is given, every
+    transition is added with the true final observation as ``next_obs``.
+    Returns the last observations (to continue from) and episode statistics.
+    """
+    obs = env.reset() if obs is None else obs
+    episode_return = np.zeros(env.num_envs, dtype=np.float64)
+    finished = []
+    for _ in range(steps):
+        actions = np.asarray(policy(obs))
+        next_obs, rewards, dones = env.step(actions)
+        if buffer is not None:
+            stored_next = next_obs
+            if dones.any():
+                stored_next = next_obs.copy()
+                stored_next[dones] = env.final_obs[dones]
+            buffer.add(obs, actions, rewards, stored_next, dones)
+        episode_return += rewards
+        if dones.any():
+            finished.extend(episode_return[dones].tolist())
+            episode_return[dones] = 0.0
+        obs = next_obs
+    return {
+        "obs": obs,
+        "transitions": steps * env.num_envs,
+        "episodes": len(finished),
+        "mean_return": float(np.mean(finished)) if finished else 0.0,
+    }
@@ -0,0 +1,154 @@
+# orchestrAIframework/strings/batching.py
+"""
+OrchestrAIFramework - Strings Length Bucketing
+----------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Batches variable-length sequences with little padding.
+
+- ``pad_sequences`` packs sequences of shape (T_i,) or (T_i, F) into one
+  (B, L, F) array plus a (B, L) boolean mask of real steps.
+- ``BucketBatcher`` sorts sequences by length and splits them at bucket
+  boundaries. By default the boundaries are length quantiles, so every
+  bucket holds about the same number of sequences. Each bucket is then cut
+  into batches. A batch is padded to its own longest member, rounded up to
+  ``multiple``, instead of the longest sequence in the dataset. With
+  ``max_tokens`` the number of rows adapts to the padded length, so short
+  buckets make wide batches and long buckets make narrow ones at the same
+  memory cost.
+- ``shuffle=True`` (training) draws randomly inside each bucket and
+  shuffles batch order, so batches stay length-homogeneous without being
+  the same every epoch.
+- ``Batch.indices`` map rows back to input positions; ``unbatch`` restores
+  input order and strips the padding.
+"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+
+class Batch(NamedTuple):
+    indices: np.ndarray  # positions of the rows in the input sequence list
+    data: np.ndarray  # (B, L, F), zero-padded
+    mask: np.ndarray  # (B, L) bool, True on real steps
+    lengths: np.ndarray  # (B,)
+
+
+def _as_2d(sequence: Any, dtype: Any) -> np.ndarray:
+    array = np.asarray(sequence, dtype=dtype)
+    return array[:, None] if array.ndim == 1 else array
+
+
+def pad_sequences(
+    sequences: Sequence[Any], length: Optional[int] = None, pad_value: float = 0.0, dtype: Any = np.float32
+) -> Batch:
+    """Right-pad ``sequences`` to ``length`` (default: the longest); indices are 0..B-1."""
+    arrays = [_as_2d(s, dtype) for s in sequences]
+    lengths = np.fromiter((a.shape[0] for a in arrays), dtype=np.int64, count=len(arrays))
+    length = int(lengths.max(initial=0)) if length is None else length
+    features = arrays[0].shape[1] if arrays else 1
+    data = np.full((len(arrays), length, features), pad_value, dtype=dtype)
+    for row, array in enumerate(arrays):
+        data[row, : array.shape[0]] = array[:length]
+    mask = np.arange(length) < np.minimum(lengths, length)[:, None]
+    return Batch(np.arange(len(arrays)), data, mask, lengths)
+
+
+def bucket_boundaries(lengths: Any, num_buckets: int = 8, multiple: int = 1) -> np.ndarray:
+    """Upper length bounds at the length quantiles, rounded up to ``multiple``."""
+    lengths = np.asarray(lengths)
+    if lengths.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    bounds = np.quantile(lengths, np.linspace(0, 1, num_buckets + 1)[1:], method="higher")
+    bounds = -(-bounds.astype(np.int64) // multiple) * multiple
+    return np.unique(bounds)
+
+
+class BucketBatcher:
+    """Length-bucketed batches of padded arrays with masks."""
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        max_tokens: Optional[int] = None,
+        num_buckets: int = 8,
+        boundaries: Optional[Sequence[int]] = None,
+        multiple: int = 8,
+        shuffle: bool = False,
+        seed: Optional[int] = None,
+        dtype: Any = np.float32,
+    ):
+        if batch_size <= 0 or (max_tokens is not None and max_tokens <= 0):
+            raise ValueError("batch_size and max_tokens must be positive.")
+        self.batch_size = batch_size
+        self.max_tokens = max_tokens
+        self.num_buckets = num_buckets
+        self.boundaries = None if boundaries is None else np.sort(np.asarray(boundaries, dtype=np.int64))
+        self.multiple = max(1, multiple)
+        self.shuffle = shuffle
+        self.rng = np.random.default_rng(seed)
+        self.dtype = dtype
+        self.real_steps = 0
+        self.padded_steps = 0
+
+    def _padded(self, length: int) -> int:
+        return -(-max(length, 1) // self.multiple) * self.multiple
+
+    def plan(self, lengths: Any) -> List[np.ndarray]:
+        """Row groups (input positions) of every batch, without touching the data."""
+        lengths = np.asarray(lengths, dtype=np.int64)
+        boundaries = self.boundaries if self.boundaries is not None else bucket_boundaries(lengths, self.num_buckets)
+        bucket = np.minimum(np.searchsorted(boundaries, lengths, side="left"), max(len(boundaries) - 1, 0))
+        groups: List[np.ndarray] = []
+        for b in np.unique(bucket):
+            members = np.flatnonzero(bucket == b)
+            if self.shuffle:
+                members = self.rng.permutation(members)
+            else:
+                members = members[np.argsort(lengths[members], kind="stable")]
+            start = 0
+            while start < members.size:
+                rows = self.batch_size
+                if self.max_tokens is not None:
+                    # cost[r-1] = r rows padded to the longest of them; non-decreasing in r.
+                    longest = np.maximum.accumulate(lengths[members[start:start + rows]])
+                    cost = np.arange(1, longest.size + 1) * (-(-np.maximum(longest, 1) // self.multiple) * self.multiple)
+                    rows = max(1, int(np.count_nonzero(cost <= self.max_tokens)))
+                groups.append(members[start:start + rows])
+                start += rows
+        if self.shuffle:
+            groups = [groups[i] for i in self.rng.permutation(len(groups))]
+        return groups
+
+    def batches(self, sequences: Sequence[Any]) -> Iterator[Batch]:
+        """Yield padded batches covering every sequence exactly once."""
+        arrays = [_as_2d(s, self.dtype) for s in sequences]
+        lengths = np.fromiter((a.shape[0] for a in arrays), dtype=np.int64, count=len(arrays))
+        for rows in self.plan(lengths):
+            batch = pad_sequences([arrays[i] for i in rows], self._padded(int(lengths[rows].max())), dtype=self.dtype)
+            self.real_steps += int(lengths[rows].sum())
+            self.padded_steps += batch.mask.size
+            yield batch._replace(indices=rows)
+
+    @property
+    def efficiency(self) -> float:
+        """Share of padded steps that hold real data, over every batch produced so far."""
+        return self.real_steps / self.padded_steps if self.padded_steps else 1.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"real_steps": self.real_steps, "padded_steps": self.padded_steps, "efficiency": self.efficiency}
+
+
+def unbatch(batches: Sequence[Batch], outputs: Sequence[np.ndarray], count: int) -> List[np.ndarray]:
+    """
+    Reorder per-batch model outputs to input order. (B, L, ...) outputs are cut
+    to each sequence's length; (B, ...) per-sequence outputs are kept as they are.
+    """
+    result: List[Any] = [None] * count
+    for batch, out in zip(batches, outputs):
+        per_step = out.ndim >= 2 and out.shape[1] == batch.mask.shape[1]
+        for row, (index, length) in enumerate(zip(batch.indices.tolist(), batch.lengths.tolist())):
+            result[index] = out[row, :length] if per_step else out[row]
+    return result
@@ -0,0 +1,210 @@
+# orchestrAIframework/strings/sequence.py
+"""
+OrchestrAIFramework - Strings Sequence Models and Streaming
+-----------------------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Stateful sequence models over padded (B, T, F) batches, plus sliding-window
+streaming that carries state instead of recomputing context.
+
+- A sequence model exposes ``init_state(batch)`` and
+  ``forward(x, mask=None, state=None) -> (outputs, state)``. Masked
+  (padded) steps leave the state unchanged, so a right-padded row ends in
+  the same state as its unpadded sequence.
+- ``EchoStateNetwork`` is a leaky tanh reservoir with fixed random weights
+  scaled to a target spectral radius, and a linear readout. The input
+  projection for all steps is one matmul. The recurrence is one (B, H) x
+  (H, H) matmul per step, vectorized over the batch. ``fit_batches`` solves
+  the readout by ridge regression from accumulated normal equations, so
+  memory stays O(H^2) whatever the data size. Only real steps past
+  ``washout`` count.
+- ``SlidingWindowStream`` consumes a long series chunk by chunk. Every
+  ``hop`` steps it emits the model outputs for the latest ``window`` steps.
+  Only the ``hop`` new steps run through the model, starting from the
+  carried state. The ``window - hop`` overlapping steps are already in the
+  state and in a small output history, so each step is computed once. A
+  stateless re-run of every window costs ``window / hop`` times more. Its
+  context is also truncated to the window, where the carried state
+  remembers the whole series.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+MODEL_TYPES = ("esn",)
+
+
+class EchoStateNetwork:
+    """Reservoir RNN with a ridge-regression readout."""
+
+    def __init__(
+        self,
+        hidden_dim: int = 128,
+        spectral_radius: float = 0.9,
+        leak: float = 1.0,
+        input_scale: float = 1.0,
+        density: float = 0.1,
+        ridge: float = 1e-6,
+        washout: int = 0,
+        seed: Optional[int] = 0,
+        dtype: Any = np.float32,
+    ):
+        self.hidden_dim = hidden_dim
+        self.spectral_radius = spectral_radius
+        self.leak = leak
+        self.input_scale = input_scale
+        self.density = density
+        self.ridge = ridge
+        self.washout = washout
+        self.seed = seed
+        self.dtype = dtype
+        self.input_dim: Optional[int] = None
+        self.output_dim: Optional[int] = None
+        self.W_in: Optional[np.ndarray] = None
+        self.W: Optional[np.ndarray] = None
+        self.bias: Optional[np.ndarray] = None
+        self.W_out: Optional[np.ndarray] = None  # (H, O); readout bias in b_out
+        self.b_out: Optional[np.ndarray] = None
+
+    @property
+    def fitted(self) -> bool:
+        return self.W_out is not None
+
+    def _build(self, input_dim: int) -> None:
+        if self.input_dim == input_dim:
+            return
+        if self.input_dim is not None:
+            raise ValueError(f"Model expects {self.input_dim} input features, got {input_dim}.")
+        rng = np.random.default_rng(self.seed)
+        H = self.hidden_dim
+        W = rng.uniform(-1.0, 1.0, size=(H, H)) * (rng.random((H, H)) < self.density)
+        radius = float(np.max(np.abs(np.linalg.eigvals(W)))) or 1.0
+        self.W = (W * (self.spectral_radius / radius)).astype(self.dtype)
+        self.W_in = (rng.uniform(-1.0, 1.0, size=(input_dim, H)) * self.input_scale).astype(self.dtype)
+        self.bias = (rng.uniform(-1.0, 1.0, size=H) * 0.1).astype(self.dtype)
+        self.input_dim = input_dim
+
+    def init_state(self, batch: int) -> np.ndarray:
+        return np.zeros((batch, self.hidden_dim), dtype=self.dtype)
+
+    def states(
+        self, x: np.ndarray, mask: Optional[np.ndarray] = None, state: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Reservoir states (B, T, H) for inputs (B, T, F), and the final state."""
+        x = np.asarray(x, dtype=self.dtype)
+        self._build(x.shape[2])
+        B, T = x.shape[:2]
+        drive = x @ self.W_in + self.bias  # every step's input term in one matmul
+        h = self.init_state(B) if state is None else np.asarray(state, dtype=self.dtype)
+        out = np.empty((B, T, self.hidden_dim), dtype=self.dtype)
+        for t in range(T):
+            new = np.tanh(drive[:, t] + h @ self.W)
+            if self.leak != 1.0:
+                new = (1.0 - self.leak) * h + self.leak * new
+            if mask is not None:
+                new = np.where(mask[:, t, None], new, h)
+            out[:, t] = h = new
+        return out, h
+
+    def forward(
+        self, x: np.ndarray, mask: Optional[np.ndarray] = None, state: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Outputs (B, T, O) and the final state."""
+        if not self.fitted:
+            raise RuntimeError("Model is not fitted. Use fit() first.")
+        S, h = self.states(x, mask, state)
+        return S @ self.W_out + self.b_out, h
+
+    def fit_batches(self, batches: Iterable[Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]]) -> "EchoStateNetwork":
+        """
+        Fit the readout from ``(x, mask, y)`` batches; ``y`` is (B, T, O) per-step targets.
+        Each sequence starts from a zero state, and its first ``washout`` steps are left out.
+        """
+        gram: Optional[np.ndarray] = None
+        cross: Optional[np.ndarray] = None
+        for x, mask, y in batches:
+            y = np.asarray(y, dtype=np.float64)
+            y = y[..., None] if y.ndim == 2 else y
+            S, _ = self.states(x, mask)
+            keep = np.ones(S.shape[:2], dtype=bool) if mask is None else mask.copy()
+            keep[:, : self.washout] = False
+            Z = np.concatenate([S[keep].astype(np.float64), np.ones((int(keep.sum()), 1))], axis=1)
+            if gram is None:
+                gram, cross = np.zeros((Z.shape[1], Z.shape[1])), np.zeros((Z.shape[1], y.shape[2]))
+            gram += Z.T @ Z
+            cross += Z.T @ y[keep]
+        if gram is None:
+            raise ValueError("No training data.")
+        gram[np.diag_indices(self.hidden_dim)] += self.ridge  # the bias column is not penalized
+        solution = np.linalg.solve(gram, cross)
+        self.W_out = solution[:-1].astype(self.dtype)
+        self.b_out = solution[-1].astype(self.dtype)
+        self.output_dim = solution.shape[1]
+        return self
+
+
+def make_model(model_type: str, **kwargs) -> Any:
+    if model_type not in MODEL_TYPES:
+        raise ValueError(f"Unknown model type '{model_type}'. Choose from {MODEL_TYPES}.")
+    return EchoStateNetwork(**kwargs)
+
+
+class SlidingWindowStream:
+    """Stateful sliding-window inference over ``num_streams`` series advancing in lockstep."""
+
+    def __init__(self, model: Any, window: int, hop: Optional[int] = None, num_streams: int = 1):
+        hop = window if hop is None else hop
+        if not 0 < hop <= window:
+            raise ValueError("Need 0 < hop <= window.")
+        self.model = model
+        self.window = window
+        self.hop = hop
+        self.num_streams = num_streams
+        self.reset()
+
+    def reset(self) -> None:
+        self.state = self.model.init_state(self.num_streams)
+        self.steps = 0  # steps run through the model
+        self._pending: Optional[np.ndarray] = None  # (N, <hop, F) inputs waiting for a full hop
+        self._history: Optional[np.ndarray] = None  # (N, window - hop, O) most recent outputs
+
+    def _as_chunk(self, values: Any) -> np.ndarray:
+        """(n,) or (n, F) for a single stream, (N, n, F) for several."""
+        chunk = np.asarray(values, dtype=self.model.dtype)
+        if self.num_streams == 1 and chunk.ndim <= 2:
+            chunk = chunk.reshape(1, chunk.shape[0], -1)
+        elif chunk.ndim == 2:
+            chunk = chunk[:, :, None]
+        if chunk.shape[0] != self.num_streams:
+            raise ValueError(f"Expected {self.num_streams} streams, got {chunk.shape[0]}.")
+        return chunk
+
+    def push(self, values: Any) -> np.ndarray:
+        """
+        Feed new steps. Returns (W, N, window, O): one entry per window completed
+        by this chunk, oldest first. W is 0 until the first ``window`` steps arrive.
+        """
+        chunk = self._as_chunk(values)
+        if self._pending is not None:
+            chunk = np.concatenate([self._pending, chunk], axis=1)
+        ready = chunk.shape[1] // self.hop * self.hop
+        self._pending = chunk[:, ready:]
+        if ready == 0:
+            return np.zeros((0, self.num_streams, self.window, self.model.output_dim or 0), dtype=self.model.dtype)
+
+        out, self.state = self.model.forward(chunk[:, :ready], state=self.state)
+        history = out if self._history is None else np.concatenate([self._history, out], axis=1)
+        first = self.steps + ready - history.shape[1]  # global step of history[:, 0]
+        ends = np.arange(self.steps + self.hop, self.steps + ready + 1, self.hop)
+        ends = ends[ends >= self.window]
+        self.steps += ready
+        keep = self.window - self.hop
+        self._history = history[:, max(history.shape[1] - keep, 0):] if keep else history[:, :0]
+        if ends.size == 0:
+            return np.zeros((0, self.num_streams, self.window, out.shape[2]), dtype=out.dtype)
+        return np.stack([history[:, e - self.window - first: e - first] for e in ends.tolist()])
+
+    def stats(self) -> Dict[str, Any]:
+        return {"steps": self.steps, "window": self.window, "hop": self.hop, "streams": self.num_streams}
@@ -11,11 +11,13 @@ these models handle patterns that unfold over time — such as sequences,
 language, or temporal data.
 
 This module defines the base Strings class that can integrate various
-sequence models (Transformers, RNNs, Autoencoders, etc.).
+sequence models (Transformers, RNNs, Autoencoders, etc.). Variable-length
+sequences are batched by length (strings/batching.py), and long series are
+streamed as sliding windows with carried state (strings/sequence.py).
 """
 
-from typing import Any, Dict, Optional
-from orchestrAIframework.common.logging import log_message
+from typing import Any, Dict, Optional, Sequence
+from orchestrAIframework.common.logging import log_enabled, log_message
 
 
 class Strings:
@@ -24,35 +26,99 @@ class Strings:
     def __init__(self, name: str = "Strings"):
         self.name = name
         self.model: Optional[Any] = None
+        self.model_type: Optional[str] = None
+        self.batcher: Optional[Any] = None  # BucketBatcher used by fit()/predict()
+        self.stream: Optional[Any] = None  # SlidingWindowStream used by push()
+        self.config: Dict[str, Any] = {}
         log_message("info", f"[Strings] Initialized section: {self.name}")
 
-    def load_model(self, model_type: str = "transformer", **kwargs) -> None:
+    def load_model(self, model_type: str = "esn", **kwargs) -> None:
         """
-        Placeholder for loading or initializing a sequence model.
-        In future versions, this will dynamically import and build the model.
+        Create an unfitted sequence model. "esn" (echo state network) takes
+        hidden_dim, spectral_radius, leak, density, ridge, washout, seed.
         """
+        from orchestrAIframework.strings.sequence import make_model
+
+        self.model = make_model(model_type, **kwargs)
         self.model_type = model_type
         self.config = kwargs
+        self.stream = None
         log_message("info", f"[Strings] Model '{model_type}' configured with {kwargs}")
 
-    def fit(self, X, y=None) -> None:
-        """Train or fine-tune the sequence model."""
+    # --- Length bucketing (see strings/batching.py) ---
+    def configure_batching(self, batch_size: int = 64, max_tokens: Optional[int] = None, num_buckets: int = 8, **kwargs) -> Any:
+        """
+        Bucket variable-length sequences by length so batches are padded to their
+        own longest member. ``kwargs``: boundaries, multiple, shuffle, seed.
+        """
+        from orchestrAIframework.strings.batching import BucketBatcher
+
+        self.batcher = BucketBatcher(batch_size=batch_size, max_tokens=max_tokens, num_buckets=num_buckets, **kwargs)
+        log_message("info", f"[Strings] Batching: batch_size={batch_size}, max_tokens={max_tokens}, buckets={num_buckets}.")
+        return self.batcher
+
+    def _batcher(self) -> Any:
+        if self.batcher is None:
+            self.configure_batching()
+        return self.batcher
+
+    def fit(self, X: Sequence[Any], y: Sequence[Any]) -> None:
+        """
+        Train on a list of sequences ``X`` ((T_i,) or (T_i, F)) with per-step
+        targets ``y`` ((T_i,) or (T_i, O)), batched by length.
+        """
         if not self.model:
             log_message("warning", "[Strings] No model loaded. Use load_model() first.")
             return
+        from orchestrAIframework.strings.batching import pad_sequences
 
-        # Placeholder for training routine
-        log_message("info", f"[Strings] Training model '{self.model_type}' ...")
+        batcher = self._batcher()
+        batches = (
+            (batch.data, batch.mask, pad_sequences([y[i] for i in batch.indices], batch.mask.shape[1]).data)
+            for batch in batcher.batches(X)
+        )
+        log_message("info", f"[Strings] Training model '{self.model_type}' on {len(X)} sequences ...")
+        self.model.fit_batches(batches)
+        log_message("info", f"[Strings] Fitted '{self.model_type}' (padding efficiency {batcher.efficiency:.1%}).")
 
-    def predict(self, X) -> Any:
-        """Generate predictions or sequences."""
-        if not self.model:
-            log_message("warning", "[Strings] No model loaded.")
+    def predict(self, X: Any) -> Any:
+        """
+        Per-step outputs for a list of variable-length sequences, returned in
+        input order as (T_i, O) arrays. A single NumPy sequence gets one array back.
+        """
+        if not self.model or not self.model.fitted:
+            log_message("warning", "[Strings] No fitted model. Use load_model() and fit() first.")
             return None
+        from orchestrAIframework.strings.batching import unbatch
+
+        single = getattr(X, "ndim", 0) in (1, 2)  # one NumPy sequence rather than a list of them
+        sequences = [X] if single else X
+        batches = list(self._batcher().batches(sequences))
+        outputs = [self.model.forward(batch.data, batch.mask)[0] for batch in batches]
+        preds = unbatch(batches, outputs, len(sequences))
+        if log_enabled("info"):
+            log_message("info", f"[Strings] Predicted {len(sequences)} sequences with '{self.model_type}' in {len(batches)} batches.")
+        return preds[0] if single else preds
+
+    # --- Streaming (see strings/sequence.py) ---
+    def open_stream(self, window: int, hop: Optional[int] = None, num_streams: int = 1) -> Any:
+        """Start stateful sliding-window inference; feed it with push()."""
+        from orchestrAIframework.strings.sequence import SlidingWindowStream
+
+        if not self.model or not self.model.fitted:
+            raise RuntimeError("No fitted model. Use load_model() and fit() first.")
+        self.stream = SlidingWindowStream(self.model, window, hop, num_streams)
+        log_message("info", f"[Strings] Stream opened: window={window}, hop={self.stream.hop}, streams={num_streams}.")
+        return self.stream
 
-        log_message("info", f"[Strings] Predicting using '{self.model_type}' model.")
-        # Placeholder output
-        return ["output_sequence"]
+    def push(self, values: Any) -> Any:
+        """Feed new steps to the open stream; returns the (W, N, window, O) windows completed."""
+        if self.stream is None:
+            raise RuntimeError("No stream. Use open_stream() first.")
+        windows = self.stream.push(values)
+        if log_enabled("debug"):
+            log_message("debug", f"[Strings] Stream at step {self.stream.steps}: {len(windows)} window(s) emitted.")
+        return windows
 
     def perform(self, score: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -61,7 +127,8 @@ class Strings:
         """
         log_message("info", f"[Strings] Performing sequence task...")
         if score:
-            log_message("info", f"[Strings] Received score: {score}")
+            if log_enabled("info"):
+                log_message("info", f"[Strings] Received score: {score}")
         else:
             log_message("info", f"[Strings] No score provided.")
         log_message("success", f"[Strings] Section '{self.name}' completed performance.")
@@ -0,0 +1,149 @@
+# orchestrAIframework/woodwinds/embedding.py
+"""
+OrchestrAIFramework - Woodwinds Embedding Engine
+------------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Deterministic, cached, batched text embeddings.
+
+- EmbeddingBackend is the plug-in point for real models: it turns a batch of
+  texts into a (n, dim) float32 matrix.
+- HashingEmbedder is a dependency-free backend using signed feature hashing
+  of word unigrams and bigrams. Hashes come from BLAKE2b, not Python's salted
+  ``hash()``, so the same text maps to the same vector in every process.
+- EmbeddingEngine wraps any backend with an LRU cache keyed by a stable
+  content hash. Only unseen texts reach the backend, deduplicated and
+  chunked into batches, and results are written into one contiguous float32
+  matrix.
+"""
+
+import hashlib
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def content_key(text: str) -> bytes:
+    """Stable 128-bit content hash used as the cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class EmbeddingBackend(ABC):
+    """Turns a batch of texts into a float32 matrix of shape (len(texts), dim)."""
+
+    dim: int
+    name: str = "backend"
+
+    @abstractmethod
+    def encode_batch(self, texts: Sequence[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class HashingEmbedder(EmbeddingBackend):
+    """Signed feature hashing of word unigrams and bigrams, L2-normalized."""
+
+    name = "hashing"
+
+    def __init__(self, dim: int = 256, seed: int = 0, bigrams: bool = True, feature_cache_size: int = 500_000):
+        self.dim = int(dim)
+        self.seed = int(seed)
+        self.bigrams = bigrams
+        self.feature_cache_size = feature_cache_size
+        self._key = self.seed.to_bytes(8, "little", signed=False)
+        self._features: Dict[str, Tuple[int, float]] = {}
+
+    def _slot(self, feature: str) -> Tuple[int, float]:
+        slot = self._features.get(feature)
+        if slot is None:
+            h = int.from_bytes(
+                hashlib.blake2b(feature.encode("utf-8"), digest_size=8, key=self._key).digest(), "little"
+            )
+            slot = (h % self.dim, 1.0 if (h >> 63) & 1 else -1.0)
+            if len(self._features) >= self.feature_cache_size:
+                self._features.clear()
+            self._features[feature] = slot
+        return slot
+
+    def encode_batch(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[int] = []
+        cols: List[int] = []
+        signs: List[float] = []
+        slot = self._slot
+        for row, text in enumerate(texts):
+            words = WORD.findall(text.lower())
+            features = words + [f"{a} {b}" for a, b in zip(words, words[1:])] if self.bigrams else words
+            for feature in features:
+                col, sign = slot(feature)
+                rows.append(row)
+                cols.append(col)
+                signs.append(sign)
+
+        n = len(texts)
+        flat = np.asarray(rows, dtype=np.int64) * self.dim + np.asarray(cols, dtype=np.int64)
+        out = np.bincount(flat, weights=np.asarray(signs), minlength=n * self.dim)
+        out = out.reshape(n, self.dim).astype(np.float32)
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        np.divide(out, norms, out=out, where=norms > 0)
+        return out
+
+
+class EmbeddingEngine:
+    """Batching + LRU caching layer shared by every embedding backend."""
+
+    def __init__(self, backend: EmbeddingBackend, cache_size: int = 100_000, batch_size: int = 1024):
+        self.backend = backend
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def dim(self) -> int:
+        return self.backend.dim
+
+    def embed(self, texts: Union[str, Sequence[str]]) -> np.ndarray:
+        """Return a C-contiguous float32 matrix with one row per text."""
+        if isinstance(texts, str):
+            texts = [texts]
+        keys = [content_key(t) for t in texts]
+        out = np.empty((len(texts), self.dim), dtype=np.float32)
+
+        missing: "OrderedDict[bytes, List[int]]" = OrderedDict()
+        with self._lock:
+            for row, key in enumerate(keys):
+                vec = self._cache.get(key)
+                if vec is not None:
+                    self._cache.move_to_end(key)
+                    out[row] = vec
+                    self.hits += 1
+                else:
+                    missing.setdefault(key, []).append(row)
+            self.misses += len(missing)
+
+        if missing:
+            pending = list(missing.items())
+            for start in range(0, len(pending), self.batch_size):
+                chunk = pending[start:start + self.batch_size]
+                vectors = np.asarray(
+                    self.backend.encode_batch([texts[rows[0]] for _, rows in chunk]), dtype=np.float32
+                )
+                with self._lock:
+                    for (key, rows), vec in zip(chunk, vectors):
+                        out[rows] = vec
+                        self._cache[key] = vec.copy()
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,380 @@
+# orchestrAIframework/woodwinds/lexical.py
+"""
+OrchestrAIFramework - Woodwinds Lexical Index
+---------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+Incremental BM25 inverted index for exact-term retrieval.
+
+- Documents are analyzed into terms (tokenizer ids or lowercase words) and
+  given internal ordinals in insertion order, so every posting list is sorted.
+- The base segment stores all postings in flat arrays. Doc ordinals are
+  delta-encoded in blocks of ``BLOCK`` postings, and each block keeps its
+  absolute first doc as a skip pointer. Deltas and term frequencies use the
+  smallest unsigned dtype that fits.
+- New documents go to a small pending segment. Deletes set a tombstone.
+  Once enough postings are pending, or enough documents are deleted,
+  ``merge`` folds both into a new base. This uses array operations only
+  and never re-analyzes text.
+- Top-k scoring is term-at-a-time with MaxScore pruning, a WAND-family
+  early-termination method. Terms are visited by decreasing score upper
+  bound. Once the remaining bound cannot beat the current k-th score, the
+  rest of the terms only score the surviving candidates. Those are looked
+  up through the skip pointers instead of decoding whole lists.
+
+Document frequencies count live documents only. While tombstones are
+pending, a query term's df is recounted from its postings, and the count
+is cached until the next add or delete. Without tombstones it is the plain
+posting count.
+"""
+
+import re
+from collections import Counter
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BLOCK = 128
+WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def word_terms(text: str) -> List[str]:
+    """Default analyzer: lowercase word tokens."""
+    return WORD.findall(text.lower())
+
+
+def _compact_dtype(values: np.ndarray) -> np.dtype:
+    top = int(values.max()) if values.size else 0
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if top <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def _ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Concatenation of ``arange(start, stop)`` for every pair, without a Python loop."""
+    lengths = stops - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+    return np.arange(total, dtype=np.int64) + offsets
+
+
+class PostingsSegment:
+    """Immutable, block delta-encoded postings for terms ``0 .. n_terms - 1``."""
+
+    def __init__(self, terms: np.ndarray, docs: np.ndarray, tfs: np.ndarray, n_terms: int):
+        """``terms``/``docs``/``tfs`` are flat postings sorted by (term, doc)."""
+        self.n_terms = n_terms
+        counts = np.bincount(terms, minlength=n_terms).astype(np.int64)
+        self.term_offsets = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.term_offsets[1:])
+
+        position = np.arange(docs.size, dtype=np.int64) - self.term_offsets[terms]
+        starts = position % BLOCK == 0
+        deltas = np.diff(docs, prepend=0)
+        deltas[starts] = 0
+        self.block_first = docs[starts].astype(np.int64)
+        self.block_offsets = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum((counts + BLOCK - 1) // BLOCK, out=self.block_offsets[1:])
+        self.deltas = deltas.astype(_compact_dtype(deltas))
+        self.tfs = tfs.astype(_compact_dtype(tfs))
+
+        self.max_tf = np.zeros(n_terms, dtype=np.int64)
+        nonempty = counts > 0
+        if nonempty.any():
+            self.max_tf[nonempty] = np.maximum.reduceat(tfs.astype(np.int64), self.term_offsets[:-1][nonempty])
+
+    @classmethod
+    def empty(cls) -> "PostingsSegment":
+        none = np.empty(0, dtype=np.int64)
+        return cls(none, none, none, 0)
+
+    def count(self, term: int) -> int:
+        if term >= self.n_terms:
+            return 0
+        return int(self.term_offsets[term + 1] - self.term_offsets[term])
+
+    def _decode(self, term: int, blocks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Absolute docs and tfs of the given term-relative block numbers."""
+        lo, hi = self.term_offsets[term], self.term_offsets[term + 1]
+        starts = lo + blocks * BLOCK
+        stops = np.minimum(starts + BLOCK, hi)
+        idx = _ranges(starts, stops)
+        sizes = stops - starts
+        running = np.cumsum(self.deltas[idx], dtype=np.int64)
+        block_base = np.concatenate([[0], running[np.cumsum(sizes)[:-1] - 1]]) if sizes.size else running[:0]
+        first = self.block_first[self.block_offsets[term] + blocks]
+        docs = running - np.repeat(block_base, sizes) + np.repeat(first, sizes)
+        return docs, self.tfs[idx].astype(np.int64)
+
+    def postings(self, term: int) -> Tuple[np.ndarray, np.ndarray]:
+        n = self.count(term)
+        if n == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return self._decode(term, np.arange((n + BLOCK - 1) // BLOCK, dtype=np.int64))
+
+    def lookup(self, term: int, docs: np.ndarray) -> np.ndarray:
+        """Term frequency of each (sorted) doc in ``docs``; 0 where absent. Decodes only the touched blocks."""
+        out = np.zeros(docs.size, dtype=np.int64)
+        if self.count(term) == 0 or docs.size == 0:
+            return out
+        firsts = self.block_first[self.block_offsets[term]:self.block_offsets[term + 1]]
+        blocks = np.unique(np.searchsorted(firsts, docs, side="right") - 1)
+        blocks = blocks[blocks >= 0]
+        found_docs, found_tfs = self._decode(term, blocks)
+        pos = np.searchsorted(found_docs, docs)
+        pos_ok = np.minimum(pos, max(found_docs.size - 1, 0))
+        hit = (pos < found_docs.size) & (found_docs[pos_ok] == docs) if found_docs.size else np.zeros(docs.size, bool)
+        out[hit] = found_tfs[pos_ok[hit]]
+        return out
+
+    def flatten(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """All postings as flat (terms, docs, tfs) arrays."""
+        counts = np.diff(self.term_offsets)
+        block_term = np.repeat(np.arange(self.n_terms), np.diff(self.block_offsets))
+        block_rank = np.arange(self.block_first.size) - self.block_offsets[block_term]
+        sizes = np.minimum(BLOCK, counts[block_term] - BLOCK * block_rank)
+        running = np.cumsum(self.deltas, dtype=np.int64)
+        block_base = np.concatenate([[0], running[np.cumsum(sizes)[:-1] - 1]]) if sizes.size else running[:0]
+        docs = running - np.repeat(block_base, sizes) + np.repeat(self.block_first, sizes)
+        terms = np.repeat(np.arange(self.n_terms, dtype=np.int64), counts)
+        return terms, docs, self.tfs.astype(np.int64)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (self.term_offsets, self.block_first, self.block_offsets, self.deltas, self.tfs))
+
+
+class BM25Index:
+    """Incremental BM25 index with add/delete, array-only merges and pruned top-k."""
+
+    def __init__(
+        self,
+        analyzer: Optional[Callable[[str], Sequence[Hashable]]] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        merge_postings: int = 1 << 18,
+        merge_deleted: float = 0.25,
+    ):
+        self.analyzer = analyzer or word_terms
+        self.k1 = k1
+        self.b = b
+        self.merge_postings = merge_postings
+        self.merge_deleted = merge_deleted
+
+        self.terms: Dict[Hashable, int] = {}
+        self.base = PostingsSegment.empty()
+        self._pending: Dict[int, Tuple[List[int], List[int]]] = {}
+        self._pending_count = 0
+
+        # Per-ordinal document data; ordinals are reassigned on merge.
+        self.doc_ids = np.empty(0, dtype=np.int64)
+        self.doc_len = np.empty(0, dtype=np.int64)
+        self.live = np.empty(0, dtype=bool)
+        self._ordinal: Dict[int, int] = {}
+        self._total_len = 0
+        self._df: Dict[int, int] = {}  # live df per term while tombstones are pending
+
+    def __len__(self) -> int:
+        return len(self._ordinal)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return int(doc_id) in self._ordinal
+
+    # --- Updates ---
+    def add(self, ids: Sequence[int], texts: Sequence[str]) -> None:
+        """Index ``texts`` under external ``ids``; re-adding an id replaces the old document."""
+        if len(ids) != len(texts):
+            raise ValueError("ids and texts must have the same length.")
+        self.delete([i for i in ids if int(i) in self._ordinal])
+
+        first = self.doc_ids.size
+        lengths = np.empty(len(texts), dtype=np.int64)
+        terms, pending = self.terms, self._pending
+        for offset, text in enumerate(texts):
+            tokens = self.analyzer(text)
+            lengths[offset] = len(tokens)
+            ordinal = first + offset
+            for term, tf in Counter(tokens).items():
+                tid = terms.setdefault(term, len(terms))
+                slot = pending.get(tid)
+                if slot is None:
+                    slot = pending[tid] = ([], [])
+                slot[0].append(ordinal)
+                slot[1].append(tf)
+                self._pending_count += 1
+
+        ids = np.asarray(ids, dtype=np.int64)
+        self._ordinal.update(zip(ids.tolist(), range(first, first + ids.size)))
+        self.doc_ids = np.concatenate([self.doc_ids, ids])
+        self.doc_len = np.concatenate([self.doc_len, lengths])
+        self.live = np.concatenate([self.live, np.ones(ids.size, dtype=bool)])
+        self._total_len += int(lengths.sum())
+        self._df.clear()
+        if self._pending_count >= self.merge_postings:
+            self.merge()
+
+    def delete(self, ids: Sequence[int]) -> int:
+        """Tombstone documents by external id. Returns how many were removed."""
+        removed = 0
+        for doc_id in ids:
+            ordinal = self._ordinal.pop(int(doc_id), None)
+            if ordinal is not None:
+                self.live[ordinal] = False
+                self._total_len -= int(self.doc_len[ordinal])
+                removed += 1
+        if removed:
+            self._df.clear()
+        dead = self.live.size - len(self._ordinal)
+        if removed and dead > self.merge_deleted * max(self.live.size, 1):
+            self.merge()
+        return removed
+
+    def merge(self) -> None:
+        """Fold pending postings into the base and drop deleted documents (no re-analysis)."""
+        base_terms, base_docs, base_tfs = self.base.flatten()
+        if self._pending:
+            pend_terms = np.concatenate([np.full(len(d), t, dtype=np.int64) for t, (d, _) in self._pending.items()])
+            pend_docs = np.concatenate([np.asarray(d, dtype=np.int64) for d, _ in self._pending.values()])
+            pend_tfs = np.concatenate([np.asarray(f, dtype=np.int64) for _, f in self._pending.values()])
+        else:
+            pend_terms = pend_docs = pend_tfs = np.empty(0, dtype=np.int64)
+        terms = np.concatenate([base_terms, pend_terms])
+        docs = np.concatenate([base_docs, pend_docs])
+        tfs = np.concatenate([base_tfs, pend_tfs])
+
+        keep = self.live[docs]
+        remap = np.cumsum(self.live) - 1
+        terms, docs, tfs = terms[keep], remap[docs[keep]], tfs[keep]
+        order = np.lexsort((docs, terms))
+        self.base = PostingsSegment(terms[order], docs[order], tfs[order], len(self.terms))
+        self._pending, self._pending_count = {}, 0
+
+        self.doc_ids = self.doc_ids[self.live]
+        self.doc_len = self.doc_len[self.live]
+        self.live = np.ones(self.doc_ids.size, dtype=bool)
+        self._ordinal = dict(zip(self.doc_ids.tolist(), range(self.doc_ids.size)))
+        self._df.clear()
+
+    # --- Scoring ---
+    def _doc_freq(self, tid: int) -> int:
+        """Live documents containing ``tid``."""
+        pending = self._pending.get(tid)
+        if len(self._ordinal) == self.live.size:  # no tombstones: every posting is live
+            return self.base.count(tid) + (len(pending[0]) if pending else 0)
+        df = self._df.get(tid)
+        if df is None:
+            docs, _ = self._postings(tid)
+            df = self._df[tid] = int(np.count_nonzero(self.live[docs]))
+        return df
+
+    def _postings(self, tid: int) -> Tuple[np.ndarray, np.ndarray]:
+        docs, tfs = self.base.postings(tid)
+        pending = self._pending.get(tid)
+        if pending is not None:
+            docs = np.concatenate([docs, np.asarray(pending[0], dtype=np.int64)])
+            tfs = np.concatenate([tfs, np.asarray(pending[1], dtype=np.int64)])
+        return docs, tfs
+
+    def _lookup(self, tid: int, docs: np.ndarray) -> np.ndarray:
+        tfs = self.base.lookup(tid, docs)
+        pending = self._pending.get(tid)
+        if pending is not None:
+            p_docs = np.asarray(pending[0], dtype=np.int64)
+            pos = np.minimum(np.searchsorted(p_docs, docs), p_docs.size - 1)
+            hit = p_docs[pos] == docs
+            tfs[hit] = np.asarray(pending[1], dtype=np.int64)[pos[hit]]
+        return tfs
+
+    def _bm25(self, tfs: np.ndarray, docs: np.ndarray, idf: float, avgdl: float) -> np.ndarray:
+        tfs = tfs.astype(np.float64)
+        norm = self.k1 * (1.0 - self.b + self.b * self.doc_len[docs] / avgdl)
+        return idf * tfs * (self.k1 + 1.0) / (tfs + norm)
+
+    def search(self, query: str, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k ``(scores, ids)`` by BM25, best first (may be shorter than k)."""
+        n_live = len(self._ordinal)
+        query_terms = Counter(t for t in (self.terms.get(term) for term in self.analyzer(query)) if t is not None)
+        if n_live == 0 or not query_terms or k <= 0:
+            return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+        avgdl = max(self._total_len / n_live, 1e-9)
+
+        plan = []
+        for tid, qtf in query_terms.items():
+            pending = self._pending.get(tid)
+            df = self._doc_freq(tid)
+            if df == 0:
+                continue
+            idf = qtf * float(np.log1p((n_live - df + 0.5) / (df + 0.5)))
+            max_tf = max(int(self.base.max_tf[tid]) if tid < self.base.n_terms else 0,
+                         max(pending[1]) if pending else 0)
+            bound = idf * max_tf * (self.k1 + 1.0) / (max_tf + self.k1 * (1.0 - self.b))
+            plan.append((bound, tid, idf))
+        plan.sort(reverse=True)
+        remaining = np.cumsum([p[0] for p in plan][::-1])[::-1].tolist() + [0.0]
+
+        cand_docs = np.empty(0, dtype=np.int64)
+        cand_scores = np.empty(0, dtype=np.float64)
+        threshold = -np.inf
+        for step, (_, tid, idf) in enumerate(plan):
+            if cand_docs.size >= k and remaining[step] <= threshold:
+                # No unseen document can still reach the top k: only rescore survivors.
+                alive = cand_scores + remaining[step] > threshold
+                cand_docs, cand_scores = cand_docs[alive], cand_scores[alive]
+                tfs = self._lookup(tid, cand_docs)
+                hit = tfs > 0
+                cand_scores[hit] += self._bm25(tfs[hit], cand_docs[hit], idf, avgdl)
+            else:
+                docs, tfs = self._postings(tid)
+                alive = self.live[docs]
+                docs, scores = docs[alive], self._bm25(tfs[alive], docs[alive], idf, avgdl)
+                merged, inverse = np.unique(np.concatenate([cand_docs, docs]), return_inverse=True)
+                cand_scores = np.bincount(inverse, weights=np.concatenate([cand_scores, scores]), minlength=merged.size)
+                cand_docs = merged
+            if cand_docs.size >= k:
+                threshold = float(np.partition(cand_scores, cand_scores.size - k)[cand_scores.size - k])
+
+        if cand_docs.size > k:
+            top = np.argpartition(-cand_scores, k - 1)[:k]
+            cand_docs, cand_scores = cand_docs[top], cand_scores[top]
+        order = np.argsort(-cand_scores, kind="stable")
+        return cand_scores[order], self.doc_ids[cand_docs[order]]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by postings and per-document arrays."""
+        return self.base.nbytes + 16 * self._pending_count + self.doc_ids.nbytes + self.doc_len.nbytes
+
+
+def fuse_scores(
+    results: Sequence[Tuple[np.ndarray, np.ndarray]], weights: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted sum of min-max normalized scores over the union of result lists.
+    A document missing from one list contributes 0 for it; an id repeated within
+    one list counts once, at its best score. Returns ``(scores, ids)``, best first.
+    """
+    deduped = []
+    for scores, ids in results:
+        scores, ids = np.asarray(scores, dtype=np.float64), np.asarray(ids, dtype=np.int64)
+        order = np.argsort(-scores, kind="stable")
+        _, first = np.unique(ids[order], return_index=True)
+        keep = order[np.sort(first)]
+        deduped.append((scores[keep], ids[keep]))
+    results = deduped
+    all_ids = [ids for _, ids in results]
+    union, inverse = np.unique(np.concatenate(all_ids), return_inverse=True)
+    fused = np.zeros(union.size, dtype=np.float64)
+    start = 0
+    for (scores, ids), weight in zip(results, weights):
+        scores = np.asarray(scores, dtype=np.float64)
+        if scores.size:
+            span = scores.max() - scores.min()
+            norm = (scores - scores.min()) / span if span > 0 else np.ones_like(scores)
+            np.add.at(fused, inverse[start:start + scores.size], weight * norm)
+        start += scores.size
+    order = np.argsort(-fused, kind="stable")
+    return fused[order], union[order]
@@ -0,0 +1,277 @@
+# orchestrAIframework/woodwinds/tokenizer.py
+"""
+OrchestrAIFramework - Woodwinds Subword Tokenizer
+-------------------------------------------------
+Author: Marcos Paulo Pazzinatto
+License: MIT
+
+A vocabulary-backed byte-pair-encoding (BPE) tokenizer built for throughput.
+
+- Words are split into characters with an end-of-word marker and merged by
+  learned merge rank. Each distinct word is encoded once; later occurrences hit
+  a per-tokenizer merge cache.
+- ``encode_batch`` returns a TokenBatch: every token id in one flat int32
+  buffer, plus an int64 offsets array (document i is ids[offsets[i]:offsets[i+1]]).
+  No nested lists of strings are built.
+- Large batches can be spread across worker processes; each worker receives the
+  tokenizer once through the pool initializer.
+"""
+
+import heapq
+import json
+import re
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from orchestrAIframework.common.paths import get_path
+
+END_OF_WORD = "</w>"
+UNK_TOKEN = "[UNK]"
+PAD_TOKEN = "[PAD]"
+SPECIAL_TOKENS = (PAD_TOKEN, UNK_TOKEN)
+
+# Words and individual punctuation marks.
+PRETOKENIZE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+class TokenBatch:
+    """Flat token-id buffer plus document offsets."""
+
+    __slots__ = ("ids", "offsets")
+
+    def __init__(self, ids: np.ndarray, offsets: np.ndarray):
+        self.ids = ids
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return self.offsets.size - 1
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.ids[self.offsets[i]:self.offsets[i + 1]]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @classmethod
+    def concat(cls, batches: Sequence["TokenBatch"]) -> "TokenBatch":
+        if not batches:
+            return cls(np.empty(0, dtype=np.int32), np.zeros(1, dtype=np.int64))
+        ids = np.concatenate([b.ids for b in batches])
+        lengths = np.concatenate([b.lengths for b in batches])
+        offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(ids, offsets)
+
+
+class BPETokenizer:
+    """Byte-pair-encoding tokenizer with a merge cache and array-backed batch output."""
+
+    def __init__(
+        self,
+        vocab: Optional[Dict[str, int]] = None,
+        merges: Optional[Sequence[Tuple[str, str]]] = None,
+        lowercase: bool = True,
+        cache_size: int = 100_000,
+    ):
+        self.vocab: Dict[str, int] = dict(vocab or {tok: i for i, tok in enumerate(SPECIAL_TOKENS)})
+        self.merges: List[Tuple[str, str]] = [tuple(m) for m in (merges or [])]
+        self.ranks: Dict[Tuple[str, str], int] = {pair: i for i, pair in enumerate(self.merges)}
+        self.lowercase = lowercase
+        self.cache_size = cache_size
+        if UNK_TOKEN not in self.vocab:
+            raise ValueError(f"Vocabulary must contain the unknown token '{UNK_TOKEN}'.")
+        self.unk_id = self.vocab[UNK_TOKEN]
+        self.inverse: List[str] = [""] * len(self.vocab)
+        for tok, idx in self.vocab.items():
+            self.inverse[idx] = tok
+        self._cache: Dict[str, Tuple[int, ...]] = {}
+
+    # --- Training ---
+    @classmethod
+    def train(
+        cls,
+        texts: Iterable[str],
+        vocab_size: int = 8000,
+        min_frequency: int = 2,
+        lowercase: bool = True,
+    ) -> "BPETokenizer":
+        """Learn merges from a corpus until ``vocab_size`` tokens or no pair reaches ``min_frequency``."""
+        counts: Counter = Counter()
+        for text in texts:
+            counts.update(PRETOKENIZE.findall(text.lower() if lowercase else text))
+
+        words: List[List[str]] = []
+        freqs: List[int] = []
+        for word, freq in counts.items():
+            words.append(list(word[:-1]) + [word[-1] + END_OF_WORD])
+            freqs.append(freq)
+
+        vocab: Dict[str, int] = {tok: i for i, tok in enumerate(SPECIAL_TOKENS)}
+        for symbols in words:
+            for sym in symbols:
+                vocab.setdefault(sym, len(vocab))
+
+        # Pair statistics with an index from pair to the words containing it.
+        pair_counts: Counter = Counter()
+        where: Dict[Tuple[str, str], set] = {}
+        for wi, symbols in enumerate(words):
+            for pair in zip(symbols, symbols[1:]):
+                pair_counts[pair] += freqs[wi]
+                where.setdefault(pair, set()).add(wi)
+
+        # Max-heap of (count, pair) with lazy invalidation of stale counts.
+        heap = [(-count, pair) for pair, count in pair_counts.items()]
+        heapq.heapify(heap)
+
+        merges: List[Tuple[str, str]] = []
+        while len(vocab) < vocab_size and heap:
+            neg, pair = heapq.heappop(heap)
+            if pair_counts.get(pair, 0) != -neg:
+                continue
+            if -neg < min_frequency:
+                break
+            merged = pair[0] + pair[1]
+            merges.append(pair)
+            vocab.setdefault(merged, len(vocab))
+
+            touched = set()
+            for wi in list(where.get(pair, ())):
+                symbols = words[wi]
+                for old in zip(symbols, symbols[1:]):
+                    pair_counts[old] -= freqs[wi]
+                    if pair_counts[old] <= 0:
+                        del pair_counts[old]
+                    where.get(old, set()).discard(wi)
+                    touched.add(old)
+                out, i = [], 0
+                while i < len(symbols):
+                    if i < len(symbols) - 1 and symbols[i] == pair[0] and symbols[i + 1] == pair[1]:
+                        out.append(merged)
+                        i += 2
+                    else:
+                        out.append(symbols[i])
+                        i += 1
+                words[wi] = out
+                for new in zip(out, out[1:]):
+                    pair_counts[new] += freqs[wi]
+                    where.setdefault(new, set()).add(wi)
+                    touched.add(new)
+            where.pop(pair, None)
+            pair_counts.pop(pair, None)
+            for changed in touched:
+                if changed in pair_counts:
+                    heapq.heappush(heap, (-pair_counts[changed], changed))
+
+        return cls(vocab, merges, lowercase=lowercase)
+
+    # --- Encoding ---
+    def _encode_word(self, word: str) -> Tuple[int, ...]:
+        cached = self._cache.get(word)
+        if cached is not None:
+            return cached
+
+        symbols = list(word[:-1]) + [word[-1] + END_OF_WORD]
+        ranks = self.ranks
+        while len(symbols) > 1:
+            best, best_rank = -1, None
+            for i in range(len(symbols) - 1):
+                rank = ranks.get((symbols[i], symbols[i + 1]))
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best, best_rank = i, rank
+            if best < 0:
+                break
+            symbols[best:best + 2] = [symbols[best] + symbols[best + 1]]
+
+        vocab, unk = self.vocab, self.unk_id
+        ids = tuple(vocab.get(sym, unk) for sym in symbols)
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()  # cheap bound; hot words repopulate immediately
+        self._cache[word] = ids
+        return ids
+
+    def _words(self, text: str) -> List[str]:
+        return PRETOKENIZE.findall(text.lower() if self.lowercase else text)
+
+    def encode(self, text: str) -> List[int]:
+        out: List[int] = []
+        for word in self._words(text):
+            out.extend(self._encode_word(word))
+        return out
+
+    def tokenize(self, text: str) -> List[str]:
+        inverse = self.inverse
+        return [inverse[i] for i in self.encode(text)]
+
+    def decode(self, ids: Iterable[int]) -> str:
+        text = "".join(self.inverse[int(i)] for i in ids)
+        return text.replace(END_OF_WORD, " ").strip()
+
+    def _encode_chunk(self, texts: Sequence[str]) -> TokenBatch:
+        ids = array("i")
+        offsets = array("q", [0])
+        encode_word, words = self._encode_word, self._words
+        for text in texts:
+            for word in words(text):
+                ids.extend(encode_word(word))
+            offsets.append(len(ids))
+        return TokenBatch(np.frombuffer(ids, dtype=np.int32).copy(), np.frombuffer(offsets, dtype=np.int64).copy())
+
+    def encode_batch(self, texts: Sequence[str], workers: int = 1, chunk_size: int = 2048) -> TokenBatch:
+        """
+        Encode many documents into a TokenBatch. With ``workers > 1`` the batch is
+        split into chunks of ``chunk_size`` documents encoded on a process pool.
+        """
+        if workers <= 1 or len(texts) <= chunk_size:
+            return self._encode_chunk(texts)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as pool:
+            return TokenBatch.concat(list(pool.map(_encode_in_worker, chunks)))
+
+    # --- Persistence ---
+    def to_dict(self) -> Dict[str, object]:
+        return {"lowercase": self.lowercase, "vocab": self.vocab, "merges": [list(m) for m in self.merges]}
+
+    def save(self, name_or_path: Union[str, Path]) -> Path:
+        """Save to ORCH_PATHS['models']/tokenizers/<name>.json (or an explicit .json path)."""
+        path = _tokenizer_path(name_or_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, name_or_path: Union[str, Path]) -> "BPETokenizer":
+        data = json.loads(_tokenizer_path(name_or_path).read_text(encoding="utf-8"))
+        return cls(data["vocab"], [tuple(m) for m in data["merges"]], lowercase=data["lowercase"])
+
+    def __getstate__(self) -> Dict[str, object]:
+        return self.to_dict()  # ship vocab/merges to workers, not the cache
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__init__(state["vocab"], state["merges"], lowercase=state["lowercase"])
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+
+def _tokenizer_path(name_or_path: Union[str, Path]) -> Path:
+    if str(name_or_path).endswith(".json"):
+        return Path(name_or_path)
+    return get_path("models") / "tokenizers" / f"{name_or_path}.json"
+
+
+_worker_tokenizer: Optional[BPETokenizer] = None
+
+
+def _init_worker(tokenizer: BPETokenizer) -> None:
+    global _worker_tokenizer
+    _worker_tokenizer = tokenizer
+
+
+def _encode_in_worker(texts: Sequence[str]) -> TokenBatch:
+    return _worker_tokenizer._encode_chunk(texts)
@@ -11,8 +11,10 @@ tokenization, embeddings, lightweight NLP analysis, and RAG adapters.
 This is a minimal, extensible scaffold that plugs into the Conductor.
 """
 
-from typing import Any, Dict, List, Optional, Union
-from orchestrAIframework.common.logging import log_message
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from orchestrAIframework.common.logging import log_enabled, log_message
+
+RETRIEVAL_MODES = ("vector", "lexical", "hybrid")
 
 
 class Woodwinds:
@@ -20,15 +22,23 @@ class Woodwinds:
     Base class for language & semantic processing.
 
     Pipeline modes (planned/extensible):
-      - "tokenizer": basic tokenization utilities
-      - "embedding": text to vector interface
-      - "rag": retrieval-augmented generation adapter (stubs for now)
+      - "tokenizer": whitespace or BPE subword tokenization (batch, array-backed)
+      - "embedding": deterministic, cached, batched text-to-vector engine
+      - "rag": retrieval-augmented generation adapter (vector, BM25 or hybrid
+        retrieval; generation stub)
     """
 
     def __init__(self, name: str = "Woodwinds"):
         self.name = name
         self.mode: str = "tokenizer"
         self.pipeline: Optional[Any] = None
+        self.tokenizer: Optional[Any] = None  # BPETokenizer once trained/loaded
+        self.embedder: Optional[Any] = None  # EmbeddingEngine, built on first embed
+        self._default_embedder = False  # embedder is the HashingEmbedder built from config
+        self.index: Optional[Any] = None  # VectorIndex serving retrieve()
+        self.lexical: Optional[Any] = None  # BM25Index serving lexical/hybrid retrieve()
+        self.documents: Dict[int, str] = {}
+        self.generator: Optional[Any] = None  # GenerationScheduler used by generate()/stream()
         self.config: Dict[str, Any] = {}
         log_message("info", f"[Woodwinds] Initialized section: {self.name}")
 
@@ -45,32 +55,88 @@ class Woodwinds:
 
         self.mode = mode
         self.config = kwargs
+        if self._default_embedder:  # rebuilt from the new config on next embed; explicit backends are kept
+            self.embedder, self._default_embedder = None, False
         # self.pipeline = ...  # Plug real implementation here later.
         log_message("info", f"[Woodwinds] Pipeline set to '{self.mode}' with config={kwargs}")
 
-    # --- Tokenization utilities (placeholder) ---
+    # --- Tokenization utilities ---
+    def train_tokenizer(self, texts: Iterable[str], vocab_size: int = 8000, name: Optional[str] = None, **kwargs) -> Any:
+        """
+        Learn a BPE subword tokenizer (see woodwinds/tokenizer.py) and use it for
+        ``tokenize`` / ``tokenize_batch``. With ``name`` it is saved under
+        ORCH_PATHS["models"]/tokenizers.
+        """
+        from orchestrAIframework.woodwinds.tokenizer import BPETokenizer
+
+        self.tokenizer = BPETokenizer.train(texts, vocab_size=vocab_size, **kwargs)
+        log_message("info", f"[Woodwinds] Trained tokenizer with {len(self.tokenizer)} tokens.")
+        if name is not None:
+            path = self.tokenizer.save(name)
+            log_message("info", f"[Woodwinds] Saved tokenizer to {path}.")
+        return self.tokenizer
+
+    def load_tokenizer(self, name: str) -> Any:
+        from orchestrAIframework.woodwinds.tokenizer import BPETokenizer
+
+        self.tokenizer = BPETokenizer.load(name)
+        log_message("info", f"[Woodwinds] Loaded tokenizer '{name}' ({len(self.tokenizer)} tokens).")
+        return self.tokenizer
+
     def tokenize(self, text: str) -> List[str]:
         if not isinstance(text, str):
             log_message("warning", "[Woodwinds] tokenize() received non-string input.")
             return []
-        tokens = text.strip().split()
-        log_message("info", f"[Woodwinds] Tokenized into {len(tokens)} tokens.")
+        tokens = self.tokenizer.tokenize(text) if self.tokenizer is not None else text.strip().split()
+        if log_enabled("info"):
+            log_message("info", f"[Woodwinds] Tokenized into {len(tokens)} tokens.")
         return tokens
 
-    # --- Embedding interface (placeholder) ---
-    def embed(self, texts: Union[str, List[str]]) -> List[List[float]]:
+    def tokenize_batch(self, texts: Sequence[str], workers: int = 1, chunk_size: int = 2048) -> Any:
         """
-        Return dummy embeddings with fixed size to keep interfaces stable.
-        Replace with real model embeddings (e.g., sentence-transformers) later.
+        Encode many documents with the subword tokenizer into a TokenBatch: a flat
+        int32 ``ids`` buffer plus an ``offsets`` array. ``workers > 1`` spreads the
+        batch over worker processes.
         """
-        if isinstance(texts, str):
-            texts = [texts]
+        if self.tokenizer is None:
+            raise RuntimeError("No subword tokenizer loaded. Use train_tokenizer() or load_tokenizer() first.")
+        batch = self.tokenizer.encode_batch(texts, workers=workers, chunk_size=chunk_size)
+        if log_enabled("info"):
+            log_message("info", f"[Woodwinds] Tokenized {len(batch)} docs into {batch.ids.size} tokens.")
+        return batch
 
-        dim = int(self.config.get("embedding_dim", 8))
-        vectors = [[(hash(t) % 997) / 997.0 for _ in range(dim)] for t in texts]
-        log_message("info", f"[Woodwinds] Generated {len(vectors)} embedding(s) with dim={dim}.")
+    # --- Embedding interface ---
+    def set_embedding_backend(self, backend: Any, cache_size: int = 100_000, batch_size: int = 1024) -> None:
+        """
+        Plug an EmbeddingBackend (see woodwinds/embedding.py) behind the shared
+        batching and caching layer. By default a deterministic HashingEmbedder of
+        ``config["embedding_dim"]`` dimensions is used.
+        """
+        from orchestrAIframework.woodwinds.embedding import EmbeddingEngine
+
+        self.embedder = EmbeddingEngine(backend, cache_size=cache_size, batch_size=batch_size)
+        self._default_embedder = False
+        log_message("info", f"[Woodwinds] Embedding backend set to '{backend.name}' (dim={backend.dim}).")
+
+    def embed_matrix(self, texts: Union[str, List[str]]) -> Any:
+        """Embed a batch into a contiguous float32 matrix of shape (len(texts), dim)."""
+        if self.embedder is None:
+            from orchestrAIframework.woodwinds.embedding import EmbeddingEngine, HashingEmbedder
+
+            self.embedder = EmbeddingEngine(HashingEmbedder(dim=int(self.config.get("embedding_dim", 8))))
+            self._default_embedder = True
+        vectors = self.embedder.embed(texts)
+        if log_enabled("info"):
+            log_message("info", f"[Woodwinds] Generated {len(vectors)} embedding(s) with dim={vectors.shape[1]}.")
         return vectors
 
+    def embed(self, texts: Union[str, List[str]]) -> List[List[float]]:
+        """
+        List-of-lists view of ``embed_matrix`` kept for interface stability.
+        Prefer ``embed_matrix`` for large batches.
+        """
+        return self.embed_matrix(texts).tolist()
+
     # --- Basic analysis (placeholder) ---
     def analyze(self, text: str) -> Dict[str, Any]:
         tokens = self.tokenize(text)
@@ -78,25 +144,128 @@ class Woodwinds:
             "num_tokens": len(tokens),
             "preview": tokens[:10],
         }
-        log_message("info", f"[Woodwinds] Analysis: {analysis}")
+        if log_enabled("info"):
+            log_message("info", f"[Woodwinds] Analysis: {analysis}")
         return analysis
 
-    # --- RAG adapter stubs (placeholder) ---
-    def retrieve(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+    # --- RAG adapter ---
+    def use_index(self, index: Any) -> None:
+        """Serve ``retrieve`` from an existing VectorIndex (e.g. ``Keyboards.index``)."""
+        self.index = index
+
+    def add_documents(self, texts: Sequence[str], ids: Optional[Sequence[int]] = None) -> Any:
         """
-        Placeholder retrieval: returns empty results.
-        Integrate with vector stores (FAISS/Annoy/ScaNN) via Keyboards later.
+        Embed documents into the vector index and add them to the BM25 index, so
+        ``retrieve`` can serve vector, lexical and hybrid queries. Indexes are
+        created on first use. The BM25 analyzer is the subword tokenizer when one
+        is loaded, else lowercase words.
         """
-        log_message("info", f"[Woodwinds] retrieve() called for query='{query}' (k={k}).")
-        return []
+        from orchestrAIframework.woodwinds.lexical import BM25Index
+
+        texts = list(texts)
+        vectors = self.embed_matrix(texts)
+        if self.index is None:
+            from orchestrAIframework.keyboards.vector_index import VectorIndex
+
+            self.index = VectorIndex(vectors.shape[1])
+        doc_ids = self.index.add(vectors, ids)
+        if self.lexical is None:
+            self.lexical = BM25Index(analyzer=self.tokenizer.encode if self.tokenizer is not None else None)
+        self.lexical.add(doc_ids.tolist(), texts)
+        self.documents.update(zip(doc_ids.tolist(), texts))
+        log_message("info", f"[Woodwinds] Indexed {len(texts)} document(s); index size={len(self.index)}.")
+        return doc_ids
+
+    def delete_documents(self, ids: Sequence[int]) -> int:
+        """Remove documents from retrieval: vectors leave the index, BM25 postings are tombstoned."""
+        removed = self.lexical.delete(ids) if self.lexical is not None else 0
+        if self.index is not None:
+            removed = max(removed, self.index.remove(ids))
+        for doc_id in ids:
+            self.documents.pop(int(doc_id), None)
+        log_message("info", f"[Woodwinds] Deleted {removed} document(s).")
+        return removed
+
+    def _vector_hits(self, query: str, k: int) -> Any:
+        """Top-k ``(scores, ids)`` from the vector index, one hit per id."""
+        import numpy as np
 
-    def generate(self, query: str, context: List[Dict[str, Any]]) -> str:
+        scores, ids = self.index.search(self.embed_matrix([query]), k)
+        scores, ids = scores[0], ids[0]
+        _, first = np.unique(ids, return_index=True)  # hits are sorted best first, so keep the first
+        keep = np.sort(first[ids[first] >= 0])
+        return scores[keep], ids[keep]
+
+    def retrieve(self, query: str, k: int = 5, mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Placeholder generation: echoes query.
-        Hook to LLM/generative backends later.
+        Top-k documents for ``query`` as ``{"id", "score", "text"}`` dicts (text is
+        None for vectors added without it).
+
+        ``mode`` (default ``config["retrieval"]`` or "hybrid") picks "vector", "lexical"
+        (BM25) or "hybrid". Hybrid fetches ``2k`` candidates from each index and
+        fuses their min-max normalized scores, weighting vectors by
+        ``config["hybrid_alpha"]`` (default 0.5). A missing index is skipped, and
+        an empty list is returned when none is attached.
         """
-        log_message("info", f"[Woodwinds] generate() called with {len(context)} context docs.")
-        return f"[Stub] Answer based on query: {query}"
+        mode = mode or self.config.get("retrieval", "hybrid")
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval mode '{mode}'. Choose from {RETRIEVAL_MODES}.")
+        if log_enabled("info"):
+            log_message("info", f"[Woodwinds] retrieve() called for query='{query}' (k={k}, mode={mode}).")
+
+        has_vector = self.index is not None and len(self.index) > 0
+        has_lexical = self.lexical is not None and len(self.lexical) > 0
+        if mode == "hybrid" and not (has_vector and has_lexical):
+            mode = "vector" if has_vector else "lexical"
+        if mode == "vector" and has_vector:
+            scores, ids = self._vector_hits(query, k)
+        elif mode == "lexical" and has_lexical:
+            scores, ids = self.lexical.search(query, k)
+        elif mode == "hybrid":
+            from orchestrAIframework.woodwinds.lexical import fuse_scores
+
+            alpha = float(self.config.get("hybrid_alpha", 0.5))
+            scores, ids = fuse_scores(
+                [self._vector_hits(query, 2 * k), self.lexical.search(query, 2 * k)], [alpha, 1.0 - alpha]
+            )
+            scores, ids = scores[:k], ids[:k]
+        else:
+            return []
+        return [
+            {"id": doc_id, "score": score, "text": self.documents.get(doc_id)}
+            for doc_id, score in zip(ids.tolist(), scores.tolist())
+        ]
+
+    # --- Generation (see harp/generation.py) ---
+    def use_generator(self, scheduler: Any) -> None:
+        """Share a GenerationScheduler (e.g. ``Harp.generator``) so RAG answers batch with other prompts."""
+        self.generator = scheduler
+
+    def _scheduler(self) -> Any:
+        if self.generator is None:
+            from orchestrAIframework.harp.generation import EchoBackend, GenerationScheduler
+
+            self.generator = GenerationScheduler(EchoBackend(), max_batch_size=int(self.config.get("max_batch_size", 32)))
+        return self.generator
+
+    @staticmethod
+    def _prompt(query: str, context: List[Dict[str, Any]]) -> str:
+        passages = [str(doc.get("text") or "") for doc in context]
+        return "\n".join([p for p in passages if p] + [query])
+
+    def stream(self, query: str, context: List[Dict[str, Any]], max_tokens: int = 64) -> Iterator[str]:
+        """Yield answer pieces for ``query`` grounded on retrieved ``context`` as they are decoded."""
+        return self._scheduler().stream(self._prompt(query, context), max_tokens)
+
+    def astream(self, query: str, context: List[Dict[str, Any]], max_tokens: int = 64) -> Any:
+        """Async-iterator variant of ``stream``."""
+        return self._scheduler().astream(self._prompt(query, context), max_tokens)
+
+    def generate(self, query: str, context: List[Dict[str, Any]], max_tokens: int = 64) -> str:
+        """Complete answer; the concatenation of ``stream``."""
+        if log_enabled("info"):
+            log_message("info", f"[Woodwinds] generate() called with {len(context)} context docs.")
+        return "".join(self.stream(query, context, max_tokens))
 
     # --- Orchestral entrypoint ---
     def perform(self, score: Optional[Dict[str, Any]] = None) -> None: